@@ -0,0 +1,129 @@
+import argparse
+import json
+import sys
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import numpy
+
+from tobii_stream_engine import DispersionThresholdDetector, VelocityThresholdDetector
+
+OUTPUT_FREQUENCY = 1200
+BATCH_SIZES = (1, 16, 256)
+
+DETECTORS: dict[str, Callable[[], Any]] = {
+    "ivt": lambda: VelocityThresholdDetector(output_frequency=OUTPUT_FREQUENCY),
+    "idt": lambda: DispersionThresholdDetector(output_frequency=OUTPUT_FREQUENCY),
+}
+
+
+def gaze_points(seconds: float) -> dict[str, Any]:
+    # fixations with noise, linear saccades and invalid stretches for blinks
+    random = numpy.random.default_rng(0)
+    interval_us = 1e6 / OUTPUT_FREQUENCY
+    positions: list[Any] = []
+    validity: list[int] = []
+    position = numpy.array([0.5, 0.5])
+
+    while len(positions) < seconds * OUTPUT_FREQUENCY:
+        fixation = int(random.integers(240, 480))
+        positions.extend(position + random.normal(0, 0.002, (fixation, 2)))
+        validity.extend([1] * fixation)
+
+        if random.random() < 0.15:
+            positions.extend([position] * 180)
+            validity.extend([0] * 180)
+            continue
+
+        target = random.random(2) * 0.8 + 0.1
+        steps = numpy.linspace(0, 1, 36)[:, None]
+        positions.extend(position + (target - position) * steps)
+        validity.extend([1] * 36)
+        position = target
+
+    positions_xy = numpy.array(positions)
+    return {
+        "timestamp_us": (numpy.arange(len(positions)) * interval_us).astype(
+            numpy.int64
+        ),
+        "validity": numpy.array(validity, dtype=numpy.uint8),
+        "x": positions_xy[:, 0].astype(numpy.float32),
+        "y": positions_xy[:, 1].astype(numpy.float32),
+    }
+
+
+def measure(
+    make_detector: Callable[[], Any],
+    columns: dict[str, Any],
+    batch_size: int,
+    repeat: int,
+) -> float:
+    size = len(columns["timestamp_us"])
+    batches = [
+        {name: column[start : start + batch_size] for name, column in columns.items()}
+        for start in range(0, size, batch_size)
+    ]
+
+    best = float("inf")
+    for _ in range(repeat):
+        detector = make_detector()
+        started_at = time.perf_counter_ns()
+        for batch in batches:
+            detector.feed(batch)
+        detector.flush()
+        best = min(best, time.perf_counter_ns() - started_at)
+
+    return size / (best / 1e9)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="measure fixation/saccade detection throughput",
+    )
+    parser.add_argument("--seconds", type=float, default=60.0)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--save", type=Path, help="write results as baseline")
+    parser.add_argument("--compare", type=Path, help="fail on regressions")
+    parser.add_argument("--tolerance", type=float, default=0.5)
+    args = parser.parse_args()
+
+    columns = gaze_points(args.seconds)
+    results: dict[str, dict[str, float]] = {}
+
+    for name, make_detector in DETECTORS.items():
+        for batch_size in BATCH_SIZES:
+            key = f"{name}/batch={batch_size}"
+            samples_per_second = measure(
+                make_detector, columns, batch_size, args.repeat
+            )
+            results[key] = {"samples_per_second": samples_per_second}
+            print(
+                f"{key:20} {samples_per_second:12,.0f} samples/s "
+                f"{samples_per_second / OUTPUT_FREQUENCY:8.1f}x realtime"
+            )
+
+    if args.save is not None:
+        args.save.write_text(json.dumps(results, indent=2, sort_keys=True) + "\n")
+
+    if args.compare is not None:
+        baseline = json.loads(args.compare.read_text())
+        regressions = [
+            f"{name}: {result['samples_per_second']:,.0f} samples/s, "
+            f"baseline {baseline[name]['samples_per_second']:,.0f} samples/s"
+            for name, result in results.items()
+            if name in baseline
+            and result["samples_per_second"] * (1 + args.tolerance)
+            < baseline[name]["samples_per_second"]
+        ]
+        for regression in regressions:
+            print(f"regression: {regression}", file=sys.stderr)
+        if regressions:
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,89 @@
+import argparse
+import json
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+# each scenario runs in a fresh interpreter, the empty one is subtracted
+SCENARIOS = {
+    "python": "pass",
+    "import tobii_stream_engine": "import tobii_stream_engine",
+    "get_api_version()": (
+        "from tobii_stream_engine import get_api_version; get_api_version()"
+    ),
+    "Recording": "from tobii_stream_engine import Recording",
+    "Device": "from tobii_stream_engine import Device",
+    "every export": (
+        "import tobii_stream_engine as tse\nfor name in tse.__all__: getattr(tse, name)"
+    ),
+}
+
+NATIVE_MODULE = "_tobii_stream_engine_cffi"
+
+
+def measure(statement: str, repeat: int) -> tuple[float, bool]:
+    # the last line reports whether the native library got loaded
+    script = f"{statement}\nimport sys\nprint({NATIVE_MODULE!r} in sys.modules)"
+
+    best = float("inf")
+    loaded = False
+    for _ in range(repeat):
+        started_at = time.perf_counter_ns()
+        output = subprocess.run(
+            [sys.executable, "-c", script],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+        best = min(best, time.perf_counter_ns() - started_at)
+        loaded = output.strip().endswith("True")
+
+    return best / 1e6, loaded
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="measure import time of the package in fresh interpreters",
+    )
+    parser.add_argument("--repeat", type=int, default=15)
+    parser.add_argument("--save", type=Path, help="write results as baseline")
+    parser.add_argument("--compare", type=Path, help="fail on regressions")
+    parser.add_argument("--tolerance", type=float, default=0.5)
+    args = parser.parse_args()
+
+    results: dict[str, dict[str, float]] = {}
+    interpreter_ms, _ = measure(SCENARIOS["python"], args.repeat)
+
+    for name, statement in SCENARIOS.items():
+        if name == "python":
+            continue
+
+        duration_ms, loaded = measure(statement, args.repeat)
+        results[name] = {"ms": max(duration_ms - interpreter_ms, 0.0)}
+        print(
+            f"{name:30} {results[name]['ms']:8.1f} ms "
+            f"{'native library loaded' if loaded else ''}"
+        )
+
+    if args.save is not None:
+        args.save.write_text(json.dumps(results, indent=2, sort_keys=True) + "\n")
+
+    if args.compare is not None:
+        baseline = json.loads(args.compare.read_text())
+        regressions = [
+            f"{name}: {result['ms']:.1f} ms, baseline {baseline[name]['ms']:.1f} ms"
+            for name, result in results.items()
+            if name in baseline
+            and result["ms"] > baseline[name]["ms"] * (1 + args.tolerance)
+        ]
+        for regression in regressions:
+            print(f"regression: {regression}", file=sys.stderr)
+        if regressions:
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,61 @@
+import os
+
+from tobii_stream_engine import Api, Device, DeviceGroup, GazePoint
+
+# run against the stub library, see "Without an eye tracker" in the README
+os.environ.setdefault("TOBII_STUB_DEVICE_COUNT", "2")
+os.environ.setdefault("TOBII_STUB_BUFFER_SAMPLES", "1024")
+
+OUTPUT_FREQUENCIES = [250.0, 1200.0, 10000.0, 40000.0, 100000.0, 200000.0]
+DURATION = 2.0
+
+
+class GapCounter:
+    def __init__(self, output_frequency: float) -> None:
+        self.period_us = 1_000_000 / output_frequency
+        self.received = 0
+        self.missing = 0
+        self.last_timestamp: int | None = None
+
+    def on_gaze_point(self, *, timestamp: int, gaze_point: GazePoint) -> None:
+        if self.last_timestamp is not None:
+            gap = round((timestamp - self.last_timestamp) / self.period_us)
+            self.missing += max(gap - 1, 0)
+
+        self.last_timestamp = timestamp
+        self.received += 1
+
+
+def measure(devices: list[Device], output_frequency: float) -> float:
+    counters = []
+    for device in devices:
+        counter = GapCounter(output_frequency)
+        device.set_output_frequency(output_frequency)
+        device.subscribe_gaze_point(callback=counter.on_gaze_point)
+        counters.append(counter)
+
+    DeviceGroup(devices).run(max_duration=DURATION)
+
+    for device in devices:
+        device.unsubscribe_gaze_point()
+
+    received = sum(counter.received for counter in counters)
+    missing = sum(counter.missing for counter in counters)
+
+    return missing / max(received + missing, 1)
+
+
+def main() -> None:
+    api = Api()
+    devices = [Device(api=api, url=url) for url in api.enumerate_local_device_urls()]
+
+    for output_frequency in OUTPUT_FREQUENCIES:
+        drop_rate = measure(devices, output_frequency)
+        print(
+            f"{len(devices)} devices at {output_frequency:8.0f} Hz: "
+            f"{drop_rate:7.2%} dropped"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,28 @@
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+pytest.importorskip("_tobii_stream_engine_cffi")
+
+from tobii_stream_engine import Api  # noqa: E402
+
+BASELINE = Path(__file__).parent / "baseline.json"
+
+
+@pytest.fixture(scope="session")
+def api() -> Api:
+    return Api()
+
+
+@pytest.fixture(scope="session")
+def baseline() -> dict[str, dict[str, Any]]:
+    if not BASELINE.exists():
+        return {}
+
+    saved = json.loads(BASELINE.read_text())
+    return {
+        benchmark["name"]: benchmark["extra_info"] for benchmark in saved["benchmarks"]
+    }
@@ -0,0 +1,342 @@
+import gc
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+from _tobii_stream_engine_cffi import ffi as _ffi  # type: ignore
+from _tobii_stream_engine_cffi import lib as _lib  # type: ignore
+
+from tobii_stream_engine import Api, Device, DeviceMetrics, GazePoint, PositionXY
+from tobii_stream_engine.errors import TobiiError, raise_on_error
+
+# run against the stub library, see "Without an eye tracker" in the README
+DEVICE_URL = "tobii-stub://0"
+
+# samples delivered to a retaining consumer while counting allocations
+ALLOCATION_SAMPLES = 10_000
+
+# a benchmark fails when it allocates more blocks/sample than its baseline
+ALLOCATION_TOLERANCE = 0.5
+
+Benchmark = Callable[[Device, int], Callable[[], None]]
+
+
+def _gaze_point_ptr() -> Any:
+    gaze_point = _ffi.new("tobii_gaze_point_t *")
+    gaze_point.timestamp_us = 1_000_000
+    gaze_point.validity = _lib.TOBII_VALIDITY_VALID
+    gaze_point.position_xy = [0.25, 0.75]
+    return gaze_point
+
+
+def _gaze_origin_ptr(record_type: str) -> Any:
+    gaze_origin = _ffi.new(f"{record_type} *")
+    gaze_origin.timestamp_us = 1_000_000
+    gaze_origin.left_validity = _lib.TOBII_VALIDITY_VALID
+    gaze_origin.left_xyz = [-30.0, 0.0, 600.0]
+    gaze_origin.right_validity = _lib.TOBII_VALIDITY_VALID
+    gaze_origin.right_xyz = [30.0, 0.0, 600.0]
+    return gaze_origin
+
+
+def _gaze_data_ptr() -> Any:
+    gaze_data = _ffi.new("tobii_gaze_data_t *")
+    gaze_data.timestamp_tracker_us = 1_000_000
+    gaze_data.timestamp_system_us = 1_000_000
+    for eye, x in ((gaze_data.left, -30.0), (gaze_data.right, 30.0)):
+        eye.gaze_origin_validity = _lib.TOBII_VALIDITY_VALID
+        eye.gaze_origin_from_eye_tracker_mm_xyz = [x, 0.0, 600.0]
+        eye.gaze_origin_in_track_box_normalized_xyz = [0.5, 0.5, 0.5]
+        eye.gaze_point_validity = _lib.TOBII_VALIDITY_VALID
+        eye.gaze_point_from_eye_tracker_mm_xyz = [0.0, 150.0, 0.0]
+        eye.gaze_point_on_display_normalized_xy = [0.25, 0.75]
+        eye.eyeball_center_validity = _lib.TOBII_VALIDITY_VALID
+        eye.eyeball_center_from_eye_tracker_mm_xyz = [x, 0.0, 610.0]
+        eye.pupil_validity = _lib.TOBII_VALIDITY_VALID
+        eye.pupil_diameter_mm = 3.5
+    return gaze_data
+
+
+def _head_pose_ptr() -> Any:
+    head_pose = _ffi.new("tobii_head_pose_t *")
+    head_pose.timestamp_us = 1_000_000
+    head_pose.position_validity = _lib.TOBII_VALIDITY_VALID
+    head_pose.position_xyz = [0.0, 0.0, 600.0]
+    head_pose.rotation_validity_xyz = [_lib.TOBII_VALIDITY_VALID] * 3
+    head_pose.rotation_xyz = [0.1, 0.2, 0.3]
+    return head_pose
+
+
+def _notification_ptr() -> Any:
+    notification = _ffi.new("tobii_notification_t *")
+    notification.type = _lib.TOBII_NOTIFICATION_TYPE_FRAMERATE_CHANGED
+    notification.value_type = _lib.TOBII_NOTIFICATION_VALUE_TYPE_FLOAT
+    notification.value.float_ = 1200.0
+    return notification
+
+
+class _Retainer:
+    def __init__(self, samples: int) -> None:
+        self.samples: list[Any] = [None] * samples
+        self.index = 0
+
+    def __call__(self, **kwargs: Any) -> None:
+        self.samples[self.index] = kwargs
+        self.index += 1
+
+
+def _ignore(**kwargs: Any) -> None:
+    pass
+
+
+def _consumer(samples: int) -> Callable[..., None]:
+    return _Retainer(samples) if samples else _ignore
+
+
+def gaze_point_callback(device: Device, samples: int) -> Callable[[], None]:
+    device.subscribe_gaze_point(callback=_consumer(samples))
+    callback = _lib.gaze_point_callback
+    gaze_point = _gaze_point_ptr()
+    handle = device._handle
+    return lambda: callback(gaze_point, handle)
+
+
+def gaze_point_metrics_callback(device: Device, samples: int) -> Callable[[], None]:
+    metrics = device._metrics
+    assert metrics is not None
+
+    device.subscribe_gaze_point(callback=_consumer(samples))
+    callback = _lib.gaze_point_callback
+    gaze_point = _gaze_point_ptr()
+    handle = device._handle
+
+    def run() -> None:
+        callback(gaze_point, handle)
+        # latencies are resolved once per process_callbacks batch
+        if device._callback_count % 64 == 0:
+            metrics._record_process(duration_ns=0, samples=64, system_clock_us=0)
+
+    return run
+
+
+def gaze_point_compact_callback(device: Device, samples: int) -> Callable[[], None]:
+    device.subscribe_gaze_point(callback=_consumer(samples), compact=True)
+    callback = _lib.gaze_point_compact_callback
+    gaze_point = _gaze_point_ptr()
+    handle = device._handle
+    return lambda: callback(gaze_point, handle)
+
+
+def gaze_point_buffered_callback(device: Device, samples: int) -> Callable[[], None]:
+    buffer = device.subscribe_gaze_point_buffered(capacity=1 << 16)
+    callback = _lib.gaze_point_buffered_callback
+    gaze_point = _gaze_point_ptr()
+    handle = device._gaze_point_buffer_handle
+
+    def run() -> None:
+        callback(gaze_point, handle)
+        if len(buffer) == buffer.capacity:
+            buffer.drain()
+
+    return run
+
+
+def gaze_point_native_callback(device: Device, samples: int) -> Callable[[], None]:
+    buffer = device.subscribe_gaze_point_native(capacity=1 << 16)
+    callback = _lib.native_gaze_point_callback
+    gaze_point = _gaze_point_ptr()
+    buffer_ptr = buffer._buffer_ptr
+
+    def run() -> None:
+        callback(gaze_point, buffer_ptr)
+        if len(buffer) == buffer.capacity:
+            buffer.drain()
+
+    return run
+
+
+def gaze_origin_callback(device: Device, samples: int) -> Callable[[], None]:
+    device.subscribe_gaze_origin(callback=_consumer(samples))
+    callback = _lib.gaze_origin_callback
+    gaze_origin = _gaze_origin_ptr("tobii_gaze_origin_t")
+    handle = device._handle
+    return lambda: callback(gaze_origin, handle)
+
+
+def gaze_origin_compact_callback(device: Device, samples: int) -> Callable[[], None]:
+    device.subscribe_gaze_origin(callback=_consumer(samples), compact=True)
+    callback = _lib.gaze_origin_compact_callback
+    gaze_origin = _gaze_origin_ptr("tobii_gaze_origin_t")
+    handle = device._handle
+    return lambda: callback(gaze_origin, handle)
+
+
+def eye_position_normalized_callback(
+    device: Device, samples: int
+) -> Callable[[], None]:
+    device.subscribe_eye_position(callback=_consumer(samples))
+    callback = _lib.eye_position_normalized_callback
+    eye_position = _gaze_origin_ptr("tobii_eye_position_normalized_t")
+    handle = device._handle
+    return lambda: callback(eye_position, handle)
+
+
+def eye_position_normalized_compact_callback(
+    device: Device, samples: int
+) -> Callable[[], None]:
+    device.subscribe_eye_position(callback=_consumer(samples), compact=True)
+    callback = _lib.eye_position_normalized_compact_callback
+    eye_position = _gaze_origin_ptr("tobii_eye_position_normalized_t")
+    handle = device._handle
+    return lambda: callback(eye_position, handle)
+
+
+def gaze_data_callback(device: Device, samples: int) -> Callable[[], None]:
+    device.subscribe_gaze_data(callback=_consumer(samples))
+    callback = _lib.gaze_data_callback
+    gaze_data = _gaze_data_ptr()
+    handle = device._handle
+    return lambda: callback(gaze_data, handle)
+
+
+def head_pose_callback(device: Device, samples: int) -> Callable[[], None]:
+    device.subscribe_head_pose(callback=_consumer(samples))
+    callback = _lib.head_pose_callback
+    head_pose = _head_pose_ptr()
+    handle = device._handle
+    return lambda: callback(head_pose, handle)
+
+
+def user_presence_callback(device: Device, samples: int) -> Callable[[], None]:
+    device.subscribe_user_presence(callback=_consumer(samples))
+    callback = _lib.user_presence_callback
+    status = _lib.TOBII_USER_PRESENCE_STATUS_PRESENT
+    handle = device._handle
+    return lambda: callback(status, 1_000_000, handle)
+
+
+def digital_syncport_callback(device: Device, samples: int) -> Callable[[], None]:
+    device.subscribe_digital_syncport(callback=_consumer(samples))
+    callback = _lib.digital_syncport_callback
+    handle = device._handle
+    return lambda: callback(1, 1_000_000, 1_000_000, handle)
+
+
+def notification_callback(device: Device, samples: int) -> Callable[[], None]:
+    device.subscribe_notifications(callback=_consumer(samples))
+    callback = _lib.notification_callback
+    notification = _notification_ptr()
+    handle = device._handle
+    return lambda: callback(notification, handle)
+
+
+def on_gaze_point(device: Device, samples: int) -> Callable[[], None]:
+    device.subscribe_gaze_point(callback=_consumer(samples))
+    on_gaze_point = device._on_gaze_point
+    gaze_point = GazePoint(validity=True, position_xy=PositionXY(x=0.25, y=0.75))
+    return lambda: on_gaze_point(timestamp=1_000_000, gaze_point=gaze_point)
+
+
+def raise_on_error_success(device: Device, samples: int) -> Callable[[], None]:
+    no_error = _lib.TOBII_ERROR_NO_ERROR
+    return lambda: raise_on_error(no_error)
+
+
+def raise_on_error_failure(device: Device, samples: int) -> Callable[[], None]:
+    not_subscribed = _lib.TOBII_ERROR_NOT_SUBSCRIBED
+
+    def run() -> None:
+        try:
+            raise_on_error(not_subscribed)
+        except TobiiError:
+            pass
+
+    return run
+
+
+BENCHMARKS: dict[str, Benchmark] = {
+    benchmark.__name__: benchmark
+    for benchmark in (
+        gaze_point_callback,
+        gaze_point_compact_callback,
+        gaze_point_buffered_callback,
+        gaze_point_native_callback,
+        gaze_origin_callback,
+        gaze_origin_compact_callback,
+        eye_position_normalized_callback,
+        eye_position_normalized_compact_callback,
+        gaze_data_callback,
+        head_pose_callback,
+        user_presence_callback,
+        digital_syncport_callback,
+        notification_callback,
+        on_gaze_point,
+        raise_on_error_success,
+        raise_on_error_failure,
+    )
+}
+
+
+def measure_allocations(run: Callable[[], None], samples: int) -> float:
+    # the consumer keeps every delivered sample alive, so allocations made
+    # on behalf of a sample remain visible in the snapshot
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    for _ in range(samples):
+        run()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    blocks = sum(stat.count_diff for stat in after.compare_to(before, "filename"))
+
+    return max(blocks, 0) / samples
+
+
+def _bench(
+    benchmark: Any,
+    baseline: dict[str, dict[str, Any]],
+    make_run: Benchmark,
+    make_device: Callable[[], Device],
+) -> None:
+    allocations = measure_allocations(
+        make_run(make_device(), ALLOCATION_SAMPLES), ALLOCATION_SAMPLES
+    )
+    benchmark.extra_info["allocations_per_sample"] = allocations
+
+    benchmark(make_run(make_device(), 0))
+
+    expected = baseline.get(benchmark.name)
+    if expected is not None:
+        assert allocations <= (
+            expected["allocations_per_sample"] + ALLOCATION_TOLERANCE
+        ), f"{allocations:.1f} allocations/sample"
+
+
+@pytest.mark.parametrize("name", BENCHMARKS)
+def test_callback(
+    benchmark: Any,
+    baseline: dict[str, dict[str, Any]],
+    api: Api,
+    name: str,
+) -> None:
+    _bench(
+        benchmark,
+        baseline,
+        BENCHMARKS[name],
+        lambda: Device(api=api, url=DEVICE_URL),
+    )
+
+
+def test_gaze_point_metrics_callback(
+    benchmark: Any,
+    baseline: dict[str, dict[str, Any]],
+    api: Api,
+) -> None:
+    _bench(
+        benchmark,
+        baseline,
+        gaze_point_metrics_callback,
+        lambda: Device(api=api, url=DEVICE_URL, metrics=DeviceMetrics()),
+    )
@@ -0,0 +1,72 @@
+from collections.abc import Callable, Mapping
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+if TYPE_CHECKING:
+    from tobii_stream_engine import Api, Device
+
+# devices of the stub library, see "Without an eye tracker" in the README
+STUB_URL = "tobii-stub://0"
+
+
+class FakeDevice:
+    # records subscriptions so tests can publish samples like the device would
+    _url = "tobii-fake://0"
+
+    def __init__(self) -> None:
+        self.callbacks: dict[str, Callable[..., None]] = {}
+        self.compact: dict[str, bool] = {}
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("subscribe_"):
+            stream = name.removeprefix("subscribe_")
+
+            def subscribe(callback: Callable[..., None], compact: bool = False) -> None:
+                self.callbacks[stream] = callback
+                self.compact[stream] = compact
+
+            return subscribe
+
+        if name.startswith("unsubscribe_"):
+            stream = name.removeprefix("unsubscribe_")
+            return lambda: self.callbacks.pop(stream, None)
+
+        raise AttributeError(name)
+
+    def publish(self, stream: str, timestamp: int, sample: Any) -> None:
+        self.callbacks[stream](timestamp=timestamp, **{stream: sample})
+
+
+@pytest.fixture
+def device() -> FakeDevice:
+    return FakeDevice()
+
+
+@pytest.fixture(scope="session")
+def api() -> "Api":
+    pytest.importorskip("_tobii_stream_engine_cffi")
+
+    from tobii_stream_engine import Api  # noqa: PLC0415
+
+    api = Api()
+    if STUB_URL not in api.enumerate_local_device_urls():
+        pytest.skip("requires the stub library")
+    return api
+
+
+@pytest.fixture
+def stub(api: "Api", monkeypatch: pytest.MonkeyPatch) -> Callable[..., "Device"]:
+    # stub devices read their TOBII_STUB_* settings when created
+    from tobii_stream_engine import Device  # noqa: PLC0415
+
+    def open_device(
+        url: str = STUB_URL,
+        settings: Mapping[str, int] | None = None,
+        **kwargs: Any,
+    ) -> Device:
+        for name, value in (settings or {}).items():
+            monkeypatch.setenv(f"TOBII_STUB_{name}", str(value))
+        return Device(api=api, url=url, **kwargs)
+
+    return open_device
@@ -0,0 +1,40 @@
+import asyncio
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+
+
+def test_second_stream_of_a_kind_is_rejected(stub: Callable[..., Any]) -> None:
+    device = stub(settings={"OUTPUT_FREQUENCY": 1200})
+
+    async def consume() -> None:
+        async with device.gaze_points() as gaze_points:
+            with pytest.raises(ValueError, match="already subscribed"):
+                device.gaze_points()
+
+            # the first stream keeps its subscription
+            async for timestamp, _ in gaze_points:
+                assert timestamp > 0
+                break
+
+        async with device.gaze_points() as gaze_points:
+            async for timestamp, _ in gaze_points:
+                assert timestamp > 0
+                break
+
+    asyncio.run(asyncio.wait_for(consume(), timeout=5))
+
+
+def test_streams_of_other_kinds_share_the_device(stub: Callable[..., Any]) -> None:
+    device = stub(settings={"OUTPUT_FREQUENCY": 1200})
+
+    async def consume() -> None:
+        async with (
+            device.gaze_points() as gaze_points,
+            device.eye_positions() as eye_positions,
+        ):
+            assert await anext(gaze_points)
+            assert await anext(eye_positions)
+
+    asyncio.run(asyncio.wait_for(consume(), timeout=5))
@@ -0,0 +1,109 @@
+import sys
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+
+from tobii_stream_engine.buffers import (
+    GAZE_POINT_COLUMNS,
+    GazePointBuffer,
+    RingBuffer,
+    to_structured_array,
+)
+
+
+def push(buffer: GazePointBuffer, timestamps: range) -> None:
+    for timestamp in timestamps:
+        buffer._push(timestamp, 1, timestamp / 10, timestamp / 20)
+
+
+def test_invalid_capacity() -> None:
+    with pytest.raises(ValueError, match="capacity must be positive"):
+        RingBuffer(GAZE_POINT_COLUMNS, capacity=0)
+
+
+def test_drain() -> None:
+    buffer = GazePointBuffer(capacity=4)
+    push(buffer, range(3))
+    assert len(buffer) == 3
+
+    columns = buffer.drain()
+    assert list(columns) == list(GAZE_POINT_COLUMNS)
+    assert columns["timestamp_us"].tolist() == [0, 1, 2]
+    assert columns["validity"].tolist() == [1, 1, 1]
+    assert columns["x"].tolist() == pytest.approx([0.0, 0.1, 0.2])
+    assert columns["y"].tolist() == pytest.approx([0.0, 0.05, 0.1])
+    assert len(buffer) == 0
+    assert buffer.drain()["timestamp_us"].tolist() == []
+
+
+def test_wraparound() -> None:
+    buffer = GazePointBuffer(capacity=4)
+    push(buffer, range(3))
+    buffer.drain()
+
+    # the head wraps past the end of the columns
+    push(buffer, range(3, 7))
+    assert buffer.drain()["timestamp_us"].tolist() == [3, 4, 5, 6]
+
+    push(buffer, range(7, 9))
+    assert buffer.drain()["timestamp_us"].tolist() == [7, 8]
+
+
+def test_overflow_drops_newest() -> None:
+    buffer = GazePointBuffer(capacity=4)
+    push(buffer, range(6))
+
+    assert buffer.received == 6
+    assert buffer.dropped == 2
+    assert buffer.drain()["timestamp_us"].tolist() == [0, 1, 2, 3]
+
+    push(buffer, range(6, 8))
+    assert buffer.received == 8
+    assert buffer.dropped == 2
+    assert buffer.drain()["timestamp_us"].tolist() == [6, 7]
+
+
+def test_to_structured_array() -> None:
+    pytest.importorskip("numpy")
+
+    buffer = GazePointBuffer(capacity=4)
+    push(buffer, range(2))
+    structured_array = to_structured_array(buffer.drain())
+
+    assert structured_array.dtype.names == tuple(GAZE_POINT_COLUMNS)
+    assert structured_array["timestamp_us"].tolist() == [0, 1]
+    assert structured_array["x"].tolist() == pytest.approx([0.0, 0.1])
+
+
+def test_to_structured_array_without_numpy(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setitem(sys.modules, "numpy", None)
+
+    with pytest.raises(ImportError, match=r"tobii-stream-engine\[numpy\]"):
+        to_structured_array(GazePointBuffer(capacity=1).drain())
+
+
+def test_buffered_subscription(stub: Callable[..., Any]) -> None:
+    device = stub(settings={"OUTPUT_FREQUENCY": 1200})
+    buffer = device.subscribe_gaze_point_buffered(capacity=8)
+
+    while buffer.received <= buffer.capacity:
+        device.run_once()
+
+    columns = buffer.drain()
+    assert len(columns["timestamp_us"]) == 8
+    assert columns["timestamp_us"].tolist() == sorted(columns["timestamp_us"])
+    assert buffer.dropped == buffer.received - 8
+
+
+def test_mode_switch_is_rejected(stub: Callable[..., Any]) -> None:
+    device = stub()
+    device.subscribe_gaze_point_buffered(capacity=8)
+
+    with pytest.raises(ValueError, match="call unsubscribe_gaze_point"):
+        device.subscribe_gaze_point_native(capacity=8)
+    with pytest.raises(ValueError, match="already subscribed in another mode"):
+        device.subscribe_gaze_point(callback=print)
+
+    device.unsubscribe_gaze_point()
+    device.subscribe_gaze_point_native(capacity=8)
@@ -0,0 +1,49 @@
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+
+pytest.importorskip("_tobii_stream_engine_cffi")
+
+from tobii_stream_engine import DeviceConfigCache  # noqa: E402
+
+
+def test_set_output_frequency_invalidates(stub: Callable[..., Any]) -> None:
+    device = stub(settings={"OUTPUT_FREQUENCY": 250})
+
+    with DeviceConfigCache(device) as cache:
+        assert cache.notifications
+        assert cache.get_output_frequency() == 250
+
+        # visible before the notification of the change is processed
+        cache.set_output_frequency(600)
+        assert cache.get_output_frequency() == 600
+
+        device.run_once()
+        assert cache.get_output_frequency() == 600
+
+
+def test_notifications_refresh_cached_values(stub: Callable[..., Any]) -> None:
+    device = stub(settings={"OUTPUT_FREQUENCY": 250})
+
+    with DeviceConfigCache(device) as cache:
+        assert cache.get_output_frequency() == 250
+
+        # changed behind the cache's back, stale until the notification arrives
+        device.set_output_frequency(600)
+        assert cache.get_output_frequency() == 250
+
+        device.run_once()
+        assert cache.get_output_frequency() == 600
+
+
+def test_volatile_values_are_not_cached_without_notifications(
+    stub: Callable[..., Any],
+) -> None:
+    device = stub(settings={"OUTPUT_FREQUENCY": 250})
+    cache = DeviceConfigCache(device)
+
+    assert cache.get_output_frequency() == 250
+    device.set_output_frequency(600)
+    assert cache.get_output_frequency() == 600
+    assert cache.get_device_info() is cache.get_device_info()
@@ -0,0 +1,12 @@
+import time
+from collections.abc import Callable
+from typing import Any
+
+
+def test_timeout_is_rounded_up_to_the_wait_quantum(stub: Callable[..., Any]) -> None:
+    # nothing is subscribed, the stub waits in quanta of 100 ms
+    device = stub()
+
+    started_at = time.monotonic()
+    assert device.run_once(timeout=0.05) == 0
+    assert time.monotonic() - started_at >= 0.09
@@ -0,0 +1,102 @@
+import logging
+import threading
+import time
+
+import pytest
+
+from tobii_stream_engine import Dispatcher
+
+
+def test_streams_keep_their_order() -> None:
+    received: dict[str, list[int]] = {}
+
+    with Dispatcher(workers=4) as dispatcher:
+        callbacks = {}
+        for stream in ["gaze_point", "gaze_origin", "eye_position", "head_pose"]:
+            timestamps = received[stream] = []
+
+            def on_sample(
+                *, timestamp: int, timestamps: list[int] = timestamps
+            ) -> None:
+                timestamps.append(timestamp)
+
+            callbacks[stream] = dispatcher.bind(stream, on_sample)
+
+        for timestamp in range(1000):
+            for callback in callbacks.values():
+                callback(timestamp=timestamp)
+
+    for timestamps in received.values():
+        assert timestamps == list(range(1000))
+
+
+def test_overflow_drops_and_counts() -> None:
+    entered = threading.Event()
+    release = threading.Event()
+    received: list[int] = []
+
+    def on_gaze_point(*, timestamp: int) -> None:
+        entered.set()
+        release.wait()
+        received.append(timestamp)
+
+    with Dispatcher(maxsize=2) as dispatcher:
+        callback = dispatcher.bind("gaze_point", on_gaze_point)
+
+        # the worker blocks in the first callback, the next two are queued
+        callback(timestamp=0)
+        assert entered.wait(5)
+        for timestamp in range(1, 5):
+            callback(timestamp=timestamp)
+        assert len(dispatcher) == 2
+
+        release.set()
+
+    assert received == [0, 1, 2]
+    statistics = dispatcher.statistics["gaze_point"]
+    assert statistics.dispatched == 3
+    assert statistics.dropped == 2
+
+
+def test_latency_counters() -> None:
+    release = threading.Event()
+
+    def on_gaze_point(*, timestamp: int) -> None:
+        release.wait()
+
+    with Dispatcher() as dispatcher:
+        callback = dispatcher.bind("gaze_point", on_gaze_point)
+        assert dispatcher.statistics["gaze_point"].mean_latency is None
+
+        for timestamp in range(3):
+            callback(timestamp=timestamp)
+        # the queued samples wait for the first callback
+        time.sleep(0.05)
+        release.set()
+
+    statistics = dispatcher.statistics["gaze_point"]
+    assert statistics.dispatched == 3
+    assert statistics.mean_latency is not None
+    assert statistics.max_latency is not None
+    assert 0 < statistics.mean_latency <= statistics.max_latency
+    assert statistics.max_latency >= 0.05
+
+
+def test_not_running_drops_samples(caplog: pytest.LogCaptureFixture) -> None:
+    dispatcher = Dispatcher()
+    received: list[int] = []
+
+    with caplog.at_level(logging.WARNING, logger="tobii_stream_engine.dispatch"):
+        callback = dispatcher.bind(
+            "gaze_point", lambda *, timestamp: received.append(timestamp)
+        )
+        callback(timestamp=0)
+        callback(timestamp=1)
+    assert "not running" in caplog.text
+
+    with dispatcher:
+        callback(timestamp=2)
+    callback(timestamp=3)
+
+    assert received == [2]
+    assert dispatcher.statistics["gaze_point"].dropped == 3
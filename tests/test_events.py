@@ -0,0 +1,97 @@
+from typing import Any
+
+import pytest
+
+from tobii_stream_engine.events import (
+    DispersionThresholdDetector,
+    GazeEvent,
+    GazeEventType,
+    VelocityThresholdDetector,
+)
+
+numpy = pytest.importorskip("numpy")
+
+OUTPUT_FREQUENCY = 1200
+
+DETECTORS = {
+    "ivt": VelocityThresholdDetector,
+    "idt": DispersionThresholdDetector,
+}
+
+
+def gaze_points(seconds: float) -> dict[str, Any]:
+    # fixations with noise, linear saccades and invalid stretches for blinks
+    random = numpy.random.default_rng(0)
+    positions: list[Any] = []
+    validity: list[int] = []
+    position = numpy.array([0.5, 0.5])
+
+    while len(positions) < seconds * OUTPUT_FREQUENCY:
+        fixation = int(random.integers(240, 480))
+        positions.extend(position + random.normal(0, 0.002, (fixation, 2)))
+        validity.extend([1] * fixation)
+
+        if random.random() < 0.3:
+            positions.extend([position] * 180)
+            validity.extend([0] * 180)
+            continue
+
+        target = random.random(2) * 0.8 + 0.1
+        steps = numpy.linspace(0, 1, 36)[:, None]
+        positions.extend(position + (target - position) * steps)
+        validity.extend([1] * 36)
+        position = target
+
+    positions_xy = numpy.array(positions)
+    interval_us = 1e6 / OUTPUT_FREQUENCY
+    return {
+        "timestamp_us": (numpy.arange(len(positions)) * interval_us).astype(
+            numpy.int64
+        ),
+        "validity": numpy.array(validity, dtype=numpy.uint8),
+        "x": positions_xy[:, 0].astype(numpy.float32),
+        "y": positions_xy[:, 1].astype(numpy.float32),
+    }
+
+
+def detect(name: str, columns: dict[str, Any], batch_size: int) -> list[GazeEvent]:
+    detector = DETECTORS[name](output_frequency=OUTPUT_FREQUENCY)
+    size = len(columns["timestamp_us"])
+
+    events: list[GazeEvent] = []
+    for start in range(0, size, batch_size):
+        events += detector.feed(
+            {
+                name: column[start : start + batch_size]
+                for name, column in columns.items()
+            }
+        )
+    events += detector.flush()
+
+    assert detector.pending == 0
+    return events
+
+
+@pytest.fixture(scope="module")
+def columns() -> dict[str, Any]:
+    return gaze_points(seconds=10)
+
+
+@pytest.mark.parametrize("name", DETECTORS)
+def test_detects_all_event_types(name: str, columns: dict[str, Any]) -> None:
+    events = detect(name, columns, batch_size=len(columns["timestamp_us"]))
+
+    assert {event.type for event in events} == set(GazeEventType)
+    assert all(
+        earlier.end_us <= later.start_us for earlier, later in zip(events, events[1:])
+    )
+
+
+@pytest.mark.parametrize("name", DETECTORS)
+@pytest.mark.parametrize("batch_size", [1, 7, 64, 1000])
+def test_batch_size_invariance(
+    name: str, batch_size: int, columns: dict[str, Any]
+) -> None:
+    expected = detect(name, columns, batch_size=len(columns["timestamp_us"]))
+
+    assert detect(name, columns, batch_size=batch_size) == expected
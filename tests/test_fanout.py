@@ -0,0 +1,118 @@
+from typing import Any
+
+import pytest
+
+from tobii_stream_engine.fanout import MAX_STRIDE, Fanout, SlowConsumerPolicy
+
+from .conftest import FakeDevice
+
+
+def publish(device: FakeDevice, count: int, start: int = 0) -> None:
+    for timestamp in range(start, start + count):
+        device.publish("gaze_point", timestamp, f"gp{timestamp}")
+
+
+def test_subscribe_attaches_once(device: Any) -> None:
+    fanout: Fanout[str] = Fanout(device, "gaze_point", compact=True)
+    assert device.callbacks == {}
+
+    fanout.subscribe()
+    fanout.subscribe()
+    assert list(device.callbacks) == ["gaze_point"]
+    assert device.compact["gaze_point"]
+
+    fanout.close()
+    assert device.callbacks == {}
+    assert fanout.consumers == ()
+
+
+def test_invalid_stream(device: Any) -> None:
+    with pytest.raises(ValueError, match="unknown stream"):
+        Fanout(device, "notifications")
+    with pytest.raises(ValueError, match="no compact samples"):
+        Fanout(device, "head_pose", compact=True)
+
+
+def test_drop_oldest(device: Any) -> None:
+    fanout: Fanout[str] = Fanout(device, "gaze_point")
+    consumer = fanout.subscribe(maxsize=4, policy=SlowConsumerPolicy.DROP_OLDEST)
+
+    publish(device, 10)
+
+    assert [timestamp for timestamp, _ in consumer.drain()] == [6, 7, 8, 9]
+    assert consumer.received == 10
+    assert consumer.dropped == 6
+    assert not consumer.closed
+
+
+def test_consumers_are_independent(device: Any) -> None:
+    fanout: Fanout[str] = Fanout(device, "gaze_point")
+    slow = fanout.subscribe(maxsize=2)
+    fast = fanout.subscribe(maxsize=16)
+
+    publish(device, 8)
+
+    assert [timestamp for timestamp, _ in slow.drain()] == [6, 7]
+    assert [timestamp for timestamp, _ in fast.drain()] == list(range(8))
+    assert fast.dropped == 0
+
+
+def test_decimate(device: Any) -> None:
+    fanout: Fanout[str] = Fanout(device, "gaze_point")
+    consumer = fanout.subscribe(maxsize=4, policy=SlowConsumerPolicy.DECIMATE)
+
+    publish(device, 4)
+    assert consumer.stride == 1
+
+    # a kept sample finding the queue full widens the stride
+    publish(device, 1, start=4)
+    assert consumer.stride == 2
+    publish(device, 1, start=5)
+    assert consumer.stride == 2
+    publish(device, 1, start=6)
+    assert consumer.stride == 4
+
+    assert [timestamp for timestamp, _ in consumer.drain()] == [2, 3, 4, 6]
+    assert consumer.received == 7
+    assert consumer.dropped == 3
+
+    # the stride narrows again while the consumer keeps up
+    for timestamp in range(7, 10):
+        publish(device, 1, start=timestamp)
+        consumer.drain()
+    assert consumer.stride == 1
+
+
+def test_decimate_stride_is_capped(device: Any) -> None:
+    fanout: Fanout[str] = Fanout(device, "gaze_point")
+    consumer = fanout.subscribe(maxsize=4, policy=SlowConsumerPolicy.DECIMATE)
+
+    publish(device, MAX_STRIDE * 64)
+
+    assert consumer.stride == MAX_STRIDE
+    timestamps = [timestamp for timestamp, _ in consumer.drain()]
+    assert len(timestamps) == 4
+    assert all(
+        later - earlier == MAX_STRIDE
+        for earlier, later in zip(timestamps, timestamps[1:])
+    )
+
+
+def test_disconnect(device: Any) -> None:
+    fanout: Fanout[str] = Fanout(device, "gaze_point")
+    consumer = fanout.subscribe(maxsize=2, policy=SlowConsumerPolicy.DISCONNECT)
+    other = fanout.subscribe(maxsize=8)
+
+    publish(device, 3)
+
+    assert consumer.closed
+    assert consumer.dropped == 1
+    assert fanout.consumers == (other,)
+
+    # queued samples remain readable after the disconnect
+    assert list(consumer) == [(0, "gp0"), (1, "gp1")]
+    assert consumer.get() is None
+
+    publish(device, 1, start=3)
+    assert consumer.received == 3
+    assert len(other) == 4
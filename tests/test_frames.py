@@ -0,0 +1,111 @@
+from typing import Any
+
+import pytest
+
+from tobii_stream_engine.frames import Frame, FrameAssembler
+
+from .conftest import FakeDevice
+
+Frames = list[tuple[int, Frame]]
+
+
+def frame(*samples: Any, missing: tuple[str, ...] = ()) -> Frame:
+    return Frame(*samples, missing=missing)
+
+
+def assemble(device: Any, frames: Frames, **kwargs: Any) -> FrameAssembler:
+    def callback(*, timestamp: int, frame: Frame) -> None:
+        frames.append((timestamp, frame))
+
+    assembler = FrameAssembler(device, callback, **kwargs)
+    assembler.start()
+    return assembler
+
+
+def test_complete_frame(device: FakeDevice) -> None:
+    frames: Frames = []
+    assembler = assemble(device, frames)
+
+    device.publish("gaze_point", 1, "gp1")
+    device.publish("eye_position", 1, "ep1")
+    assert frames == []
+
+    device.publish("gaze_origin", 1, "go1")
+    assert frames == [(1, frame("gp1", "go1", "ep1"))]
+    assert frames[0][1].complete
+    assert assembler.frames == 1
+    assert assembler.incomplete_frames == 0
+
+
+def test_streams_subset(device: FakeDevice) -> None:
+    frames: Frames = []
+    assemble(device, frames, streams=["gaze_point", "gaze_origin"])
+    assert set(device.callbacks) == {"gaze_point", "gaze_origin"}
+
+    device.publish("gaze_origin", 1, "go1")
+    device.publish("gaze_point", 1, "gp1")
+    assert frames == [(1, frame("gp1", "go1", None))]
+
+
+def test_window_timeout(device: FakeDevice) -> None:
+    frames: Frames = []
+    assembler = assemble(
+        device, frames, streams=["gaze_point", "gaze_origin"], window=2
+    )
+
+    device.publish("gaze_point", 1, "gp1")
+    device.publish("gaze_point", 2, "gp2")
+    assert frames == []
+
+    # a third pending timestamp pushes the oldest out of the window
+    device.publish("gaze_point", 3, "gp3")
+    assert frames == [(1, frame("gp1", None, None, missing=("gaze_origin",)))]
+    assert not frames[0][1].complete
+    assert assembler.incomplete_frames == 1
+
+
+def test_complete_frame_emits_older(device: FakeDevice) -> None:
+    frames: Frames = []
+    assemble(device, frames, streams=["gaze_point", "gaze_origin"])
+
+    device.publish("gaze_point", 1, "gp1")
+    device.publish("gaze_origin", 2, "go2")
+    device.publish("gaze_point", 2, "gp2")
+
+    assert [timestamp for timestamp, _ in frames] == [1, 2]
+    assert frames[0][1].missing == ("gaze_origin",)
+    assert frames[1][1].complete
+
+
+def test_late_sample_starts_new_frame(device: FakeDevice) -> None:
+    frames: Frames = []
+    assemble(device, frames, streams=["gaze_point", "gaze_origin"])
+
+    device.publish("gaze_point", 1, "gp1")
+    device.publish("gaze_origin", 1, "go1")
+    device.publish("gaze_origin", 1, "go1-late")
+    assert len(frames) == 1
+
+    device.publish("gaze_point", 1, "gp1-late")
+    assert frames[1] == (1, frame("gp1-late", "go1-late", None))
+
+
+def test_stop_flushes(device: FakeDevice) -> None:
+    frames: Frames = []
+    assembler = assemble(device, frames)
+
+    device.publish("gaze_point", 1, "gp1")
+    device.publish("gaze_point", 2, "gp2")
+    assembler.stop()
+
+    assert device.callbacks == {}
+    assert [timestamp for timestamp, _ in frames] == [1, 2]
+    assert frames[0][1].missing == ("gaze_origin", "eye_position")
+    assert assembler.incomplete_frames == 2
+
+
+def test_invalid_arguments(device: Any) -> None:
+    with pytest.raises(ValueError, match="window must be positive"):
+        FrameAssembler(device, print, window=0)
+    with pytest.raises(ValueError, match="unknown stream 'gaze_data'"):
+        FrameAssembler(device, print, streams=["gaze_data"])
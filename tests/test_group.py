@@ -0,0 +1,48 @@
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+
+pytest.importorskip("_tobii_stream_engine_cffi")
+
+from tobii_stream_engine import DeviceGroup, DeviceMetrics  # noqa: E402
+
+STUB_URLS = ["tobii-stub://0", "tobii-stub://1"]
+
+
+def test_run_records_wait_metrics(stub: Callable[..., Any]) -> None:
+    metrics = [DeviceMetrics() for _ in STUB_URLS]
+    devices = [
+        stub(url=url, settings={"DEVICE_COUNT": 2}, metrics=device_metrics)
+        for url, device_metrics in zip(STUB_URLS, metrics, strict=True)
+    ]
+    received: dict[str, int] = {url: 0 for url in STUB_URLS}
+    for device in devices:
+
+        def on_gaze_point(
+            *, timestamp: int, gaze_point: Any, url: str = device._url
+        ) -> None:
+            received[url] += 1
+
+        device.subscribe_gaze_point(callback=on_gaze_point)
+
+    DeviceGroup(devices).run(max_duration=0.2)
+
+    assert all(received.values())
+    for device_metrics in metrics:
+        assert device_metrics.snapshot().wait_duration_ns.count > 0
+
+
+def test_timeout_spins_are_counted_per_device(stub: Callable[..., Any]) -> None:
+    # nothing is subscribed, so every wait of the engine times out
+    metrics = [DeviceMetrics() for _ in STUB_URLS]
+    devices = [
+        stub(url=url, settings={"DEVICE_COUNT": 2}, metrics=device_metrics)
+        for url, device_metrics in zip(STUB_URLS, metrics, strict=True)
+    ]
+
+    assert DeviceGroup(devices).run_once(timeout=0.15) == 0
+    for device_metrics in metrics:
+        snapshot = device_metrics.snapshot()
+        assert snapshot.timeout_spins >= 1
+        assert snapshot.wait_duration_ns.count == 1
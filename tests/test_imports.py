@@ -0,0 +1,49 @@
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
+
+# usable without the native library, e.g. to analyse recordings
+LIB_FREE = [
+    "DeviceMetrics",
+    "DeviceSupport",
+    "Dispatcher",
+    "Fanout",
+    "FrameAssembler",
+    "GazePoint",
+    "Recording",
+    "ReplayDevice",
+    "SupportCache",
+    "SyncportLog",
+    "TimesyncScheduler",
+    "VelocityThresholdDetector",
+]
+
+
+def test_import_without_native_library() -> None:
+    script = textwrap.dedent(
+        f"""
+        import sys
+
+        class Blocker:
+            def find_spec(self, name, path=None, target=None):
+                if name == "_tobii_stream_engine_cffi":
+                    raise ImportError("blocked")
+
+        sys.meta_path.insert(0, Blocker())
+
+        import tobii_stream_engine
+        from tobii_stream_engine import {", ".join(LIB_FREE)}
+
+        support = DeviceSupport(capabilities=0b10, streams=0b1)
+        assert support.supports_capability(1)
+        assert not support.supports_stream(1)
+        assert "_tobii_stream_engine_cffi" not in sys.modules
+        """
+    )
+
+    subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=Path(__file__).parents[1],
+        check=True,
+    )
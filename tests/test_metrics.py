@@ -0,0 +1,112 @@
+from typing import Any
+
+import pytest
+
+from tobii_stream_engine import DeviceMetrics
+from tobii_stream_engine.metrics import Histogram
+
+
+def test_empty_histogram() -> None:
+    snapshot = Histogram().snapshot()
+
+    assert snapshot.count == 0
+    assert snapshot.min is snapshot.max is snapshot.mean is None
+    assert snapshot.p50 is snapshot.p999 is None
+
+
+def test_linear_buckets_are_exact() -> None:
+    histogram = Histogram(significant_bits=5)
+    histogram.record_many(list(range(64)))
+
+    snapshot = histogram.snapshot()
+    assert (snapshot.min, snapshot.max, snapshot.mean) == (0, 63, 31.5)
+    assert (snapshot.p50, snapshot.p90, snapshot.p99, snapshot.p999) == (31, 57, 62, 63)
+
+
+@pytest.mark.parametrize(
+    ("values", "percentile", "expected"),
+    [
+        # 64 and 65 share the first bucket with a width of 2
+        ([64, 65], 100, 64),
+        # 126 and 127 share the last bucket of the width 2, 128 starts width 4
+        ([126, 127, 128], 50, 126),
+        ([126, 127, 128], 100, 128),
+        ([128, 131], 100, 128),
+        ([128, 132], 100, 132),
+        # bucket bounds are clamped to the recorded range
+        ([127, 128], 0, 127),
+    ],
+)
+def test_bucket_boundaries(values: list[int], percentile: float, expected: int) -> None:
+    histogram = Histogram(significant_bits=5)
+    histogram.record_many(values)
+
+    assert histogram.percentile(percentile) == expected
+
+
+def test_relative_error() -> None:
+    histogram = Histogram(significant_bits=5)
+    for value in [1_000, 123_456, 10**9]:
+        histogram.reset()
+        histogram.record_many([1, value, 10**10])
+
+        # the lower bound of the bucket, within 1/32 of the value
+        p50 = histogram.percentile(50)
+        assert p50 is not None
+        assert value * (1 - 1 / 32) < p50 <= value
+
+
+def test_out_of_range_values_are_clamped() -> None:
+    histogram = Histogram(max_value=1_000)
+    histogram.record_many([-5, 5_000])
+
+    assert histogram.snapshot().min == 0
+    assert histogram.snapshot().max == 1_000
+    # the lower bound of the bucket of 1000
+    assert histogram.percentile(100) == 992
+
+
+def test_device_metrics() -> None:
+    metrics = DeviceMetrics()
+    metrics._set_output_frequency(1_000)
+
+    received: list[Any] = []
+    gaze_point = metrics.bind(
+        "gaze_point", lambda *, timestamp, gaze_point: received.append(gaze_point)
+    )
+    user_presence = metrics.bind(
+        "user_presence",
+        lambda *, timestamp, user_presence: received.append(user_presence),
+    )
+
+    # 3 samples are missing before 5000, user presence has no sample interval
+    for timestamp in [0, 1_000, 2_000, 5_000, 6_000]:
+        gaze_point(timestamp=timestamp, gaze_point=timestamp)
+    user_presence(timestamp=0, user_presence="present")
+    user_presence(timestamp=6_000, user_presence="away")
+    metrics._record_process(duration_ns=50_000, samples=7, system_clock_us=7_000)
+    metrics._record_wait(duration_ns=2_000_000)
+    metrics._record_timeout_spin()
+
+    assert received == [0, 1_000, 2_000, 5_000, 6_000, "present", "away"]
+
+    snapshot = metrics.snapshot()
+    assert snapshot.timeout_spins == 1
+    assert snapshot.wait_duration_ns.count == 1
+    assert snapshot.process_duration_ns.count == 1
+    assert snapshot.samples_per_process.max == 7
+
+    gaze_points = snapshot.streams["gaze_point"]
+    assert gaze_points.samples == 5
+    assert gaze_points.gaps == 1
+    assert gaze_points.missed_samples == 2
+    assert gaze_points.callback_duration_ns.count == 5
+    assert (gaze_points.latency_us.min, gaze_points.latency_us.max) == (1_000, 7_000)
+    assert gaze_points.samples_per_second > 0
+
+    user_presences = snapshot.streams["user_presence"]
+    assert user_presences.samples == 2
+    assert user_presences.gaps == 0
+
+    # rates cover the interval since the previous snapshot
+    assert metrics.snapshot().streams["gaze_point"].samples_per_second == 0
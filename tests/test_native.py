@@ -0,0 +1,268 @@
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+
+pytest.importorskip("_tobii_stream_engine_cffi")
+
+from _tobii_stream_engine_cffi import ffi as _ffi  # type: ignore  # noqa: E402
+from _tobii_stream_engine_cffi import lib as _lib  # type: ignore  # noqa: E402
+
+from tobii_stream_engine import FoveatedTrackingState, Stream  # noqa: E402
+from tobii_stream_engine.buffers import GAZE_POINT_COLUMNS  # noqa: E402
+from tobii_stream_engine.native import (  # noqa: E402
+    NativeGazePointBuffer,
+    NativeRecordBuffer,
+)
+
+
+def push_gaze_points(buffer_ptr: Any, timestamps: range) -> None:
+    gaze_point = _ffi.new("tobii_gaze_point_t *")
+    gaze_point.validity = _lib.TOBII_VALIDITY_VALID
+    for timestamp in timestamps:
+        gaze_point.timestamp_us = timestamp
+        gaze_point.position_xy = [timestamp / 8, 1 - timestamp / 8]
+        _lib.native_gaze_point_callback(gaze_point, buffer_ptr)
+
+
+def test_invalid_capacity() -> None:
+    with pytest.raises(ValueError, match="capacity must be positive"):
+        NativeGazePointBuffer(capacity=0)
+
+
+def test_drain() -> None:
+    buffer = NativeGazePointBuffer(capacity=4)
+    push_gaze_points(buffer._buffer_ptr, range(3))
+    assert len(buffer) == 3
+
+    columns = buffer.drain()
+    assert list(columns) == list(GAZE_POINT_COLUMNS)
+    assert columns["timestamp_us"].tolist() == [0, 1, 2]
+    assert columns["validity"].tolist() == [_lib.TOBII_VALIDITY_VALID] * 3
+    assert columns["x"].tolist() == [0.0, 0.125, 0.25]
+    assert columns["y"].tolist() == [1.0, 0.875, 0.75]
+    assert len(buffer) == 0
+
+
+def test_wraparound() -> None:
+    buffer = NativeGazePointBuffer(capacity=4)
+    push_gaze_points(buffer._buffer_ptr, range(3))
+    buffer.drain()
+
+    push_gaze_points(buffer._buffer_ptr, range(3, 7))
+    assert buffer.drain()["timestamp_us"].tolist() == [3, 4, 5, 6]
+
+
+def test_overflow_drops_newest() -> None:
+    buffer = NativeGazePointBuffer(capacity=4)
+    push_gaze_points(buffer._buffer_ptr, range(6))
+
+    assert buffer.capacity == 4
+    assert buffer.received == 6
+    assert buffer.dropped == 2
+    assert buffer.drain()["timestamp_us"].tolist() == [0, 1, 2, 3]
+
+    push_gaze_points(buffer._buffer_ptr, range(6, 7))
+    assert buffer.drain()["timestamp_us"].tolist() == [6]
+    assert buffer.dropped == 2
+
+
+def test_record_buffer_columns() -> None:
+    # columns are gathered by field offset, in the order they are declared
+    buffer = NativeRecordBuffer(
+        columns={"position_xy": "f", "timestamp_us": "q"},
+        record_type="tobii_gaze_point_t",
+        capacity=4,
+    )
+    push_gaze_points(buffer._buffer_ptr, range(1, 3))
+
+    columns = buffer.drain()
+    assert list(columns) == ["position_xy", "timestamp_us"]
+    assert columns["timestamp_us"].tolist() == [1, 2]
+    assert columns["position_xy"].tolist() == [0.125, 0.25]
+
+
+def test_native_subscription(stub: Callable[..., Any]) -> None:
+    device = stub(settings={"OUTPUT_FREQUENCY": 1200})
+    buffer = device.subscribe_gaze_point_native(capacity=8)
+
+    while buffer.received <= buffer.capacity:
+        device.run_once()
+
+    columns = device.drain(Stream.GAZE_POINT)
+    timestamps = columns["timestamp_us"].tolist()
+    assert len(timestamps) == 8
+    assert timestamps == sorted(timestamps)
+    assert buffer.dropped == buffer.received - 8
+    assert all(0.0 <= x <= 1.0 for x in columns["x"])
+
+    # drained buffers accept samples again
+    received = buffer.received
+    while buffer.received == received:
+        device.run_once()
+    assert len(device.drain(Stream.GAZE_POINT)["timestamp_us"]) > 0
+
+
+@pytest.mark.parametrize(
+    ("stream", "subscribe", "left_x", "z"),
+    [
+        (Stream.GAZE_ORIGIN, "subscribe_gaze_origin_native", -30.0, 600.0),
+        (Stream.EYE_POSITION_NORMALIZED, "subscribe_eye_position_native", 0.45, 0.5),
+    ],
+)
+def test_native_eye_subscriptions(
+    stub: Callable[..., Any], stream: Stream, subscribe: str, left_x: float, z: float
+) -> None:
+    device = stub(settings={"OUTPUT_FREQUENCY": 1200})
+    buffer = getattr(device, subscribe)(capacity=8)
+
+    while buffer.received <= buffer.capacity:
+        device.run_once()
+
+    columns = device.drain(stream)
+    assert len(columns["timestamp_us"]) == 8
+    assert buffer.dropped == buffer.received - 8
+    assert set(columns["left_validity"]) == {_lib.TOBII_VALIDITY_VALID}
+    assert set(columns["right_validity"]) == {_lib.TOBII_VALIDITY_VALID}
+    assert all(abs(x - left_x) <= 0.25 for x in columns["left_x"])
+    assert all(
+        right > left for left, right in zip(columns["left_x"], columns["right_x"])
+    )
+    assert set(columns["left_z"]) == set(columns["right_z"]) == {z}
+
+
+def test_native_eye_subscription_mode_switch(stub: Callable[..., Any]) -> None:
+    device = stub()
+    device.subscribe_gaze_origin_native(capacity=8)
+
+    with pytest.raises(ValueError, match="call unsubscribe_gaze_origin"):
+        device.subscribe_gaze_origin(callback=print)
+
+    device.unsubscribe_gaze_origin()
+    with pytest.raises(ValueError, match="not subscribed as buffered"):
+        device.drain(Stream.GAZE_ORIGIN)
+
+
+def test_gaze_data(stub: Callable[..., Any]) -> None:
+    device = stub(settings={"OUTPUT_FREQUENCY": 1200})
+    received: list[Any] = []
+    device.subscribe_gaze_data(
+        callback=lambda *, timestamp, gaze_data: received.append((timestamp, gaze_data))
+    )
+    while not received:
+        device.run_once()
+
+    timestamp, gaze_data = received[0]
+    assert gaze_data.timestamp_system_us == timestamp
+    assert gaze_data.timestamp_tracker_us == timestamp - 1_000_000_000
+    for eye, offset_x in [(gaze_data.left, -30.0), (gaze_data.right, 30.0)]:
+        assert eye.gaze_origin_validity and eye.pupil_validity
+        assert abs(eye.gaze_origin_mm_xyz.x - offset_x) <= 0.25
+        assert eye.gaze_origin_mm_xyz.z == 600.0
+        assert eye.eyeball_center_mm_xyz.z == 612.0
+        assert 0.25 <= eye.gaze_point_xy.x <= 0.75
+        assert 3.25 <= eye.pupil_diameter_mm <= 3.75
+
+    device.unsubscribe_gaze_data()
+    buffer = device.subscribe_gaze_data_native(capacity=8)
+    while buffer.received <= buffer.capacity:
+        device.run_once()
+
+    columns = device.drain(Stream.GAZE_DATA)
+    assert len(columns["timestamp_system_us"]) == 8
+    assert buffer.dropped == buffer.received - 8
+    assert [
+        system - tracker
+        for system, tracker in zip(
+            columns["timestamp_system_us"], columns["timestamp_tracker_us"]
+        )
+    ] == [1_000_000_000] * 8
+    for side, offset_x in [("left", -30.0), ("right", 30.0)]:
+        assert set(columns[f"{side}_pupil_validity"]) == {_lib.TOBII_VALIDITY_VALID}
+        assert all(
+            abs(x - offset_x) <= 0.25 for x in columns[f"{side}_gaze_origin_mm_x"]
+        )
+        assert set(columns[f"{side}_eyeball_center_mm_z"]) == {612.0}
+        assert all(3.25 <= d <= 3.75 for d in columns[f"{side}_pupil_diameter_mm"])
+
+
+def test_head_pose(stub: Callable[..., Any]) -> None:
+    device = stub(settings={"OUTPUT_FREQUENCY": 1200})
+    received: list[Any] = []
+    device.subscribe_head_pose(
+        callback=lambda *, timestamp, head_pose: received.append(head_pose)
+    )
+    while not received:
+        device.run_once()
+
+    head_pose = received[0]
+    assert head_pose.position_validity
+    assert head_pose.rotation_validity_xyz == (True, True, True)
+    assert abs(head_pose.position_xyz.x) <= 10.0
+    assert head_pose.position_xyz.z == 600.0
+    assert abs(head_pose.rotation_xyz.x) <= 0.05
+    assert head_pose.rotation_xyz.z == 0.0
+
+    device.unsubscribe_head_pose()
+    buffer = device.subscribe_head_pose_native(capacity=8)
+    while buffer.received <= buffer.capacity:
+        device.run_once()
+
+    columns = device.drain(Stream.HEAD_POSE)
+    timestamps = columns["timestamp_us"].tolist()
+    assert len(timestamps) == 8
+    assert timestamps == sorted(timestamps)
+    assert buffer.dropped == buffer.received - 8
+    for name in ["position_validity", *(f"rotation_validity_{a}" for a in "xyz")]:
+        assert set(columns[name]) == {_lib.TOBII_VALIDITY_VALID}
+    assert all(abs(x) <= 10.0 for x in columns["position_x"])
+    assert set(columns["position_z"]) == {600.0}
+    assert set(columns["rotation_z"]) == {0.0}
+
+
+@pytest.mark.parametrize(
+    ("subscribe", "timestamp_column"),
+    [
+        ("subscribe_wearable_consumer_data_native", "timestamp_us"),
+        ("subscribe_wearable_advanced_data_native", "timestamp_system_us"),
+    ],
+)
+def test_wearable_data(
+    stub: Callable[..., Any], subscribe: str, timestamp_column: str
+) -> None:
+    device = stub(settings={"OUTPUT_FREQUENCY": 1200})
+    buffer = getattr(device, subscribe)(capacity=8)
+    while buffer.received <= buffer.capacity:
+        device.run_once()
+
+    columns = buffer.drain()
+    timestamps = columns[timestamp_column].tolist()
+    assert len(timestamps) == 8
+    assert timestamps == sorted(timestamps)
+    assert buffer.dropped == buffer.received - 8
+    if "timestamp_tracker_us" in columns:
+        assert columns["timestamp_tracker_us"].tolist() == [
+            timestamp - 1_000_000_000 for timestamp in timestamps
+        ]
+    for side in ["left", "right"]:
+        assert set(columns[f"{side}_blink"]) == {_lib.TOBII_STATE_BOOL_FALSE}
+        assert all(
+            0.45 <= x <= 0.55
+            for x in columns[f"{side}_pupil_position_in_sensor_area_x"]
+        )
+    assert set(columns["gaze_direction_combined_z"]) == {1.0}
+    assert set(columns["convergence_distance_mm"]) == {800.0}
+    assert set(columns["gaze_origin_combined_mm_z"]) == {-20.0}
+
+
+def test_wearable_foveated_gaze(stub: Callable[..., Any]) -> None:
+    device = stub(settings={"OUTPUT_FREQUENCY": 1200})
+    buffer = device.subscribe_wearable_foveated_gaze_native(capacity=8)
+    while buffer.received <= buffer.capacity:
+        device.run_once()
+
+    columns = buffer.drain()
+    assert len(columns["timestamp_us"]) == 8
+    assert set(columns["tracking_state"]) == {FoveatedTrackingState.TRACKING}
+    assert all(abs(x) <= 0.25 for x in columns["gaze_direction_combined_x"])
+    assert set(columns["gaze_direction_combined_z"]) == {1.0}
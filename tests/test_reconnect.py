@@ -0,0 +1,68 @@
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+
+pytest.importorskip("_tobii_stream_engine_cffi")
+
+from tobii_stream_engine import ReconnectSupervisor  # noqa: E402
+from tobii_stream_engine.reconnect import CONNECTION_ERRORS  # noqa: E402
+
+
+def test_recovers_and_resubscribes(stub: Callable[..., Any]) -> None:
+    device = stub(
+        settings={
+            "OUTPUT_FREQUENCY": 1200,
+            "DISCONNECT_INTERVAL_MS": 100,
+            "RECONNECT_DELAY_MS": 30,
+        }
+    )
+    supervisor = ReconnectSupervisor(device, initial_backoff=0.01, max_backoff=0.02)
+
+    # samples by the number of reconnects before they arrived
+    epochs: dict[int, int] = {}
+
+    def on_gaze_point(*, timestamp: int, gaze_point: Any) -> None:
+        reconnects = supervisor.statistics.reconnects
+        epochs[reconnects] = epochs.get(reconnects, 0) + 1
+
+    device.subscribe_gaze_point(callback=on_gaze_point)
+    device.run(supervisor=supervisor, max_duration=0.4)
+
+    statistics = supervisor.statistics
+    assert statistics.disconnects >= 2
+    assert statistics.reconnects == statistics.disconnects
+    # the first attempt comes before the reconnect delay has passed
+    assert statistics.failed_attempts >= statistics.disconnects
+    assert statistics.last_downtime is not None
+    assert statistics.last_downtime >= 0.03
+    assert statistics.total_downtime >= statistics.reconnects * 0.03
+    assert statistics.last_reconnect_latency is not None
+    assert statistics.last_reconnect_latency < statistics.last_downtime
+    # samples kept arriving between reconnects, the run may end before the last
+    assert set(range(statistics.reconnects)) <= set(epochs)
+
+
+def test_gives_up_after_max_attempts(stub: Callable[..., Any]) -> None:
+    device = stub(
+        settings={
+            "OUTPUT_FREQUENCY": 1200,
+            "DISCONNECT_INTERVAL_MS": 50,
+            "RECONNECT_DELAY_MS": 10_000,
+        }
+    )
+    supervisor = ReconnectSupervisor(
+        device, initial_backoff=0.01, backoff_multiplier=3.0, max_attempts=3
+    )
+    device.subscribe_gaze_point(callback=lambda *, timestamp, gaze_point: None)
+
+    with pytest.raises(CONNECTION_ERRORS):
+        device.run(supervisor=supervisor, max_duration=2)
+
+    statistics = supervisor.statistics
+    assert statistics.disconnects == 1
+    assert statistics.reconnects == 0
+    assert statistics.failed_attempts == 3
+    # backoff of 10 ms and 30 ms between the attempts
+    assert statistics.total_downtime >= 0.04
+    assert statistics.last_downtime is None
@@ -0,0 +1,87 @@
+import struct
+from collections.abc import Callable
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+pytest.importorskip("_tobii_stream_engine_cffi")
+
+from tobii_stream_engine import DeviceMetrics, Recorder, Recording  # noqa: E402
+from tobii_stream_engine.recording import (  # noqa: E402
+    HEADER_SIZE,
+    RECORD_COUNT_OFFSET,
+    SEGMENT_SUFFIX,
+)
+
+
+def test_round_trip(stub: Callable[..., Any], tmp_path: Path) -> None:
+    device = stub(settings={"OUTPUT_FREQUENCY": 1200, "PRESENCE_INTERVAL_MS": 50})
+
+    with Recorder(
+        device,
+        tmp_path,
+        streams=("gaze_point", "user_presence"),
+        segment_records=100,
+        flush_interval=0.02,
+    ) as recorder:
+        device.run(max_duration=0.3)
+
+    assert recorder.dropped == {"gaze_point": 0, "user_presence": 0}
+
+    recording = Recording(tmp_path)
+    assert sorted(recording.streams) == ["gaze_point", "user_presence"]
+
+    metadata = recording.metadata
+    assert metadata["device_info"] == asdict(device.get_device_info())
+    assert metadata["output_frequency"] == 1200
+    assert {"major", "minor", "revision", "build"} <= metadata["api_version"].keys()
+
+    segments = recording.segments("gaze_point")
+    assert len(segments) > 2
+    for index, segment in enumerate(segments):
+        assert segment.metadata["segment"] == index
+        assert segment.stream == "gaze_point"
+        assert segment.path.suffix == SEGMENT_SUFFIX
+
+        # rolled over when full, the last segment is truncated to its records
+        if segment is not segments[-1]:
+            assert len(segment) == 100
+        with segment.path.open("rb") as file:
+            file.seek(RECORD_COUNT_OFFSET)
+            (record_count,) = struct.unpack("<Q", file.read(8))
+        assert record_count == len(segment)
+        assert segment.path.stat().st_size == HEADER_SIZE + len(segment.records)
+
+    timestamps = [record[0] for record in recording.records("gaze_point")]
+    assert len(timestamps) == sum(len(segment) for segment in segments)
+    assert timestamps == sorted(set(timestamps))
+
+    presences = list(recording.records("user_presence"))
+    assert presences
+    recording.close()
+
+
+def test_dropped_while_writing_stalls(stub: Callable[..., Any], tmp_path: Path) -> None:
+    metrics = DeviceMetrics()
+    device = stub(settings={"OUTPUT_FREQUENCY": 1200}, metrics=metrics)
+
+    # nothing is written before stopping, so only the newest samples are kept
+    with Recorder(
+        device,
+        tmp_path,
+        streams=("gaze_point",),
+        flush_interval=60,
+        max_pending=50,
+    ) as recorder:
+        device.run(max_duration=0.2)
+
+    received = metrics.snapshot().streams["gaze_point"].samples
+    assert received > 50
+    assert recorder.dropped["gaze_point"] == received - 50
+
+    recording = Recording(tmp_path)
+    (segment,) = recording.segments("gaze_point")
+    assert len(segment) == 50
+    recording.close()
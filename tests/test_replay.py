@@ -0,0 +1,71 @@
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from tobii_stream_engine.recording import _SegmentWriter
+from tobii_stream_engine.replay import ReplayDevice
+
+METADATA = {
+    "device_info": {
+        "serial_number": "replay",
+        "model": "replay",
+        "generation": "replay",
+        "firmware_version": "0",
+    },
+    "output_frequency": 250,
+}
+
+
+@pytest.fixture
+def recording(tmp_path: Path) -> Path:
+    # gaze-points and gaze-origins interleaved, 4 ms apart
+    for stream, offset_us in [("gaze_point", 0), ("gaze_origin", 2000)]:
+        writer = _SegmentWriter(
+            directory=tmp_path, stream=stream, metadata=METADATA, segment_records=8
+        )
+        for index in range(4):
+            timestamp = 1_000_000 + offset_us + index * 4000
+            if stream == "gaze_point":
+                writer.write((timestamp, 1, 0.5, 0.5))
+            else:
+                writer.write((timestamp, 1, -30.0, 0.0, 600.0, 1, 30.0, 0.0, 600.0))
+        writer.close()
+    return tmp_path
+
+
+def test_unsubscribe_during_replay(recording: Path) -> None:
+    device = ReplayDevice(recording, speed=None)
+    gaze_points: list[int] = []
+    gaze_origins: list[int] = []
+
+    def on_gaze_point(*, timestamp: int, gaze_point: Any) -> None:
+        gaze_points.append(timestamp)
+        device.unsubscribe_gaze_origin()
+
+    device.subscribe_gaze_point(callback=on_gaze_point)
+    device.subscribe_gaze_origin(
+        callback=lambda *, timestamp, gaze_origin: gaze_origins.append(timestamp)
+    )
+
+    # records merged before unsubscribing are skipped
+    assert device.run() == 8
+    assert len(gaze_points) == 4
+    assert gaze_origins == []
+
+
+def test_stop_event_interrupts_pacing(recording: Path) -> None:
+    # the second gaze-point is due 4 s after the first one
+    device = ReplayDevice(recording, speed=0.001)
+    stop_event = threading.Event()
+
+    def on_gaze_point(*, timestamp: int, gaze_point: Any) -> None:
+        threading.Timer(0.05, stop_event.set).start()
+
+    device.subscribe_gaze_point(callback=on_gaze_point)
+
+    started_at = time.monotonic()
+    assert device.run(stop_event=stop_event) == 1
+    assert time.monotonic() - started_at < 1
@@ -0,0 +1,98 @@
+import json
+import logging
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("_tobii_stream_engine_cffi")
+
+from tobii_stream_engine.capabilities import Capability  # noqa: E402
+from tobii_stream_engine.samples import DeviceInfo  # noqa: E402
+from tobii_stream_engine.streams import Stream  # noqa: E402
+from tobii_stream_engine.support import (  # noqa: E402
+    CACHE_VERSION,
+    DeviceSupport,
+    SupportCache,
+    bits_of,
+)
+
+DEVICE_INFO = DeviceInfo(
+    serial_number="IS404-100107417574",
+    model="IS4_Large_Peripheral",
+    generation="IS4",
+    firmware_version="2.27.0-4014386",
+)
+
+SUPPORT = DeviceSupport(
+    capabilities=1 << Capability.CALIBRATION_3D,
+    streams=1 << Stream.GAZE_POINT | 1 << Stream.GAZE_ORIGIN,
+)
+
+
+def test_device_support() -> None:
+    assert SUPPORT.supports_stream(Stream.GAZE_POINT)
+    assert not SUPPORT.supports_stream(Stream.HEAD_POSE)
+    assert SUPPORT.supported_streams == [Stream.GAZE_POINT, Stream.GAZE_ORIGIN]
+    assert SUPPORT.supported_capabilities == [Capability.CALIBRATION_3D]
+
+
+def test_missing_file(tmp_path: Path) -> None:
+    assert SupportCache(tmp_path / "support.json").get(DEVICE_INFO) is None
+
+
+def test_roundtrip(tmp_path: Path) -> None:
+    path = tmp_path / "cache" / "support.json"
+    SupportCache(path).put(DEVICE_INFO, SUPPORT)
+
+    assert SupportCache(path).get(DEVICE_INFO) == SUPPORT
+    assert [p.name for p in path.parent.iterdir()] == ["support.json"]
+
+
+def test_keyed_by_firmware(tmp_path: Path) -> None:
+    cache = SupportCache(tmp_path / "support.json")
+    cache.put(DEVICE_INFO, SUPPORT)
+
+    updated = DeviceInfo(
+        serial_number=DEVICE_INFO.serial_number,
+        model=DEVICE_INFO.model,
+        generation=DEVICE_INFO.generation,
+        firmware_version="2.28.0-0",
+    )
+    assert cache.get(updated) is None
+
+
+def test_new_enum_members_invalidate(tmp_path: Path) -> None:
+    path = tmp_path / "support.json"
+    SupportCache(path).put(DEVICE_INFO, SUPPORT)
+
+    content = json.loads(path.read_text())
+    for entry in content["devices"].values():
+        entry["probed_streams"] = bits_of(Stream) >> 1
+    path.write_text(json.dumps(content))
+
+    assert SupportCache(path).get(DEVICE_INFO) is None
+
+
+def test_other_version_is_ignored(tmp_path: Path) -> None:
+    path = tmp_path / "support.json"
+    SupportCache(path).put(DEVICE_INFO, SUPPORT)
+
+    content = json.loads(path.read_text())
+    content["version"] = CACHE_VERSION + 1
+    path.write_text(json.dumps(content))
+
+    assert SupportCache(path).get(DEVICE_INFO) is None
+
+
+def test_unreadable_file(tmp_path: Path, caplog: pytest.LogCaptureFixture) -> None:
+    path = tmp_path / "support.json"
+    path.write_text("{")
+
+    cache = SupportCache(path)
+    with caplog.at_level(logging.WARNING):
+        assert cache.get(DEVICE_INFO) is None
+    assert "ignoring unreadable support cache" in caplog.text
+
+    # rewritten on the next put
+    cache.put(DEVICE_INFO, SUPPORT)
+    assert SupportCache(path).get(DEVICE_INFO) == SUPPORT
@@ -0,0 +1,77 @@
+import array
+
+import pytest
+
+from tobii_stream_engine import SyncportLog
+from tobii_stream_engine.buffers import Columns, to_structured_array
+
+# markers toggled every 100 ms, gaze-points every 10 ms
+MARKERS = [(1_000_000, 1), (1_100_000, 0), (1_200_000, 1), (1_300_000, 0)]
+
+
+@pytest.fixture
+def log() -> SyncportLog:
+    log = SyncportLog()
+    for timestamp, signal in MARKERS:
+        log(timestamp=timestamp, signal=signal, timestamp_tracker_us=timestamp - 500)
+    return log
+
+
+@pytest.fixture
+def samples() -> Columns:
+    timestamps = range(950_000, 1_350_000, 10_000)
+    return {
+        "timestamp_us": array.array("q", timestamps),
+        "x": array.array("f", [index / 64 for index in range(len(timestamps))]),
+    }
+
+
+def test_log(log: SyncportLog) -> None:
+    assert len(log) == 4
+    assert log.timestamp(2) == 1_200_000
+
+    columns = log.columns
+    assert columns["signal"].tolist() == [1, 0, 1, 0]
+    assert columns["timestamp_tracker_us"][0] == 999_500
+
+    # copies, logging more markers does not change them
+    log(timestamp=1_400_000, signal=1, timestamp_tracker_us=1_399_500)
+    assert len(columns["timestamp_us"]) == 4
+
+
+def test_find(log: SyncportLog) -> None:
+    assert log.find(1) == 0
+    assert log.find(0) == 1
+    assert log.find(1, start=1) == 2
+    assert log.find(0, start=2) == 3
+
+    with pytest.raises(ValueError, match="no sync-port signal 1 logged from index 3"):
+        log.find(1, start=3)
+    with pytest.raises(ValueError, match="no sync-port signal 2"):
+        log.find(2)
+
+
+def test_samples_between_columns(log: SyncportLog, samples: Columns) -> None:
+    first = log.find(1)
+    between = log.samples_between(samples, first, log.find(0, start=first))
+
+    # the start marker is included, the end marker excluded
+    timestamps = between["timestamp_us"].tolist()
+    assert timestamps == list(range(1_000_000, 1_100_000, 10_000))
+    assert between["x"].tolist() == [index / 64 for index in range(5, 15)]
+
+    assert log.samples_between(samples, 3, 3)["timestamp_us"].tolist() == []
+
+
+def test_samples_between_numpy(log: SyncportLog, samples: Columns) -> None:
+    pytest.importorskip("numpy")
+
+    structured = to_structured_array(samples)
+    between = log.samples_between(structured, 0, 2)
+
+    assert between["timestamp_us"].tolist() == list(range(1_000_000, 1_200_000, 10_000))
+    # a view, not a copy
+    assert between.base is not None
+
+    columns = log.samples_between(samples, 0, 2)
+    assert between["x"].tolist() == columns["x"].tolist()
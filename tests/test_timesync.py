@@ -0,0 +1,73 @@
+import pytest
+
+from tobii_stream_engine.timesync import ClockModel, fit_clock_model
+
+
+def pairs(offset_us: float, drift: float, count: int = 16) -> list[tuple[int, int]]:
+    reference_us = 5_000_000
+    return [
+        (
+            reference_us + step,
+            reference_us + step + round(offset_us + drift * step),
+        )
+        for step in range(0, count * 1_000_000, 1_000_000)
+    ]
+
+
+def test_fit_exact() -> None:
+    model = fit_clock_model(pairs(offset_us=2_500, drift=100e-6))
+
+    assert model.reference_us == 5_000_000
+    assert model.offset_us == pytest.approx(2_500, abs=0.5)
+    assert model.drift_ppm == pytest.approx(100, abs=0.01)
+    assert model.residual_us == pytest.approx(0, abs=0.5)
+    assert model.samples == 16
+
+
+def test_fit_single_sample() -> None:
+    model = fit_clock_model([(1_000, 1_750)])
+
+    assert model.offset_us == 750
+    assert model.drift == 0
+    assert model.residual_us == 0
+
+
+def test_fit_noise() -> None:
+    noisy = [
+        (system_us, host_us + (40 if index % 2 else -40))
+        for index, (system_us, host_us) in enumerate(pairs(offset_us=-300, drift=0))
+    ]
+    model = fit_clock_model(noisy)
+
+    assert model.offset_us == pytest.approx(-300, abs=10)
+    assert model.residual_us == pytest.approx(40, abs=1)
+
+
+def test_fit_empty() -> None:
+    with pytest.raises(ValueError, match="at least one sample"):
+        fit_clock_model([])
+
+
+def test_to_host() -> None:
+    model = ClockModel(
+        reference_us=1_000_000,
+        offset_us=500.0,
+        drift=50e-6,
+        residual_us=0.0,
+        samples=2,
+    )
+
+    assert model.to_host(1_000_000) == 1_000_500
+    assert model.to_host(3_000_000) == 3_000_600
+    assert model.to_host(0) == 450
+
+
+def test_to_host_array() -> None:
+    numpy = pytest.importorskip("numpy")
+
+    model = fit_clock_model(pairs(offset_us=1_234, drift=-20e-6))
+    timestamps = numpy.arange(0, 40_000_000, 999_983, dtype=numpy.int64)
+
+    assert model.to_host_array(timestamps).tolist() == [
+        model.to_host(int(timestamp)) for timestamp in timestamps
+    ]
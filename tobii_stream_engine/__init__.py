@@ -1,31 +1,195 @@
-from tobii_stream_engine.api import Api, ApiVersion, get_api_version
-from tobii_stream_engine.capabilities import Capability
-from tobii_stream_engine.device import (
-    Device,
-    DeviceInfo,
-    EyePosition,
-    GazeOrigin,
-    GazePoint,
-    PositionXY,
-    PositionXYZ,
-    UserPresence,
-)
-from tobii_stream_engine.errors import TobiiError
-from tobii_stream_engine.streams import Stream
+import importlib
+
+# importing typing alone would double the cost of importing the package
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Any
+
+    from tobii_stream_engine.aio import OverflowPolicy, SampleStream
+    from tobii_stream_engine.api import Api, ApiVersion, get_api_version
+    from tobii_stream_engine.buffers import GazePointBuffer
+    from tobii_stream_engine.capabilities import Capability
+    from tobii_stream_engine.config import DeviceConfigCache
+    from tobii_stream_engine.device import (
+        Device,
+        FoveatedTrackingState,
+        Notification,
+        NotificationType,
+    )
+    from tobii_stream_engine.dispatch import Dispatcher, DispatchStatistics
+    from tobii_stream_engine.errors import TobiiError
+    from tobii_stream_engine.events import (
+        DispersionThresholdDetector,
+        GazeEvent,
+        GazeEventType,
+        VelocityThresholdDetector,
+    )
+    from tobii_stream_engine.fanout import Fanout, FanoutConsumer, SlowConsumerPolicy
+    from tobii_stream_engine.frames import Frame, FrameAssembler
+    from tobii_stream_engine.group import DeviceGroup
+    from tobii_stream_engine.metrics import (
+        DeviceMetrics,
+        HistogramSnapshot,
+        MetricsSnapshot,
+        StreamMetricsSnapshot,
+    )
+    from tobii_stream_engine.reconnect import ReconnectStatistics, ReconnectSupervisor
+    from tobii_stream_engine.recording import Recorder
+    from tobii_stream_engine.replay import Recording, ReplayDevice
+    from tobii_stream_engine.samples import (
+        CompactEyePosition,
+        CompactGazeOrigin,
+        CompactGazePoint,
+        DeviceInfo,
+        DisplayArea,
+        EyePosition,
+        GazeData,
+        GazeDataEye,
+        GazeOrigin,
+        GazePoint,
+        HeadPose,
+        PositionXY,
+        PositionXYZ,
+        RotationXYZ,
+        TrackBox,
+        UserPresence,
+    )
+    from tobii_stream_engine.streams import Stream
+    from tobii_stream_engine.support import DeviceSupport, SupportCache
+    from tobii_stream_engine.syncport import SyncportLog
+    from tobii_stream_engine.timesync import ClockModel, TimesyncScheduler
+
+# submodules are imported on first attribute access, so tools that only read
+# recordings never load the native library
+_exports = {
+    "Api": "tobii_stream_engine.api",
+    "ApiVersion": "tobii_stream_engine.api",
+    "Capability": "tobii_stream_engine.capabilities",
+    "ClockModel": "tobii_stream_engine.timesync",
+    "CompactEyePosition": "tobii_stream_engine.samples",
+    "CompactGazeOrigin": "tobii_stream_engine.samples",
+    "CompactGazePoint": "tobii_stream_engine.samples",
+    "Device": "tobii_stream_engine.device",
+    "DeviceConfigCache": "tobii_stream_engine.config",
+    "DeviceGroup": "tobii_stream_engine.group",
+    "DeviceInfo": "tobii_stream_engine.samples",
+    "DeviceMetrics": "tobii_stream_engine.metrics",
+    "DeviceSupport": "tobii_stream_engine.support",
+    "DispatchStatistics": "tobii_stream_engine.dispatch",
+    "Dispatcher": "tobii_stream_engine.dispatch",
+    "DispersionThresholdDetector": "tobii_stream_engine.events",
+    "DisplayArea": "tobii_stream_engine.samples",
+    "EyePosition": "tobii_stream_engine.samples",
+    "Fanout": "tobii_stream_engine.fanout",
+    "FanoutConsumer": "tobii_stream_engine.fanout",
+    "FoveatedTrackingState": "tobii_stream_engine.device",
+    "Frame": "tobii_stream_engine.frames",
+    "FrameAssembler": "tobii_stream_engine.frames",
+    "GazeData": "tobii_stream_engine.samples",
+    "GazeDataEye": "tobii_stream_engine.samples",
+    "GazeEvent": "tobii_stream_engine.events",
+    "GazeEventType": "tobii_stream_engine.events",
+    "GazeOrigin": "tobii_stream_engine.samples",
+    "GazePoint": "tobii_stream_engine.samples",
+    "GazePointBuffer": "tobii_stream_engine.buffers",
+    "HeadPose": "tobii_stream_engine.samples",
+    "HistogramSnapshot": "tobii_stream_engine.metrics",
+    "MetricsSnapshot": "tobii_stream_engine.metrics",
+    "Notification": "tobii_stream_engine.device",
+    "NotificationType": "tobii_stream_engine.device",
+    "OverflowPolicy": "tobii_stream_engine.aio",
+    "PositionXY": "tobii_stream_engine.samples",
+    "PositionXYZ": "tobii_stream_engine.samples",
+    "ReconnectStatistics": "tobii_stream_engine.reconnect",
+    "ReconnectSupervisor": "tobii_stream_engine.reconnect",
+    "Recorder": "tobii_stream_engine.recording",
+    "Recording": "tobii_stream_engine.replay",
+    "ReplayDevice": "tobii_stream_engine.replay",
+    "RotationXYZ": "tobii_stream_engine.samples",
+    "SampleStream": "tobii_stream_engine.aio",
+    "SlowConsumerPolicy": "tobii_stream_engine.fanout",
+    "Stream": "tobii_stream_engine.streams",
+    "StreamMetricsSnapshot": "tobii_stream_engine.metrics",
+    "SupportCache": "tobii_stream_engine.support",
+    "SyncportLog": "tobii_stream_engine.syncport",
+    "TimesyncScheduler": "tobii_stream_engine.timesync",
+    "TobiiError": "tobii_stream_engine.errors",
+    "TrackBox": "tobii_stream_engine.samples",
+    "UserPresence": "tobii_stream_engine.samples",
+    "VelocityThresholdDetector": "tobii_stream_engine.events",
+    "get_api_version": "tobii_stream_engine.api",
+}
 
 __all__ = [
     "Api",
     "ApiVersion",
     "Capability",
+    "ClockModel",
+    "CompactEyePosition",
+    "CompactGazeOrigin",
+    "CompactGazePoint",
     "Device",
+    "DeviceConfigCache",
+    "DeviceGroup",
     "DeviceInfo",
+    "DeviceMetrics",
+    "DeviceSupport",
+    "DispatchStatistics",
+    "Dispatcher",
+    "DispersionThresholdDetector",
+    "DisplayArea",
     "EyePosition",
+    "Fanout",
+    "FanoutConsumer",
+    "FoveatedTrackingState",
+    "Frame",
+    "FrameAssembler",
+    "GazeData",
+    "GazeDataEye",
+    "GazeEvent",
+    "GazeEventType",
     "GazeOrigin",
     "GazePoint",
+    "GazePointBuffer",
+    "HeadPose",
+    "HistogramSnapshot",
+    "MetricsSnapshot",
+    "Notification",
+    "NotificationType",
+    "OverflowPolicy",
     "PositionXY",
     "PositionXYZ",
+    "ReconnectStatistics",
+    "ReconnectSupervisor",
+    "Recorder",
+    "Recording",
+    "ReplayDevice",
+    "RotationXYZ",
+    "SampleStream",
+    "SlowConsumerPolicy",
     "Stream",
+    "StreamMetricsSnapshot",
+    "SupportCache",
+    "SyncportLog",
+    "TimesyncScheduler",
     "TobiiError",
+    "TrackBox",
     "UserPresence",
+    "VelocityThresholdDetector",
     "get_api_version",
 ]
+
+
+def __getattr__(name: str) -> "Any":
+    try:
+        module_name = _exports[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
@@ -0,0 +1,243 @@
+import asyncio
+import enum
+import logging
+import threading
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from types import TracebackType
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
+
+if TYPE_CHECKING:
+    from tobii_stream_engine.device import Device
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class OverflowPolicy(enum.Enum):
+    DROP_OLDEST = enum.auto()
+    BLOCK = enum.auto()
+
+
+class StreamWorker:
+    # one per device, processes callbacks for all of its open sample-streams
+    def __init__(self, device: "Device", loop: asyncio.AbstractEventLoop) -> None:
+        self._device = device
+        self._loop = loop
+        self._executor = ThreadPoolExecutor(
+            max_workers=1,
+            thread_name_prefix=f"tobii-stream-engine {device._url}",
+        )
+        self._stop = threading.Event()
+
+        # guards _streams and the queue-sizes of blocking streams
+        self._space = threading.Condition()
+        self._streams: list[SampleStream[Any]] = []
+
+        logger.debug(f"{device._url}: starting sample-stream worker")
+
+        self._future = loop.run_in_executor(self._executor, self._run)
+
+    @classmethod
+    def attach(cls, stream: "SampleStream[Any]") -> "StreamWorker":
+        device = stream._device
+        loop = asyncio.get_running_loop()
+
+        worker = device._stream_worker
+        if worker is None:
+            worker = device._stream_worker = cls(device, loop)
+        elif worker._loop is not loop:
+            raise RuntimeError(
+                f"{device._url}: sample-streams are bound to another event-loop"
+            )
+
+        with worker._space:
+            worker._streams.append(stream)
+
+        return worker
+
+    async def detach(self, stream: "SampleStream[Any]") -> None:
+        with self._space:
+            self._streams.remove(stream)
+            if not self._streams:
+                self._stop.set()
+            self._space.notify_all()
+
+        if not self._stop.is_set():
+            return
+
+        logger.debug(f"{self._device._url}: stopping sample-stream worker")
+
+        await asyncio.wait([self._future])
+
+        with self._space:
+            if self._streams and self._device._stream_worker is self:
+                # a stream was opened while stopping
+                self._stop.clear()
+                self._future = self._loop.run_in_executor(self._executor, self._run)
+                return
+
+        if self._device._stream_worker is self:
+            self._device._stream_worker = None
+        self._executor.shutdown(wait=False)
+
+    def _run(self) -> None:
+        try:
+            while not self._stop.is_set():
+                self._device.run_once()
+
+                with self._space:
+                    streams = list(self._streams)
+
+                for stream in streams:
+                    if stream._batch:
+                        batch, stream._batch = stream._batch, []
+                        self._hand_over(stream, batch)
+        except BaseException as error:
+            self._loop.call_soon_threadsafe(self._fail, error)
+
+    def _hand_over(self, stream: "SampleStream[Any]", batch: list[Any]) -> None:
+        if stream._overflow is OverflowPolicy.BLOCK:
+            # processing stops until the consumer catches up
+            with self._space:
+                while (
+                    stream._queued
+                    and stream._queued + len(batch) > stream._maxsize
+                    and not stream._closed.is_set()
+                    and not self._stop.is_set()
+                ):
+                    self._space.wait()
+                stream._queued += len(batch)
+
+        self._loop.call_soon_threadsafe(stream._deliver, batch)
+
+    def _fail(self, error: BaseException) -> None:
+        if self._device._stream_worker is self:
+            self._device._stream_worker = None
+
+        with self._space:
+            streams = list(self._streams)
+
+        for stream in streams:
+            stream._fail(error)
+
+
+class SampleStream(Generic[T]):
+    def __init__(
+        self,
+        device: "Device",
+        unsubscribe: Callable[[], None],
+        maxsize: int,
+        overflow: OverflowPolicy,
+    ) -> None:
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+
+        self._device = device
+        self._unsubscribe = unsubscribe
+        self._maxsize = maxsize
+        self._overflow = overflow
+
+        self._worker: StreamWorker | None = None
+        self._closed = threading.Event()
+
+        # owned by the worker thread
+        self._batch: list[tuple[int, T]] = []
+
+        # owned by the event-loop
+        self._samples: deque[tuple[int, T]] = deque()
+        self._available = asyncio.Event()
+        self._error: BaseException | None = None
+        self._dropped = 0
+
+        # shared, guarded by the worker's _space
+        self._queued = 0
+
+    @property
+    def dropped(self) -> int:
+        return self._dropped
+
+    def _push(self, timestamp: int, sample: T) -> None:
+        self._batch.append((timestamp, sample))
+
+    def _start(self) -> None:
+        if self._worker is not None or self._closed.is_set():
+            return
+
+        self._worker = StreamWorker.attach(self)
+
+    def _deliver(self, batch: list[tuple[int, T]]) -> None:
+        if self._closed.is_set():
+            return
+
+        self._samples.extend(batch)
+
+        if self._overflow is OverflowPolicy.DROP_OLDEST:
+            overflow = len(self._samples) - self._maxsize
+            for _ in range(overflow):
+                self._samples.popleft()
+            if overflow > 0:
+                self._dropped += overflow
+
+        self._available.set()
+
+    def _fail(self, error: BaseException) -> None:
+        self._error = error
+        self._available.set()
+
+    def _consumed(self) -> None:
+        if self._overflow is not OverflowPolicy.BLOCK or self._worker is None:
+            return
+
+        with self._worker._space:
+            self._queued -= 1
+            self._worker._space.notify_all()
+
+    def __aiter__(self) -> "SampleStream[T]":
+        self._start()
+        return self
+
+    async def __anext__(self) -> tuple[int, T]:
+        self._start()
+
+        while not self._samples:
+            if self._error is not None:
+                raise self._error
+            if self._closed.is_set():
+                raise StopAsyncIteration
+            self._available.clear()
+            await self._available.wait()
+
+        sample = self._samples.popleft()
+        self._consumed()
+        return sample
+
+    async def aclose(self) -> None:
+        if self._closed.is_set():
+            return
+
+        logger.debug(f"{self._device._url}: closing sample-stream")
+
+        self._closed.set()
+        self._available.set()
+
+        if self._worker is not None:
+            await self._worker.detach(self)
+
+        # the worker of other streams may still be processing callbacks
+        with self._device._process_lock:
+            self._unsubscribe()
+
+    async def __aenter__(self) -> "SampleStream[T]":
+        self._start()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        await self.aclose()
@@ -0,0 +1,251 @@
+import array
+import threading
+from collections.abc import Mapping
+from typing import TYPE_CHECKING, Any, Protocol
+
+if TYPE_CHECKING:
+    import numpy
+    import numpy.typing
+
+Columns = dict[str, array.array]  # type: ignore[type-arg]
+
+GAZE_POINT_COLUMNS = {
+    "timestamp_us": "q",
+    "validity": "B",
+    "x": "f",
+    "y": "f",
+}
+
+GAZE_ORIGIN_COLUMNS = {
+    "timestamp_us": "q",
+    "left_validity": "B",
+    "left_x": "f",
+    "left_y": "f",
+    "left_z": "f",
+    "right_validity": "B",
+    "right_x": "f",
+    "right_y": "f",
+    "right_z": "f",
+}
+
+EYE_POSITION_COLUMNS = GAZE_ORIGIN_COLUMNS
+
+GAZE_DATA_EYE_COLUMNS = {
+    "gaze_origin_validity": "B",
+    "gaze_origin_mm_x": "f",
+    "gaze_origin_mm_y": "f",
+    "gaze_origin_mm_z": "f",
+    "gaze_origin_normalized_x": "f",
+    "gaze_origin_normalized_y": "f",
+    "gaze_origin_normalized_z": "f",
+    "gaze_point_validity": "B",
+    "gaze_point_mm_x": "f",
+    "gaze_point_mm_y": "f",
+    "gaze_point_mm_z": "f",
+    "gaze_point_x": "f",
+    "gaze_point_y": "f",
+    "eyeball_center_validity": "B",
+    "eyeball_center_mm_x": "f",
+    "eyeball_center_mm_y": "f",
+    "eyeball_center_mm_z": "f",
+    "pupil_validity": "B",
+    "pupil_diameter_mm": "f",
+}
+
+GAZE_DATA_COLUMNS = {
+    "timestamp_tracker_us": "q",
+    "timestamp_system_us": "q",
+    **{f"left_{name}": typecode for name, typecode in GAZE_DATA_EYE_COLUMNS.items()},
+    **{f"right_{name}": typecode for name, typecode in GAZE_DATA_EYE_COLUMNS.items()},
+}
+
+HEAD_POSE_COLUMNS = {
+    "timestamp_us": "q",
+    "position_validity": "B",
+    "position_x": "f",
+    "position_y": "f",
+    "position_z": "f",
+    "rotation_validity_x": "B",
+    "rotation_validity_y": "B",
+    "rotation_validity_z": "B",
+    "rotation_x": "f",
+    "rotation_y": "f",
+    "rotation_z": "f",
+}
+
+WEARABLE_EYE_COLUMNS = {
+    "pupil_position_in_sensor_area_validity": "B",
+    "pupil_position_in_sensor_area_x": "f",
+    "pupil_position_in_sensor_area_y": "f",
+    "position_guide_validity": "B",
+    "position_guide_x": "f",
+    "position_guide_y": "f",
+    "blink_validity": "B",
+    "blink": "B",
+}
+
+WEARABLE_COMBINED_COLUMNS = {
+    "gaze_origin_combined_validity": "B",
+    "gaze_origin_combined_mm_x": "f",
+    "gaze_origin_combined_mm_y": "f",
+    "gaze_origin_combined_mm_z": "f",
+    "gaze_direction_combined_validity": "B",
+    "gaze_direction_combined_x": "f",
+    "gaze_direction_combined_y": "f",
+    "gaze_direction_combined_z": "f",
+    "convergence_distance_validity": "B",
+    "convergence_distance_mm": "f",
+    "improve_user_position_hmd": "B",
+    "increase_eye_relief": "B",
+}
+
+WEARABLE_CONSUMER_DATA_COLUMNS = {
+    "timestamp_us": "q",
+    **{f"left_{name}": typecode for name, typecode in WEARABLE_EYE_COLUMNS.items()},
+    **{f"right_{name}": typecode for name, typecode in WEARABLE_EYE_COLUMNS.items()},
+    **WEARABLE_COMBINED_COLUMNS,
+}
+
+WEARABLE_ADVANCED_DATA_COLUMNS = {
+    "timestamp_tracker_us": "q",
+    "timestamp_system_us": "q",
+    **{f"left_{name}": typecode for name, typecode in WEARABLE_EYE_COLUMNS.items()},
+    **{f"right_{name}": typecode for name, typecode in WEARABLE_EYE_COLUMNS.items()},
+    **WEARABLE_COMBINED_COLUMNS,
+}
+
+WEARABLE_FOVEATED_GAZE_COLUMNS = {
+    "timestamp_us": "q",
+    "tracking_state": "B",
+    "gaze_direction_combined_x": "f",
+    "gaze_direction_combined_y": "f",
+    "gaze_direction_combined_z": "f",
+}
+
+USER_PRESENCE_COLUMNS = {
+    "timestamp_us": "q",
+    "user_presence": "B",
+}
+
+DIGITAL_SYNCPORT_COLUMNS = {
+    "timestamp_us": "q",
+    "timestamp_tracker_us": "q",
+    "signal": "I",
+}
+
+
+def to_structured_array(columns: Columns) -> "numpy.typing.NDArray[Any]":
+    try:
+        import numpy  # noqa: PLC0415
+    except ImportError as error:
+        raise ImportError(
+            "structured arrays require numpy, install 'tobii-stream-engine[numpy]'"
+        ) from error
+
+    dtype = numpy.dtype([(name, column.typecode) for name, column in columns.items()])
+    size = min((len(column) for column in columns.values()), default=0)
+
+    structured_array = numpy.empty(size, dtype=dtype)
+    for name, column in columns.items():
+        structured_array[name] = numpy.frombuffer(column, dtype=column.typecode)[:size]
+
+    return structured_array
+
+
+class SampleBuffer(Protocol):
+    @property
+    def capacity(self) -> int:
+        ...
+
+    @property
+    def received(self) -> int:
+        ...
+
+    @property
+    def dropped(self) -> int:
+        ...
+
+    def __len__(self) -> int:
+        ...
+
+    def drain(self) -> Columns:
+        ...
+
+
+class RingBuffer:
+    def __init__(self, columns: Mapping[str, str], capacity: int) -> None:
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+
+        self._capacity = capacity
+        self._columns: Columns = {
+            name: array.array(typecode, [0]) * capacity
+            for name, typecode in columns.items()
+        }
+        self._head = 0
+        self._size = 0
+        self._received = 0
+        self._dropped = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    @property
+    def received(self) -> int:
+        return self._received
+
+    @property
+    def dropped(self) -> int:
+        return self._dropped
+
+    def _full(self) -> bool:
+        # like the native buffers, the newest sample is dropped when full
+        self._received += 1
+        if self._size == self._capacity:
+            self._dropped += 1
+            return True
+        return False
+
+    def _advance(self) -> None:
+        head = self._head + 1
+        self._head = 0 if head == self._capacity else head
+        self._size += 1
+
+    def drain(self) -> Columns:
+        with self._lock:
+            size = self._size
+            start = self._head - size
+            columns: Columns = {}
+            for name, column in self._columns.items():
+                if start >= 0:
+                    columns[name] = column[start : self._head]
+                else:
+                    columns[name] = column[start:] + column[: self._head]
+            self._size = 0
+
+        return columns
+
+
+class GazePointBuffer(RingBuffer):
+    def __init__(self, capacity: int) -> None:
+        super().__init__(columns=GAZE_POINT_COLUMNS, capacity=capacity)
+        self._timestamp_us = self._columns["timestamp_us"]
+        self._validity = self._columns["validity"]
+        self._x = self._columns["x"]
+        self._y = self._columns["y"]
+
+    def _push(self, timestamp_us: int, validity: int, x: float, y: float) -> None:
+        with self._lock:
+            if self._full():
+                return
+            head = self._head
+            self._timestamp_us[head] = timestamp_us
+            self._validity[head] = validity
+            self._x[head] = x
+            self._y[head] = y
+            self._advance()
@@ -6,6 +6,7 @@ from cffi import FFI
 MODULE_NAME = "_tobii_stream_engine_cffi"
 
 INCLUDE_DIR = Path(__file__).parent / "include"
+NATIVE_DIR = Path(__file__).parent / "native"
 INCLUDE_FILES = [
     "typedefs.h",
     "tobii.h",
@@ -15,12 +16,26 @@ INCLUDE_FILES = [
     "tobii_config.h",
     "tobii_advanced.h",
 ]
+NATIVE_INCLUDE_FILES = [
+    "native_buffers.h",
+]
+NATIVE_SOURCE_FILES = [
+    "native_buffers.c",
+]
 
 CDEF = """
     extern "Python" void gaze_point_callback( tobii_gaze_point_t*, void* );
+    extern "Python" void gaze_point_buffered_callback( tobii_gaze_point_t*, void* );
+    extern "Python" void gaze_point_compact_callback( tobii_gaze_point_t*, void* );
     extern "Python" void gaze_origin_callback( tobii_gaze_origin_t*, void* );
+    extern "Python" void gaze_origin_compact_callback( tobii_gaze_origin_t*, void* );
     extern "Python" void eye_position_normalized_callback( tobii_eye_position_normalized_t*, void* );
+    extern "Python" void eye_position_normalized_compact_callback(
+        tobii_eye_position_normalized_t*, void* );
+    extern "Python" void gaze_data_callback( tobii_gaze_data_t*, void* );
+    extern "Python" void head_pose_callback( tobii_head_pose_t*, void* );
     extern "Python" void user_presence_callback( tobii_user_presence_status_t, int64_t, void* );
+    extern "Python" void digital_syncport_callback( uint32_t, int64_t, int64_t, void* );
     extern "Python" void notification_callback( tobii_notification_t*, void* );
 """
 
@@ -32,6 +47,11 @@ for include in INCLUDE_FILES:
     cdef += include_path.read_text() + "\n"
     source += f'#include "{include_path.name}"\n'
 
+for include in NATIVE_INCLUDE_FILES:
+    include_path = NATIVE_DIR / include
+    cdef += include_path.read_text() + "\n"
+    source += f'#include "{include_path.name}"\n'
+
 library_dirs = [
     "/lib",
     "/usr/local/lib",
@@ -46,8 +66,13 @@ ffibuilder.cdef(cdef + CDEF)
 ffibuilder.set_source(
     module_name=MODULE_NAME,
     source=source,
+    sources=[
+        str((NATIVE_DIR / source_file).absolute())
+        for source_file in NATIVE_SOURCE_FILES
+    ],
     include_dirs=[
         str(INCLUDE_DIR.absolute()),
+        str(NATIVE_DIR.absolute()),
     ],
     libraries=["tobii_research"],
     library_dirs=library_dirs,
@@ -0,0 +1,35 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+STUB_DIR = Path(__file__).parent / "stub"
+INCLUDE_DIR = Path(__file__).parent / "include"
+LIBRARY_NAME = "libtobii_research.so"
+
+
+def build_stub(output_dir: Path) -> Path:
+    output_dir.mkdir(parents=True, exist_ok=True)
+    output_path = output_dir / LIBRARY_NAME
+
+    compiler = os.environ.get("CC", "cc")
+    command = [
+        compiler,
+        "-shared",
+        "-fPIC",
+        "-O2",
+        "-Wall",
+        f"-I{INCLUDE_DIR.absolute()}",
+        "-o",
+        str(output_path),
+        str(STUB_DIR / "tobii_research.c"),
+        "-lm",
+    ]
+    subprocess.run(command, check=True)
+
+    return output_path
+
+
+if __name__ == "__main__":
+    output_dir = Path(sys.argv[1]) if len(sys.argv) > 1 else Path("build/stub")
+    print(build_stub(output_dir))
@@ -0,0 +1,353 @@
+/*
+Single-producer/single-consumer ring-buffers.
+
+The producer is the stream callback invoked by tobii_device_process_callbacks,
+the consumer is the python thread draining the buffer. When the buffer is
+full the newest record is dropped, so the producer never touches the read
+index.
+*/
+
+#include <stdatomic.h>
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+#include "typedefs.h"
+#include "native_buffers.h"
+
+struct native_buffer_t
+{
+    size_t record_size;
+    size_t capacity;
+    _Atomic uint64_t write_index;
+    _Atomic uint64_t read_index;
+    _Atomic uint64_t dropped;
+    unsigned char* records;
+};
+
+native_buffer_t* native_buffer_create( size_t record_size, size_t capacity )
+{
+    if( record_size == 0 || capacity == 0 )
+        return NULL;
+
+    native_buffer_t* buffer = calloc( 1, sizeof( native_buffer_t ) );
+    if( !buffer )
+        return NULL;
+
+    buffer->records = calloc( capacity, record_size );
+    if( !buffer->records )
+    {
+        free( buffer );
+        return NULL;
+    }
+
+    buffer->record_size = record_size;
+    buffer->capacity = capacity;
+    atomic_init( &buffer->write_index, 0 );
+    atomic_init( &buffer->read_index, 0 );
+    atomic_init( &buffer->dropped, 0 );
+
+    return buffer;
+}
+
+void native_buffer_destroy( native_buffer_t* buffer )
+{
+    if( !buffer )
+        return;
+
+    free( buffer->records );
+    free( buffer );
+}
+
+size_t native_buffer_capacity( native_buffer_t* buffer )
+{
+    return buffer->capacity;
+}
+
+size_t native_buffer_size( native_buffer_t* buffer )
+{
+    uint64_t write = atomic_load_explicit( &buffer->write_index, memory_order_acquire );
+    uint64_t read = atomic_load_explicit( &buffer->read_index, memory_order_relaxed );
+    return (size_t)( write - read );
+}
+
+uint64_t native_buffer_received( native_buffer_t* buffer )
+{
+    return atomic_load_explicit( &buffer->write_index, memory_order_relaxed ) +
+        atomic_load_explicit( &buffer->dropped, memory_order_relaxed );
+}
+
+uint64_t native_buffer_dropped( native_buffer_t* buffer )
+{
+    return atomic_load_explicit( &buffer->dropped, memory_order_relaxed );
+}
+
+static void native_buffer_push( native_buffer_t* buffer, void const* record )
+{
+    uint64_t write = atomic_load_explicit( &buffer->write_index, memory_order_relaxed );
+    uint64_t read = atomic_load_explicit( &buffer->read_index, memory_order_acquire );
+
+    if( write - read >= buffer->capacity )
+    {
+        atomic_fetch_add_explicit( &buffer->dropped, 1, memory_order_relaxed );
+        return;
+    }
+
+    memcpy( buffer->records + ( write % buffer->capacity ) * buffer->record_size,
+        record, buffer->record_size );
+    atomic_store_explicit( &buffer->write_index, write + 1, memory_order_release );
+}
+
+static size_t native_buffer_begin_drain( native_buffer_t* buffer, size_t max_count,
+    uint64_t* read )
+{
+    uint64_t write = atomic_load_explicit( &buffer->write_index, memory_order_acquire );
+    *read = atomic_load_explicit( &buffer->read_index, memory_order_relaxed );
+
+    size_t count = (size_t)( write - *read );
+    return count < max_count ? count : max_count;
+}
+
+static void const* native_buffer_record( native_buffer_t* buffer, uint64_t index )
+{
+    return buffer->records + ( index % buffer->capacity ) * buffer->record_size;
+}
+
+static void native_buffer_end_drain( native_buffer_t* buffer, uint64_t read )
+{
+    atomic_store_explicit( &buffer->read_index, read, memory_order_release );
+}
+
+void native_gaze_point_callback( tobii_gaze_point_t const* gaze_point, void* user_data )
+{
+    native_buffer_push( (native_buffer_t*)user_data, gaze_point );
+}
+
+void native_gaze_origin_callback( tobii_gaze_origin_t const* gaze_origin, void* user_data )
+{
+    native_buffer_push( (native_buffer_t*)user_data, gaze_origin );
+}
+
+void native_eye_position_normalized_callback(
+    tobii_eye_position_normalized_t const* eye_position, void* user_data )
+{
+    native_buffer_push( (native_buffer_t*)user_data, eye_position );
+}
+
+#define NATIVE_VALID( validity ) ( ( validity ) == TOBII_VALIDITY_VALID )
+
+#define NATIVE_GAZE_DATA_EYE( record, side, eye ) \
+    do \
+    { \
+        ( record ).side##_gaze_origin_validity = NATIVE_VALID( ( eye ).gaze_origin_validity ); \
+        ( record ).side##_gaze_origin_mm_x = ( eye ).gaze_origin_from_eye_tracker_mm_xyz[ 0 ]; \
+        ( record ).side##_gaze_origin_mm_y = ( eye ).gaze_origin_from_eye_tracker_mm_xyz[ 1 ]; \
+        ( record ).side##_gaze_origin_mm_z = ( eye ).gaze_origin_from_eye_tracker_mm_xyz[ 2 ]; \
+        ( record ).side##_gaze_origin_normalized_x = ( eye ).gaze_origin_in_track_box_normalized_xyz[ 0 ]; \
+        ( record ).side##_gaze_origin_normalized_y = ( eye ).gaze_origin_in_track_box_normalized_xyz[ 1 ]; \
+        ( record ).side##_gaze_origin_normalized_z = ( eye ).gaze_origin_in_track_box_normalized_xyz[ 2 ]; \
+        ( record ).side##_gaze_point_validity = NATIVE_VALID( ( eye ).gaze_point_validity ); \
+        ( record ).side##_gaze_point_mm_x = ( eye ).gaze_point_from_eye_tracker_mm_xyz[ 0 ]; \
+        ( record ).side##_gaze_point_mm_y = ( eye ).gaze_point_from_eye_tracker_mm_xyz[ 1 ]; \
+        ( record ).side##_gaze_point_mm_z = ( eye ).gaze_point_from_eye_tracker_mm_xyz[ 2 ]; \
+        ( record ).side##_gaze_point_x = ( eye ).gaze_point_on_display_normalized_xy[ 0 ]; \
+        ( record ).side##_gaze_point_y = ( eye ).gaze_point_on_display_normalized_xy[ 1 ]; \
+        ( record ).side##_eyeball_center_validity = NATIVE_VALID( ( eye ).eyeball_center_validity ); \
+        ( record ).side##_eyeball_center_mm_x = ( eye ).eyeball_center_from_eye_tracker_mm_xyz[ 0 ]; \
+        ( record ).side##_eyeball_center_mm_y = ( eye ).eyeball_center_from_eye_tracker_mm_xyz[ 1 ]; \
+        ( record ).side##_eyeball_center_mm_z = ( eye ).eyeball_center_from_eye_tracker_mm_xyz[ 2 ]; \
+        ( record ).side##_pupil_validity = NATIVE_VALID( ( eye ).pupil_validity ); \
+        ( record ).side##_pupil_diameter_mm = ( eye ).pupil_diameter_mm; \
+    } while( 0 )
+
+void native_gaze_data_callback( tobii_gaze_data_t const* gaze_data, void* user_data )
+{
+    native_gaze_data_record_t record;
+    record.timestamp_tracker_us = gaze_data->timestamp_tracker_us;
+    record.timestamp_system_us = gaze_data->timestamp_system_us;
+    NATIVE_GAZE_DATA_EYE( record, left, gaze_data->left );
+    NATIVE_GAZE_DATA_EYE( record, right, gaze_data->right );
+
+    native_buffer_push( (native_buffer_t*)user_data, &record );
+}
+
+void native_head_pose_callback( tobii_head_pose_t const* head_pose, void* user_data )
+{
+    native_head_pose_record_t record;
+    record.timestamp_us = head_pose->timestamp_us;
+    record.position_validity = NATIVE_VALID( head_pose->position_validity );
+    record.position_x = head_pose->position_xyz[ 0 ];
+    record.position_y = head_pose->position_xyz[ 1 ];
+    record.position_z = head_pose->position_xyz[ 2 ];
+    record.rotation_validity_x = NATIVE_VALID( head_pose->rotation_validity_xyz[ 0 ] );
+    record.rotation_validity_y = NATIVE_VALID( head_pose->rotation_validity_xyz[ 1 ] );
+    record.rotation_validity_z = NATIVE_VALID( head_pose->rotation_validity_xyz[ 2 ] );
+    record.rotation_x = head_pose->rotation_xyz[ 0 ];
+    record.rotation_y = head_pose->rotation_xyz[ 1 ];
+    record.rotation_z = head_pose->rotation_xyz[ 2 ];
+
+    native_buffer_push( (native_buffer_t*)user_data, &record );
+}
+
+#define NATIVE_WEARABLE_EYE( record, side, eye ) \
+    do \
+    { \
+        ( record ).side##_pupil_position_in_sensor_area_validity = \
+            NATIVE_VALID( ( eye ).pupil_position_in_sensor_area_validity ); \
+        ( record ).side##_pupil_position_in_sensor_area_x = ( eye ).pupil_position_in_sensor_area_xy[ 0 ]; \
+        ( record ).side##_pupil_position_in_sensor_area_y = ( eye ).pupil_position_in_sensor_area_xy[ 1 ]; \
+        ( record ).side##_position_guide_validity = NATIVE_VALID( ( eye ).position_guide_validity ); \
+        ( record ).side##_position_guide_x = ( eye ).position_guide_xy[ 0 ]; \
+        ( record ).side##_position_guide_y = ( eye ).position_guide_xy[ 1 ]; \
+        ( record ).side##_blink_validity = NATIVE_VALID( ( eye ).blink_validity ); \
+        ( record ).side##_blink = ( eye ).blink == TOBII_STATE_BOOL_TRUE; \
+    } while( 0 )
+
+#define NATIVE_WEARABLE_COMBINED( record, data ) \
+    do \
+    { \
+        ( record ).gaze_origin_combined_validity = NATIVE_VALID( ( data ).gaze_origin_combined_validity ); \
+        ( record ).gaze_origin_combined_mm_x = ( data ).gaze_origin_combined_mm_xyz[ 0 ]; \
+        ( record ).gaze_origin_combined_mm_y = ( data ).gaze_origin_combined_mm_xyz[ 1 ]; \
+        ( record ).gaze_origin_combined_mm_z = ( data ).gaze_origin_combined_mm_xyz[ 2 ]; \
+        ( record ).gaze_direction_combined_validity = \
+            NATIVE_VALID( ( data ).gaze_direction_combined_validity ); \
+        ( record ).gaze_direction_combined_x = ( data ).gaze_direction_combined_normalized_xyz[ 0 ]; \
+        ( record ).gaze_direction_combined_y = ( data ).gaze_direction_combined_normalized_xyz[ 1 ]; \
+        ( record ).gaze_direction_combined_z = ( data ).gaze_direction_combined_normalized_xyz[ 2 ]; \
+        ( record ).convergence_distance_validity = NATIVE_VALID( ( data ).convergence_distance_validity ); \
+        ( record ).convergence_distance_mm = ( data ).convergence_distance_mm; \
+        ( record ).improve_user_position_hmd = NATIVE_VALID( ( data ).improve_user_position_hmd ); \
+        ( record ).increase_eye_relief = ( data ).increase_eye_relief == TOBII_STATE_BOOL_TRUE; \
+    } while( 0 )
+
+void native_wearable_consumer_data_callback(
+    tobii_wearable_consumer_data_t const* data, void* user_data )
+{
+    native_wearable_consumer_data_record_t record;
+    record.timestamp_us = data->timestamp_us;
+    NATIVE_WEARABLE_EYE( record, left, data->left );
+    NATIVE_WEARABLE_EYE( record, right, data->right );
+    NATIVE_WEARABLE_COMBINED( record, *data );
+
+    native_buffer_push( (native_buffer_t*)user_data, &record );
+}
+
+void native_wearable_advanced_data_callback(
+    tobii_wearable_advanced_data_t const* data, void* user_data )
+{
+    native_wearable_advanced_data_record_t record;
+    record.timestamp_tracker_us = data->timestamp_tracker_us;
+    record.timestamp_system_us = data->timestamp_system_us;
+    NATIVE_WEARABLE_EYE( record, left, data->left );
+    NATIVE_WEARABLE_EYE( record, right, data->right );
+    NATIVE_WEARABLE_COMBINED( record, *data );
+
+    native_buffer_push( (native_buffer_t*)user_data, &record );
+}
+
+void native_wearable_foveated_gaze_callback(
+    tobii_wearable_foveated_gaze_t const* data, void* user_data )
+{
+    native_wearable_foveated_gaze_record_t record;
+    record.timestamp_us = data->timestamp_us;
+    record.tracking_state = (uint8_t)data->tracking_state;
+    record.gaze_direction_combined_x = data->gaze_direction_combined_normalized_xyz[ 0 ];
+    record.gaze_direction_combined_y = data->gaze_direction_combined_normalized_xyz[ 1 ];
+    record.gaze_direction_combined_z = data->gaze_direction_combined_normalized_xyz[ 2 ];
+
+    native_buffer_push( (native_buffer_t*)user_data, &record );
+}
+
+size_t native_buffer_drain_columns( native_buffer_t* buffer, size_t max_count,
+    size_t column_count, size_t const* offsets, size_t const* sizes,
+    void* const* columns )
+{
+    uint64_t read;
+    size_t count = native_buffer_begin_drain( buffer, max_count, &read );
+
+    for( size_t i = 0; i < count; ++i )
+    {
+        unsigned char const* record = native_buffer_record( buffer, read + i );
+        for( size_t column = 0; column < column_count; ++column )
+        {
+            memcpy( (unsigned char*)columns[ column ] + i * sizes[ column ],
+                record + offsets[ column ], sizes[ column ] );
+        }
+    }
+
+    native_buffer_end_drain( buffer, read + count );
+    return count;
+}
+
+size_t native_gaze_point_drain( native_buffer_t* buffer, size_t max_count,
+    int64_t* timestamp_us, uint8_t* validity, float* x, float* y )
+{
+    uint64_t read;
+    size_t count = native_buffer_begin_drain( buffer, max_count, &read );
+
+    for( size_t i = 0; i < count; ++i )
+    {
+        tobii_gaze_point_t const* record = native_buffer_record( buffer, read + i );
+        timestamp_us[ i ] = record->timestamp_us;
+        validity[ i ] = record->validity == TOBII_VALIDITY_VALID;
+        x[ i ] = record->position_xy[ 0 ];
+        y[ i ] = record->position_xy[ 1 ];
+    }
+
+    native_buffer_end_drain( buffer, read + count );
+    return count;
+}
+
+size_t native_gaze_origin_drain( native_buffer_t* buffer, size_t max_count,
+    int64_t* timestamp_us,
+    uint8_t* left_validity, float* left_x, float* left_y, float* left_z,
+    uint8_t* right_validity, float* right_x, float* right_y, float* right_z )
+{
+    uint64_t read;
+    size_t count = native_buffer_begin_drain( buffer, max_count, &read );
+
+    for( size_t i = 0; i < count; ++i )
+    {
+        tobii_gaze_origin_t const* record = native_buffer_record( buffer, read + i );
+        timestamp_us[ i ] = record->timestamp_us;
+        left_validity[ i ] = record->left_validity == TOBII_VALIDITY_VALID;
+        left_x[ i ] = record->left_xyz[ 0 ];
+        left_y[ i ] = record->left_xyz[ 1 ];
+        left_z[ i ] = record->left_xyz[ 2 ];
+        right_validity[ i ] = record->right_validity == TOBII_VALIDITY_VALID;
+        right_x[ i ] = record->right_xyz[ 0 ];
+        right_y[ i ] = record->right_xyz[ 1 ];
+        right_z[ i ] = record->right_xyz[ 2 ];
+    }
+
+    native_buffer_end_drain( buffer, read + count );
+    return count;
+}
+
+size_t native_eye_position_normalized_drain( native_buffer_t* buffer, size_t max_count,
+    int64_t* timestamp_us,
+    uint8_t* left_validity, float* left_x, float* left_y, float* left_z,
+    uint8_t* right_validity, float* right_x, float* right_y, float* right_z )
+{
+    uint64_t read;
+    size_t count = native_buffer_begin_drain( buffer, max_count, &read );
+
+    for( size_t i = 0; i < count; ++i )
+    {
+        tobii_eye_position_normalized_t const* record =
+            native_buffer_record( buffer, read + i );
+        timestamp_us[ i ] = record->timestamp_us;
+        left_validity[ i ] = record->left_validity == TOBII_VALIDITY_VALID;
+        left_x[ i ] = record->left_xyz[ 0 ];
+        left_y[ i ] = record->left_xyz[ 1 ];
+        left_z[ i ] = record->left_xyz[ 2 ];
+        right_validity[ i ] = record->right_validity == TOBII_VALIDITY_VALID;
+        right_x[ i ] = record->right_xyz[ 0 ];
+        right_y[ i ] = record->right_xyz[ 1 ];
+        right_z[ i ] = record->right_xyz[ 2 ];
+    }
+
+    native_buffer_end_drain( buffer, read + count );
+    return count;
+}
@@ -0,0 +1,198 @@
+// ring-buffers filled by native stream callbacks, drained from python
+
+typedef struct native_buffer_t native_buffer_t;
+
+// flattened records for streams drained through native_buffer_drain_columns,
+// field names match the python column names
+
+typedef struct native_gaze_data_record_t
+{
+    int64_t timestamp_tracker_us;
+    int64_t timestamp_system_us;
+
+    uint8_t left_gaze_origin_validity;
+    float left_gaze_origin_mm_x;
+    float left_gaze_origin_mm_y;
+    float left_gaze_origin_mm_z;
+    float left_gaze_origin_normalized_x;
+    float left_gaze_origin_normalized_y;
+    float left_gaze_origin_normalized_z;
+    uint8_t left_gaze_point_validity;
+    float left_gaze_point_mm_x;
+    float left_gaze_point_mm_y;
+    float left_gaze_point_mm_z;
+    float left_gaze_point_x;
+    float left_gaze_point_y;
+    uint8_t left_eyeball_center_validity;
+    float left_eyeball_center_mm_x;
+    float left_eyeball_center_mm_y;
+    float left_eyeball_center_mm_z;
+    uint8_t left_pupil_validity;
+    float left_pupil_diameter_mm;
+
+    uint8_t right_gaze_origin_validity;
+    float right_gaze_origin_mm_x;
+    float right_gaze_origin_mm_y;
+    float right_gaze_origin_mm_z;
+    float right_gaze_origin_normalized_x;
+    float right_gaze_origin_normalized_y;
+    float right_gaze_origin_normalized_z;
+    uint8_t right_gaze_point_validity;
+    float right_gaze_point_mm_x;
+    float right_gaze_point_mm_y;
+    float right_gaze_point_mm_z;
+    float right_gaze_point_x;
+    float right_gaze_point_y;
+    uint8_t right_eyeball_center_validity;
+    float right_eyeball_center_mm_x;
+    float right_eyeball_center_mm_y;
+    float right_eyeball_center_mm_z;
+    uint8_t right_pupil_validity;
+    float right_pupil_diameter_mm;
+} native_gaze_data_record_t;
+
+typedef struct native_head_pose_record_t
+{
+    int64_t timestamp_us;
+    uint8_t position_validity;
+    float position_x;
+    float position_y;
+    float position_z;
+    uint8_t rotation_validity_x;
+    uint8_t rotation_validity_y;
+    uint8_t rotation_validity_z;
+    float rotation_x;
+    float rotation_y;
+    float rotation_z;
+} native_head_pose_record_t;
+
+typedef struct native_wearable_consumer_data_record_t
+{
+    int64_t timestamp_us;
+
+    uint8_t left_pupil_position_in_sensor_area_validity;
+    float left_pupil_position_in_sensor_area_x;
+    float left_pupil_position_in_sensor_area_y;
+    uint8_t left_position_guide_validity;
+    float left_position_guide_x;
+    float left_position_guide_y;
+    uint8_t left_blink_validity;
+    uint8_t left_blink;
+
+    uint8_t right_pupil_position_in_sensor_area_validity;
+    float right_pupil_position_in_sensor_area_x;
+    float right_pupil_position_in_sensor_area_y;
+    uint8_t right_position_guide_validity;
+    float right_position_guide_x;
+    float right_position_guide_y;
+    uint8_t right_blink_validity;
+    uint8_t right_blink;
+
+    uint8_t gaze_origin_combined_validity;
+    float gaze_origin_combined_mm_x;
+    float gaze_origin_combined_mm_y;
+    float gaze_origin_combined_mm_z;
+    uint8_t gaze_direction_combined_validity;
+    float gaze_direction_combined_x;
+    float gaze_direction_combined_y;
+    float gaze_direction_combined_z;
+    uint8_t convergence_distance_validity;
+    float convergence_distance_mm;
+    uint8_t improve_user_position_hmd;
+    uint8_t increase_eye_relief;
+} native_wearable_consumer_data_record_t;
+
+typedef struct native_wearable_advanced_data_record_t
+{
+    int64_t timestamp_tracker_us;
+    int64_t timestamp_system_us;
+
+    uint8_t left_pupil_position_in_sensor_area_validity;
+    float left_pupil_position_in_sensor_area_x;
+    float left_pupil_position_in_sensor_area_y;
+    uint8_t left_position_guide_validity;
+    float left_position_guide_x;
+    float left_position_guide_y;
+    uint8_t left_blink_validity;
+    uint8_t left_blink;
+
+    uint8_t right_pupil_position_in_sensor_area_validity;
+    float right_pupil_position_in_sensor_area_x;
+    float right_pupil_position_in_sensor_area_y;
+    uint8_t right_position_guide_validity;
+    float right_position_guide_x;
+    float right_position_guide_y;
+    uint8_t right_blink_validity;
+    uint8_t right_blink;
+
+    uint8_t gaze_origin_combined_validity;
+    float gaze_origin_combined_mm_x;
+    float gaze_origin_combined_mm_y;
+    float gaze_origin_combined_mm_z;
+    uint8_t gaze_direction_combined_validity;
+    float gaze_direction_combined_x;
+    float gaze_direction_combined_y;
+    float gaze_direction_combined_z;
+    uint8_t convergence_distance_validity;
+    float convergence_distance_mm;
+    uint8_t improve_user_position_hmd;
+    uint8_t increase_eye_relief;
+} native_wearable_advanced_data_record_t;
+
+typedef struct native_wearable_foveated_gaze_record_t
+{
+    int64_t timestamp_us;
+    uint8_t tracking_state;
+    float gaze_direction_combined_x;
+    float gaze_direction_combined_y;
+    float gaze_direction_combined_z;
+} native_wearable_foveated_gaze_record_t;
+
+native_buffer_t* native_buffer_create( size_t record_size, size_t capacity );
+
+void native_buffer_destroy( native_buffer_t* buffer );
+
+size_t native_buffer_capacity( native_buffer_t* buffer );
+
+size_t native_buffer_size( native_buffer_t* buffer );
+
+uint64_t native_buffer_received( native_buffer_t* buffer );
+
+uint64_t native_buffer_dropped( native_buffer_t* buffer );
+
+void native_gaze_point_callback( tobii_gaze_point_t const* gaze_point, void* user_data );
+
+void native_gaze_origin_callback( tobii_gaze_origin_t const* gaze_origin, void* user_data );
+
+void native_eye_position_normalized_callback(
+    tobii_eye_position_normalized_t const* eye_position, void* user_data );
+
+void native_gaze_data_callback( tobii_gaze_data_t const* gaze_data, void* user_data );
+
+void native_head_pose_callback( tobii_head_pose_t const* head_pose, void* user_data );
+
+void native_wearable_consumer_data_callback(
+    tobii_wearable_consumer_data_t const* data, void* user_data );
+
+void native_wearable_advanced_data_callback(
+    tobii_wearable_advanced_data_t const* data, void* user_data );
+
+void native_wearable_foveated_gaze_callback(
+    tobii_wearable_foveated_gaze_t const* data, void* user_data );
+
+size_t native_buffer_drain_columns( native_buffer_t* buffer, size_t max_count,
+    size_t column_count, size_t const* offsets, size_t const* sizes,
+    void* const* columns );
+
+size_t native_gaze_point_drain( native_buffer_t* buffer, size_t max_count,
+    int64_t* timestamp_us, uint8_t* validity, float* x, float* y );
+
+size_t native_gaze_origin_drain( native_buffer_t* buffer, size_t max_count,
+    int64_t* timestamp_us,
+    uint8_t* left_validity, float* left_x, float* left_y, float* left_z,
+    uint8_t* right_validity, float* right_x, float* right_y, float* right_z );
+
+size_t native_eye_position_normalized_drain( native_buffer_t* buffer, size_t max_count,
+    int64_t* timestamp_us,
+    uint8_t* left_validity, float* left_x, float* left_y, float* left_z,
+    uint8_t* right_validity, float* right_x, float* right_y, float* right_z );
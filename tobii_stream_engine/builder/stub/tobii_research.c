@@ -0,0 +1,1299 @@
+/*
+Stub of libtobii_research.so for building and exercising the bindings
+without an eye tracker. Devices produce synthetic samples at their output
+frequency.
+
+Environment variables:
+    TOBII_STUB_DEVICE_COUNT             number of enumerated devices (default 1)
+    TOBII_STUB_OUTPUT_FREQUENCY         initial output frequency in Hz (default 250)
+    TOBII_STUB_BUFFER_SAMPLES           samples buffered between two calls of
+                                        tobii_device_process_callbacks, older
+                                        samples are dropped (default 0, unbounded)
+    TOBII_STUB_DROPOUT_INTERVAL_MS      mark samples invalid once every interval
+    TOBII_STUB_DROPOUT_DURATION_MS      duration of each validity dropout
+    TOBII_STUB_PRESENCE_INTERVAL_MS     toggle user presence every interval
+    TOBII_STUB_DISCONNECT_INTERVAL_MS   simulate a lost connection every interval
+    TOBII_STUB_RECONNECT_DELAY_MS       time until tobii_device_reconnect succeeds
+    TOBII_STUB_SYNCPORT_INTERVAL_MS     toggle the digital sync-port signal every
+                                        interval
+    TOBII_STUB_CLOCK_DRIFT_PPM          rate of the system clock relative to
+                                        CLOCK_MONOTONIC in parts per million
+*/
+
+#include <math.h>
+#include <stddef.h>
+#include <stdint.h>
+#include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
+#include <time.h>
+
+#include "typedefs.h"
+#include "tobii.h"
+#include "tobii_streams.h"
+#include "tobii_wearable.h"
+#include "tobii_licensing.h"
+#include "tobii_config.h"
+#include "tobii_advanced.h"
+
+#define STUB_URL_PREFIX "tobii-stub://"
+#define STUB_WAIT_TIMEOUT_US 100000
+#define STUB_DEFAULT_OUTPUT_FREQUENCY 250.0f
+#define STUB_PI 3.14159265358979323846
+#define STUB_TRACKER_CLOCK_OFFSET_US -1000000000LL
+
+struct tobii_api_t
+{
+    tobii_custom_log_t log;
+};
+
+struct tobii_device_t
+{
+    tobii_api_t* api;
+    char url[ 256 ];
+    float output_frequency;
+
+    int64_t start_us;
+    int64_t sample_index;
+    int64_t buffer_samples;
+
+    int64_t dropout_interval_us;
+    int64_t dropout_duration_us;
+
+    int64_t presence_interval_us;
+    int64_t next_presence_us;
+    tobii_user_presence_status_t presence_status;
+
+    int64_t syncport_interval_us;
+    int64_t next_syncport_us;
+    uint32_t syncport_signal;
+
+    int connected;
+    int64_t disconnect_interval_us;
+    int64_t reconnect_delay_us;
+    int64_t next_disconnect_us;
+    int64_t disconnected_at_us;
+
+    tobii_gaze_point_callback_t gaze_point_callback;
+    void* gaze_point_user_data;
+
+    tobii_gaze_origin_callback_t gaze_origin_callback;
+    void* gaze_origin_user_data;
+
+    tobii_eye_position_normalized_callback_t eye_position_callback;
+    void* eye_position_user_data;
+
+    tobii_gaze_data_callback_t gaze_data_callback;
+    void* gaze_data_user_data;
+
+    tobii_head_pose_callback_t head_pose_callback;
+    void* head_pose_user_data;
+
+    tobii_wearable_consumer_data_callback_t wearable_consumer_data_callback;
+    void* wearable_consumer_data_user_data;
+
+    tobii_wearable_advanced_data_callback_t wearable_advanced_data_callback;
+    void* wearable_advanced_data_user_data;
+
+    tobii_wearable_foveated_gaze_callback_t wearable_foveated_gaze_callback;
+    void* wearable_foveated_gaze_user_data;
+
+    tobii_user_presence_callback_t user_presence_callback;
+    void* user_presence_user_data;
+    int user_presence_pending;
+
+    tobii_digital_syncport_callback_t digital_syncport_callback;
+    void* digital_syncport_user_data;
+
+    tobii_display_area_t display_area;
+
+    tobii_notifications_callback_t notifications_callback;
+    void* notifications_user_data;
+    int framerate_changed_pending;
+    int display_area_changed_pending;
+};
+
+static int64_t stub_env_int( char const* name, int64_t default_value )
+{
+    char const* value = getenv( name );
+    if( !value || !*value )
+        return default_value;
+
+    return strtoll( value, NULL, 10 );
+}
+
+static int64_t stub_clock_us( void )
+{
+    static double rate = 0.0;
+    if( rate == 0.0 )
+        rate = 1.0 + (double)stub_env_int( "TOBII_STUB_CLOCK_DRIFT_PPM", 0 ) / 1000000.0;
+
+    struct timespec ts;
+    clock_gettime( CLOCK_MONOTONIC, &ts );
+    int64_t monotonic_us = (int64_t)ts.tv_sec * 1000000 + ts.tv_nsec / 1000;
+    return (int64_t)( (double)monotonic_us * rate );
+}
+
+static void stub_sleep_us( int64_t duration_us )
+{
+    struct timespec ts;
+    ts.tv_sec = duration_us / 1000000;
+    ts.tv_nsec = ( duration_us % 1000000 ) * 1000;
+    nanosleep( &ts, NULL );
+}
+
+static int stub_has_subscriptions( tobii_device_t const* device )
+{
+    return device->gaze_point_callback || device->gaze_origin_callback ||
+        device->eye_position_callback || device->gaze_data_callback ||
+        device->head_pose_callback || device->wearable_consumer_data_callback ||
+        device->wearable_advanced_data_callback ||
+        device->wearable_foveated_gaze_callback || device->user_presence_callback ||
+        device->digital_syncport_callback;
+}
+
+static int64_t stub_sample_timestamp_us( tobii_device_t const* device, int64_t index )
+{
+    return device->start_us + (int64_t)( index * 1000000.0 / device->output_frequency );
+}
+
+static int64_t stub_next_due_us( tobii_device_t const* device )
+{
+    if( device->user_presence_pending )
+        return 0;
+
+    int64_t due_us = stub_sample_timestamp_us( device, device->sample_index );
+    if( device->user_presence_callback && device->next_presence_us < due_us )
+        due_us = device->next_presence_us;
+    if( device->digital_syncport_callback && device->next_syncport_us < due_us )
+        due_us = device->next_syncport_us;
+
+    return due_us;
+}
+
+static void stub_restart_samples( tobii_device_t* device )
+{
+    device->start_us = stub_clock_us();
+    device->sample_index = 0;
+}
+
+static void stub_drop_overflowed_samples( tobii_device_t* device, int64_t now_us )
+{
+    if( device->buffer_samples <= 0 || now_us < device->start_us )
+        return;
+
+    int64_t due_count = (int64_t)( ( now_us - device->start_us ) *
+        (double)device->output_frequency / 1000000.0 ) + 1;
+    if( due_count - device->sample_index > device->buffer_samples )
+        device->sample_index = due_count - device->buffer_samples;
+}
+
+static tobii_validity_t stub_validity( tobii_device_t const* device, int64_t timestamp_us )
+{
+    if( device->dropout_interval_us <= 0 || device->dropout_duration_us <= 0 )
+        return TOBII_VALIDITY_VALID;
+
+    int64_t phase_us = ( timestamp_us - device->start_us ) % device->dropout_interval_us;
+    if( phase_us >= device->dropout_interval_us - device->dropout_duration_us )
+        return TOBII_VALIDITY_INVALID;
+
+    return TOBII_VALIDITY_VALID;
+}
+
+static void stub_schedule_presence( tobii_device_t* device )
+{
+    if( device->presence_interval_us > 0 )
+        device->next_presence_us = stub_clock_us() + device->presence_interval_us;
+    else
+        device->next_presence_us = INT64_MAX;
+}
+
+static void stub_schedule_syncport( tobii_device_t* device )
+{
+    if( device->syncport_interval_us > 0 )
+        device->next_syncport_us = stub_clock_us() + device->syncport_interval_us;
+    else
+        device->next_syncport_us = INT64_MAX;
+}
+
+static void stub_clear_subscriptions( tobii_device_t* device )
+{
+    device->gaze_point_callback = NULL;
+    device->gaze_origin_callback = NULL;
+    device->eye_position_callback = NULL;
+    device->gaze_data_callback = NULL;
+    device->head_pose_callback = NULL;
+    device->wearable_consumer_data_callback = NULL;
+    device->wearable_advanced_data_callback = NULL;
+    device->wearable_foveated_gaze_callback = NULL;
+    device->user_presence_callback = NULL;
+    device->user_presence_pending = 0;
+    device->digital_syncport_callback = NULL;
+    device->notifications_callback = NULL;
+    device->framerate_changed_pending = 0;
+    device->display_area_changed_pending = 0;
+}
+
+static int stub_has_pending_notifications( tobii_device_t const* device )
+{
+    return device->notifications_callback &&
+        ( device->framerate_changed_pending || device->display_area_changed_pending );
+}
+
+static void stub_process_notifications( tobii_device_t* device )
+{
+    if( !device->notifications_callback )
+        return;
+
+    tobii_notification_t notification;
+
+    if( device->framerate_changed_pending )
+    {
+        device->framerate_changed_pending = 0;
+        memset( &notification, 0, sizeof( notification ) );
+        notification.type = TOBII_NOTIFICATION_TYPE_FRAMERATE_CHANGED;
+        notification.value_type = TOBII_NOTIFICATION_VALUE_TYPE_FLOAT;
+        notification.value.float_ = device->output_frequency;
+        device->notifications_callback( &notification, device->notifications_user_data );
+    }
+
+    if( device->display_area_changed_pending )
+    {
+        device->display_area_changed_pending = 0;
+        memset( &notification, 0, sizeof( notification ) );
+        notification.type = TOBII_NOTIFICATION_TYPE_DISPLAY_AREA_CHANGED;
+        notification.value_type = TOBII_NOTIFICATION_VALUE_TYPE_DISPLAY_AREA;
+        notification.value.display_area = device->display_area;
+        device->notifications_callback( &notification, device->notifications_user_data );
+    }
+}
+
+static void stub_set_corner( float* xyz, float x, float y, float z )
+{
+    xyz[ 0 ] = x;
+    xyz[ 1 ] = y;
+    xyz[ 2 ] = z;
+}
+
+static void stub_schedule_disconnect( tobii_device_t* device )
+{
+    if( device->disconnect_interval_us > 0 )
+        device->next_disconnect_us = stub_clock_us() + device->disconnect_interval_us;
+    else
+        device->next_disconnect_us = INT64_MAX;
+}
+
+static void stub_fill_gaze_data_eye( tobii_gaze_data_eye_t* eye,
+    tobii_validity_t validity, float offset_x_mm, float dx, float dy )
+{
+    eye->gaze_origin_validity = validity;
+    eye->gaze_origin_from_eye_tracker_mm_xyz[ 0 ] = offset_x_mm + dx;
+    eye->gaze_origin_from_eye_tracker_mm_xyz[ 1 ] = dy;
+    eye->gaze_origin_from_eye_tracker_mm_xyz[ 2 ] = 600.0f;
+    eye->gaze_origin_in_track_box_normalized_xyz[ 0 ] = 0.5f + offset_x_mm / 600.0f;
+    eye->gaze_origin_in_track_box_normalized_xyz[ 1 ] = 0.5f;
+    eye->gaze_origin_in_track_box_normalized_xyz[ 2 ] = 0.5f;
+
+    eye->gaze_point_validity = validity;
+    eye->gaze_point_from_eye_tracker_mm_xyz[ 0 ] = 1200.0f * dx;
+    eye->gaze_point_from_eye_tracker_mm_xyz[ 1 ] = 100.0f + 700.0f * dy;
+    eye->gaze_point_from_eye_tracker_mm_xyz[ 2 ] = 0.0f;
+    eye->gaze_point_on_display_normalized_xy[ 0 ] = 0.5f + dx;
+    eye->gaze_point_on_display_normalized_xy[ 1 ] = 0.5f + dy;
+
+    eye->eyeball_center_validity = validity;
+    eye->eyeball_center_from_eye_tracker_mm_xyz[ 0 ] = offset_x_mm + dx;
+    eye->eyeball_center_from_eye_tracker_mm_xyz[ 1 ] = dy;
+    eye->eyeball_center_from_eye_tracker_mm_xyz[ 2 ] = 612.0f;
+
+    eye->pupil_validity = validity;
+    eye->pupil_diameter_mm = 3.5f + dx;
+}
+
+static void stub_fill_wearable_eye( tobii_wearable_eye_t* eye,
+    tobii_validity_t validity, float dx, float dy )
+{
+    eye->pupil_position_in_sensor_area_validity = validity;
+    eye->pupil_position_in_sensor_area_xy[ 0 ] = 0.5f + dx * 0.2f;
+    eye->pupil_position_in_sensor_area_xy[ 1 ] = 0.5f + dy * 0.2f;
+    eye->position_guide_validity = validity;
+    eye->position_guide_xy[ 0 ] = 0.5f;
+    eye->position_guide_xy[ 1 ] = 0.5f;
+    eye->blink_validity = TOBII_VALIDITY_VALID;
+    eye->blink = validity == TOBII_VALIDITY_VALID ? TOBII_STATE_BOOL_FALSE : TOBII_STATE_BOOL_TRUE;
+}
+
+#define STUB_FILL_WEARABLE_COMBINED( data, validity, dx, dy ) \
+    do \
+    { \
+        ( data ).gaze_origin_combined_validity = ( validity ); \
+        ( data ).gaze_origin_combined_mm_xyz[ 0 ] = 0.0f; \
+        ( data ).gaze_origin_combined_mm_xyz[ 1 ] = 0.0f; \
+        ( data ).gaze_origin_combined_mm_xyz[ 2 ] = -20.0f; \
+        ( data ).gaze_direction_combined_validity = ( validity ); \
+        ( data ).gaze_direction_combined_normalized_xyz[ 0 ] = ( dx ); \
+        ( data ).gaze_direction_combined_normalized_xyz[ 1 ] = ( dy ); \
+        ( data ).gaze_direction_combined_normalized_xyz[ 2 ] = 1.0f; \
+        ( data ).convergence_distance_validity = ( validity ); \
+        ( data ).convergence_distance_mm = 800.0f; \
+        ( data ).improve_user_position_hmd = TOBII_VALIDITY_INVALID; \
+        ( data ).increase_eye_relief = TOBII_STATE_BOOL_FALSE; \
+    } while( 0 )
+
+static void stub_emit_sample( tobii_device_t* device, int64_t index )
+{
+    int64_t timestamp_us = stub_sample_timestamp_us( device, index );
+    double t = (double)timestamp_us / 1000000.0;
+    float dx = (float)( 0.25 * cos( STUB_PI * t ) );
+    float dy = (float)( 0.25 * sin( STUB_PI * t ) );
+    tobii_validity_t validity = stub_validity( device, timestamp_us );
+
+    if( device->gaze_point_callback )
+    {
+        tobii_gaze_point_t gaze_point;
+        gaze_point.timestamp_us = timestamp_us;
+        gaze_point.validity = validity;
+        gaze_point.position_xy[ 0 ] = 0.5f + dx;
+        gaze_point.position_xy[ 1 ] = 0.5f + dy;
+        device->gaze_point_callback( &gaze_point, device->gaze_point_user_data );
+    }
+
+    if( device->gaze_origin_callback )
+    {
+        tobii_gaze_origin_t gaze_origin;
+        gaze_origin.timestamp_us = timestamp_us;
+        gaze_origin.left_validity = validity;
+        gaze_origin.left_xyz[ 0 ] = -30.0f + dx;
+        gaze_origin.left_xyz[ 1 ] = dy;
+        gaze_origin.left_xyz[ 2 ] = 600.0f;
+        gaze_origin.right_validity = validity;
+        gaze_origin.right_xyz[ 0 ] = 30.0f + dx;
+        gaze_origin.right_xyz[ 1 ] = dy;
+        gaze_origin.right_xyz[ 2 ] = 600.0f;
+        device->gaze_origin_callback( &gaze_origin, device->gaze_origin_user_data );
+    }
+
+    if( device->eye_position_callback )
+    {
+        tobii_eye_position_normalized_t eye_position;
+        eye_position.timestamp_us = timestamp_us;
+        eye_position.left_validity = validity;
+        eye_position.left_xyz[ 0 ] = 0.45f + dx * 0.1f;
+        eye_position.left_xyz[ 1 ] = 0.5f + dy * 0.1f;
+        eye_position.left_xyz[ 2 ] = 0.5f;
+        eye_position.right_validity = validity;
+        eye_position.right_xyz[ 0 ] = 0.55f + dx * 0.1f;
+        eye_position.right_xyz[ 1 ] = 0.5f + dy * 0.1f;
+        eye_position.right_xyz[ 2 ] = 0.5f;
+        device->eye_position_callback( &eye_position, device->eye_position_user_data );
+    }
+
+    if( device->gaze_data_callback )
+    {
+        tobii_gaze_data_t gaze_data;
+        gaze_data.timestamp_tracker_us = timestamp_us + STUB_TRACKER_CLOCK_OFFSET_US;
+        gaze_data.timestamp_system_us = timestamp_us;
+        stub_fill_gaze_data_eye( &gaze_data.left, validity, -30.0f, dx, dy );
+        stub_fill_gaze_data_eye( &gaze_data.right, validity, 30.0f, dx, dy );
+        device->gaze_data_callback( &gaze_data, device->gaze_data_user_data );
+    }
+
+    if( device->head_pose_callback )
+    {
+        tobii_head_pose_t head_pose;
+        head_pose.timestamp_us = timestamp_us;
+        head_pose.position_validity = validity;
+        head_pose.position_xyz[ 0 ] = 40.0f * dx;
+        head_pose.position_xyz[ 1 ] = 40.0f * dy;
+        head_pose.position_xyz[ 2 ] = 600.0f;
+        head_pose.rotation_validity_xyz[ 0 ] = validity;
+        head_pose.rotation_validity_xyz[ 1 ] = validity;
+        head_pose.rotation_validity_xyz[ 2 ] = validity;
+        head_pose.rotation_xyz[ 0 ] = 0.2f * dy;
+        head_pose.rotation_xyz[ 1 ] = 0.2f * dx;
+        head_pose.rotation_xyz[ 2 ] = 0.0f;
+        device->head_pose_callback( &head_pose, device->head_pose_user_data );
+    }
+
+    if( device->wearable_consumer_data_callback )
+    {
+        tobii_wearable_consumer_data_t data;
+        memset( &data, 0, sizeof( data ) );
+        data.timestamp_us = timestamp_us;
+        stub_fill_wearable_eye( &data.left, validity, dx, dy );
+        stub_fill_wearable_eye( &data.right, validity, dx, dy );
+        STUB_FILL_WEARABLE_COMBINED( data, validity, dx, dy );
+        device->wearable_consumer_data_callback( &data,
+            device->wearable_consumer_data_user_data );
+    }
+
+    if( device->wearable_advanced_data_callback )
+    {
+        tobii_wearable_advanced_data_t data;
+        memset( &data, 0, sizeof( data ) );
+        data.timestamp_tracker_us = timestamp_us + STUB_TRACKER_CLOCK_OFFSET_US;
+        data.timestamp_system_us = timestamp_us;
+        stub_fill_wearable_eye( &data.left, validity, dx, dy );
+        stub_fill_wearable_eye( &data.right, validity, dx, dy );
+        STUB_FILL_WEARABLE_COMBINED( data, validity, dx, dy );
+        device->wearable_advanced_data_callback( &data,
+            device->wearable_advanced_data_user_data );
+    }
+
+    if( device->wearable_foveated_gaze_callback )
+    {
+        tobii_wearable_foveated_gaze_t data;
+        data.timestamp_us = timestamp_us;
+        data.tracking_state = validity == TOBII_VALIDITY_VALID
+            ? TOBII_WEARABLE_FOVEATED_TRACKING_STATE_TRACKING
+            : TOBII_WEARABLE_FOVEATED_TRACKING_STATE_LAST_KNOWN;
+        data.gaze_direction_combined_normalized_xyz[ 0 ] = dx;
+        data.gaze_direction_combined_normalized_xyz[ 1 ] = dy;
+        data.gaze_direction_combined_normalized_xyz[ 2 ] = 1.0f;
+        device->wearable_foveated_gaze_callback( &data,
+            device->wearable_foveated_gaze_user_data );
+    }
+}
+
+// tobii.h
+
+char const* tobii_error_message( tobii_error_t error )
+{
+    switch( error )
+    {
+        case TOBII_ERROR_NO_ERROR: return "TOBII_ERROR_NO_ERROR";
+        case TOBII_ERROR_INTERNAL: return "TOBII_ERROR_INTERNAL";
+        case TOBII_ERROR_INSUFFICIENT_LICENSE: return "TOBII_ERROR_INSUFFICIENT_LICENSE";
+        case TOBII_ERROR_NOT_SUPPORTED: return "TOBII_ERROR_NOT_SUPPORTED";
+        case TOBII_ERROR_NOT_AVAILABLE: return "TOBII_ERROR_NOT_AVAILABLE";
+        case TOBII_ERROR_CONNECTION_FAILED: return "TOBII_ERROR_CONNECTION_FAILED";
+        case TOBII_ERROR_TIMED_OUT: return "TOBII_ERROR_TIMED_OUT";
+        case TOBII_ERROR_ALLOCATION_FAILED: return "TOBII_ERROR_ALLOCATION_FAILED";
+        case TOBII_ERROR_INVALID_PARAMETER: return "TOBII_ERROR_INVALID_PARAMETER";
+        case TOBII_ERROR_ALREADY_SUBSCRIBED: return "TOBII_ERROR_ALREADY_SUBSCRIBED";
+        case TOBII_ERROR_NOT_SUBSCRIBED: return "TOBII_ERROR_NOT_SUBSCRIBED";
+        default: return "TOBII_ERROR_UNKNOWN";
+    }
+}
+
+tobii_error_t tobii_get_api_version( tobii_version_t* version )
+{
+    if( !version )
+        return TOBII_ERROR_INVALID_PARAMETER;
+
+    version->major = 0;
+    version->minor = 0;
+    version->revision = 0;
+    version->build = 0;
+    return TOBII_ERROR_NO_ERROR;
+}
+
+tobii_error_t tobii_api_create( tobii_api_t** api,
+    tobii_custom_alloc_t const* custom_alloc, tobii_custom_log_t const* custom_log )
+{
+    (void)custom_alloc;
+
+    if( !api )
+        return TOBII_ERROR_INVALID_PARAMETER;
+
+    *api = calloc( 1, sizeof( tobii_api_t ) );
+    if( !*api )
+        return TOBII_ERROR_ALLOCATION_FAILED;
+
+    if( custom_log )
+        ( *api )->log = *custom_log;
+
+    return TOBII_ERROR_NO_ERROR;
+}
+
+tobii_error_t tobii_api_destroy( tobii_api_t* api )
+{
+    if( !api )
+        return TOBII_ERROR_INVALID_PARAMETER;
+
+    free( api );
+    return TOBII_ERROR_NO_ERROR;
+}
+
+tobii_error_t tobii_enumerate_local_device_urls( tobii_api_t* api,
+    tobii_device_url_receiver_t receiver, void* user_data )
+{
+    if( !api || !receiver )
+        return TOBII_ERROR_INVALID_PARAMETER;
+
+    int64_t device_count = stub_env_int( "TOBII_STUB_DEVICE_COUNT", 1 );
+    for( int64_t i = 0; i < device_count; ++i )
+    {
+        char url[ 64 ];
+        snprintf( url, sizeof( url ), STUB_URL_PREFIX "%lld", (long long)i );
+        receiver( url, user_data );
+    }
+
+    return TOBII_ERROR_NO_ERROR;
+}
+
+tobii_error_t tobii_enumerate_local_device_urls_ex( tobii_api_t* api,
+    tobii_device_url_receiver_t receiver, void* user_data,
+    uint32_t device_generations )
+{
+    (void)device_generations;
+    return tobii_enumerate_local_device_urls( api, receiver, user_data );
+}
+
+tobii_error_t tobii_device_create( tobii_api_t* api, char const* url,
+    tobii_field_of_use_t field_of_use, tobii_device_t** device )
+{
+    (void)field_of_use;
+
+    if( !api || !url || !device )
+        return TOBII_ERROR_INVALID_PARAMETER;
+
+    if( strncmp( url, STUB_URL_PREFIX, strlen( STUB_URL_PREFIX ) ) != 0 )
+        return TOBII_ERROR_CONNECTION_FAILED;
+
+    *device = calloc( 1, sizeof( tobii_device_t ) );
+    if( !*device )
+        return TOBII_ERROR_ALLOCATION_FAILED;
+
+    ( *device )->api = api;
+    snprintf( ( *device )->url, sizeof( ( *device )->url ), "%s", url );
+    ( *device )->output_frequency = (float)stub_env_int(
+        "TOBII_STUB_OUTPUT_FREQUENCY", (int64_t)STUB_DEFAULT_OUTPUT_FREQUENCY );
+    if( ( *device )->output_frequency <= 0.0f )
+        ( *device )->output_frequency = STUB_DEFAULT_OUTPUT_FREQUENCY;
+    ( *device )->buffer_samples = stub_env_int( "TOBII_STUB_BUFFER_SAMPLES", 0 );
+    ( *device )->dropout_interval_us =
+        stub_env_int( "TOBII_STUB_DROPOUT_INTERVAL_MS", 0 ) * 1000;
+    ( *device )->dropout_duration_us =
+        stub_env_int( "TOBII_STUB_DROPOUT_DURATION_MS", 0 ) * 1000;
+    ( *device )->presence_interval_us =
+        stub_env_int( "TOBII_STUB_PRESENCE_INTERVAL_MS", 0 ) * 1000;
+    ( *device )->presence_status = TOBII_USER_PRESENCE_STATUS_PRESENT;
+    ( *device )->syncport_interval_us =
+        stub_env_int( "TOBII_STUB_SYNCPORT_INTERVAL_MS", 0 ) * 1000;
+    ( *device )->connected = 1;
+    ( *device )->disconnect_interval_us =
+        stub_env_int( "TOBII_STUB_DISCONNECT_INTERVAL_MS", 0 ) * 1000;
+    ( *device )->reconnect_delay_us =
+        stub_env_int( "TOBII_STUB_RECONNECT_DELAY_MS", 0 ) * 1000;
+    // a 24" 16:9 screen with the tracker mounted at its bottom edge
+    stub_set_corner( ( *device )->display_area.top_left_mm_xyz, -265.0f, 315.0f, 0.0f );
+    stub_set_corner( ( *device )->display_area.top_right_mm_xyz, 265.0f, 315.0f, 0.0f );
+    stub_set_corner( ( *device )->display_area.bottom_left_mm_xyz, -265.0f, 15.0f, 0.0f );
+    stub_restart_samples( *device );
+    stub_schedule_presence( *device );
+    stub_schedule_syncport( *device );
+    stub_schedule_disconnect( *device );
+
+    return TOBII_ERROR_NO_ERROR;
+}
+
+tobii_error_t tobii_device_destroy( tobii_device_t* device )
+{
+    if( !device )
+        return TOBII_ERROR_INVALID_PARAMETER;
+
+    free( device );
+    return TOBII_ERROR_NO_ERROR;
+}
+
+tobii_error_t tobii_wait_for_callbacks( int device_count, tobii_device_t* const* devices )
+{
+    if( device_count <= 0 || !devices )
+        return TOBII_ERROR_INVALID_PARAMETER;
+
+    int64_t now_us = stub_clock_us();
+    int64_t deadline_us = now_us + STUB_WAIT_TIMEOUT_US;
+    int64_t next_due_us = deadline_us;
+
+    for( int i = 0; i < device_count; ++i )
+    {
+        if( devices[ i ] && !devices[ i ]->connected )
+            return TOBII_ERROR_CONNECTION_FAILED;
+
+        if( devices[ i ] && stub_has_pending_notifications( devices[ i ] ) )
+            next_due_us = now_us;
+
+        if( !devices[ i ] || !stub_has_subscriptions( devices[ i ] ) )
+            continue;
+
+        int64_t due_us = stub_next_due_us( devices[ i ] );
+        if( due_us < next_due_us )
+            next_due_us = due_us;
+    }
+
+    if( next_due_us > now_us )
+        stub_sleep_us( next_due_us - now_us );
+
+    if( next_due_us >= deadline_us )
+        return TOBII_ERROR_TIMED_OUT;
+
+    return TOBII_ERROR_NO_ERROR;
+}
+
+tobii_error_t tobii_device_process_callbacks( tobii_device_t* device )
+{
+    if( !device )
+        return TOBII_ERROR_INVALID_PARAMETER;
+
+    int64_t now_us = stub_clock_us();
+
+    if( device->connected && now_us >= device->next_disconnect_us )
+    {
+        device->connected = 0;
+        device->disconnected_at_us = now_us;
+    }
+
+    if( !device->connected )
+        return TOBII_ERROR_CONNECTION_FAILED;
+
+    stub_process_notifications( device );
+
+    if( now_us >= device->next_presence_us )
+    {
+        device->presence_status =
+            device->presence_status == TOBII_USER_PRESENCE_STATUS_PRESENT
+                ? TOBII_USER_PRESENCE_STATUS_AWAY
+                : TOBII_USER_PRESENCE_STATUS_PRESENT;
+        device->next_presence_us += device->presence_interval_us;
+        device->user_presence_pending = 1;
+    }
+
+    if( device->user_presence_pending && device->user_presence_callback )
+    {
+        device->user_presence_pending = 0;
+        device->user_presence_callback( device->presence_status,
+            now_us, device->user_presence_user_data );
+    }
+
+    // events are stamped with their scheduled time, like a hardware edge
+    while( device->digital_syncport_callback && now_us >= device->next_syncport_us )
+    {
+        int64_t timestamp_us = device->next_syncport_us;
+        device->syncport_signal ^= 1;
+        device->next_syncport_us += device->syncport_interval_us;
+        device->digital_syncport_callback( device->syncport_signal,
+            timestamp_us + STUB_TRACKER_CLOCK_OFFSET_US, timestamp_us,
+            device->digital_syncport_user_data );
+    }
+
+    stub_drop_overflowed_samples( device, now_us );
+
+    while( stub_sample_timestamp_us( device, device->sample_index ) <= now_us )
+    {
+        stub_emit_sample( device, device->sample_index );
+        device->sample_index++;
+    }
+
+    return TOBII_ERROR_NO_ERROR;
+}
+
+tobii_error_t tobii_device_clear_callback_buffers( tobii_device_t* device )
+{
+    if( !device )
+        return TOBII_ERROR_INVALID_PARAMETER;
+
+    stub_restart_samples( device );
+    return TOBII_ERROR_NO_ERROR;
+}
+
+tobii_error_t tobii_device_reconnect( tobii_device_t* device )
+{
+    if( !device )
+        return TOBII_ERROR_INVALID_PARAMETER;
+
+    if( device->connected )
+        return TOBII_ERROR_NO_ERROR;
+
+    if( stub_clock_us() - device->disconnected_at_us < device->reconnect_delay_us )
+        return TOBII_ERROR_CONNECTION_FAILED;
+
+    // a real device loses its subscriptions when the connection drops
+    device->connected = 1;
+    stub_clear_subscriptions( device );
+    stub_restart_samples( device );
+    stub_schedule_disconnect( device );
+    return TOBII_ERROR_NO_ERROR;
+}
+
+tobii_error_t tobii_update_timesync( tobii_device_t* device )
+{
+    if( !device )
+        return TOBII_ERROR_INVALID_PARAMETER;
+
+    return TOBII_ERROR_NO_ERROR;
+}
+
+tobii_error_t tobii_system_clock( tobii_api_t* api, int64_t* timestamp_us )
+{
+    if( !api || !timestamp_us )
+        return TOBII_ERROR_INVALID_PARAMETER;
+
+    *timestamp_us = stub_clock_us();
+    return TOBII_ERROR_NO_ERROR;
+}
+
+tobii_error_t tobii_get_device_info( tobii_device_t* device,
+    tobii_device_info_t* device_info )
+{
+    if( !device || !device_info )
+        return TOBII_ERROR_INVALID_PARAMETER;
+
+    memset( device_info, 0, sizeof( *device_info ) );
+    snprintf( device_info->serial_number, sizeof( device_info->serial_number ),
+        "STUB-%s", device->url + strlen( STUB_URL_PREFIX ) );
+    snprintf( device_info->model, sizeof( device_info->model ), "stub" );
+    snprintf( device_info->generation, sizeof( device_info->generation ), "stub" );
+    snprintf( device_info->firmware_version, sizeof( device_info->firmware_version ), "0.0.0" );
+    return TOBII_ERROR_NO_ERROR;
+}
+
+tobii_error_t tobii_get_track_box( tobii_device_t* device, tobii_track_box_t* track_box )
+{
+    if( !device || !track_box )
+        return TOBII_ERROR_INVALID_PARAMETER;
+
+    stub_set_corner( track_box->front_upper_right_xyz, 150.0f, 150.0f, 500.0f );
+    stub_set_corner( track_box->front_upper_left_xyz, -150.0f, 150.0f, 500.0f );
+    stub_set_corner( track_box->front_lower_left_xyz, -150.0f, -50.0f, 500.0f );
+    stub_set_corner( track_box->front_lower_right_xyz, 150.0f, -50.0f, 500.0f );
+    stub_set_corner( track_box->back_upper_right_xyz, 200.0f, 200.0f, 800.0f );
+    stub_set_corner( track_box->back_upper_left_xyz, -200.0f, 200.0f, 800.0f );
+    stub_set_corner( track_box->back_lower_left_xyz, -200.0f, -100.0f, 800.0f );
+    stub_set_corner( track_box->back_lower_right_xyz, 200.0f, -100.0f, 800.0f );
+    return TOBII_ERROR_NO_ERROR;
+}
+
+tobii_error_t tobii_get_state_bool( tobii_device_t* device, tobii_state_t state,
+    tobii_state_bool_t* value )
+{
+    (void)device;
+    (void)state;
+    (void)value;
+    return TOBII_ERROR_NOT_SUPPORTED;
+}
+
+tobii_error_t tobii_get_state_uint32( tobii_device_t* device, tobii_state_t state,
+    uint32_t* value )
+{
+    (void)device;
+    (void)state;
+    (void)value;
+    return TOBII_ERROR_NOT_SUPPORTED;
+}
+
+tobii_error_t tobii_get_state_string( tobii_device_t* device, tobii_state_t state,
+    tobii_state_string_t value )
+{
+    (void)device;
+    (void)state;
+    (void)value;
+    return TOBII_ERROR_NOT_SUPPORTED;
+}
+
+tobii_error_t tobii_capability_supported( tobii_device_t* device,
+    tobii_capability_t capability, tobii_supported_t* supported )
+{
+    (void)capability;
+
+    if( !device || !supported )
+        return TOBII_ERROR_INVALID_PARAMETER;
+
+    *supported = TOBII_NOT_SUPPORTED;
+    return TOBII_ERROR_NO_ERROR;
+}
+
+tobii_error_t tobii_stream_supported( tobii_device_t* device,
+    tobii_stream_t stream, tobii_supported_t* supported )
+{
+    if( !device || !supported )
+        return TOBII_ERROR_INVALID_PARAMETER;
+
+    switch( stream )
+    {
+        case TOBII_STREAM_GAZE_POINT:
+        case TOBII_STREAM_GAZE_ORIGIN:
+        case TOBII_STREAM_EYE_POSITION_NORMALIZED:
+        case TOBII_STREAM_USER_PRESENCE:
+        case TOBII_STREAM_GAZE_DATA:
+        case TOBII_STREAM_HEAD_POSE:
+        case TOBII_STREAM_WEARABLE:
+        case TOBII_STREAM_DIGITAL_SYNCPORT:
+            *supported = TOBII_SUPPORTED;
+            break;
+        default:
+            *supported = TOBII_NOT_SUPPORTED;
+            break;
+    }
+
+    return TOBII_ERROR_NO_ERROR;
+}
+
+// tobii_streams.h
+
+#define STUB_SUBSCRIBE( name, field, callback_type ) \
+    tobii_error_t tobii_##name##_subscribe( tobii_device_t* device, \
+        callback_type callback, void* user_data ) \
+    { \
+        if( !device || !callback ) \
+            return TOBII_ERROR_INVALID_PARAMETER; \
+        if( device->field##_callback ) \
+            return TOBII_ERROR_ALREADY_SUBSCRIBED; \
+        if( !stub_has_subscriptions( device ) ) \
+            stub_restart_samples( device ); \
+        device->field##_callback = callback; \
+        device->field##_user_data = user_data; \
+        return TOBII_ERROR_NO_ERROR; \
+    } \
+    tobii_error_t tobii_##name##_unsubscribe( tobii_device_t* device ) \
+    { \
+        if( !device ) \
+            return TOBII_ERROR_INVALID_PARAMETER; \
+        if( !device->field##_callback ) \
+            return TOBII_ERROR_NOT_SUBSCRIBED; \
+        device->field##_callback = NULL; \
+        device->field##_user_data = NULL; \
+        return TOBII_ERROR_NO_ERROR; \
+    }
+
+#define STUB_NOT_SUPPORTED_SUBSCRIBE( name, callback_type ) \
+    tobii_error_t tobii_##name##_subscribe( tobii_device_t* device, \
+        callback_type callback, void* user_data ) \
+    { \
+        (void)device; \
+        (void)callback; \
+        (void)user_data; \
+        return TOBII_ERROR_NOT_SUPPORTED; \
+    } \
+    tobii_error_t tobii_##name##_unsubscribe( tobii_device_t* device ) \
+    { \
+        (void)device; \
+        return TOBII_ERROR_NOT_SUPPORTED; \
+    }
+
+STUB_SUBSCRIBE( gaze_point, gaze_point, tobii_gaze_point_callback_t )
+STUB_SUBSCRIBE( gaze_origin, gaze_origin, tobii_gaze_origin_callback_t )
+STUB_SUBSCRIBE( eye_position_normalized, eye_position,
+    tobii_eye_position_normalized_callback_t )
+
+tobii_error_t tobii_user_presence_subscribe( tobii_device_t* device,
+    tobii_user_presence_callback_t callback, void* user_data )
+{
+    if( !device || !callback )
+        return TOBII_ERROR_INVALID_PARAMETER;
+
+    if( device->user_presence_callback )
+        return TOBII_ERROR_ALREADY_SUBSCRIBED;
+
+    device->user_presence_callback = callback;
+    device->user_presence_user_data = user_data;
+    device->user_presence_pending = 1;
+    stub_schedule_presence( device );
+    return TOBII_ERROR_NO_ERROR;
+}
+
+tobii_error_t tobii_user_presence_unsubscribe( tobii_device_t* device )
+{
+    if( !device )
+        return TOBII_ERROR_INVALID_PARAMETER;
+
+    if( !device->user_presence_callback )
+        return TOBII_ERROR_NOT_SUBSCRIBED;
+
+    device->user_presence_callback = NULL;
+    device->user_presence_user_data = NULL;
+    device->user_presence_pending = 0;
+    return TOBII_ERROR_NO_ERROR;
+}
+
+STUB_SUBSCRIBE( head_pose, head_pose, tobii_head_pose_callback_t )
+
+tobii_error_t tobii_notifications_subscribe( tobii_device_t* device,
+    tobii_notifications_callback_t callback, void* user_data )
+{
+    if( !device || !callback )
+        return TOBII_ERROR_INVALID_PARAMETER;
+
+    if( device->notifications_callback )
+        return TOBII_ERROR_ALREADY_SUBSCRIBED;
+
+    device->notifications_callback = callback;
+    device->notifications_user_data = user_data;
+    return TOBII_ERROR_NO_ERROR;
+}
+
+tobii_error_t tobii_notifications_unsubscribe( tobii_device_t* device )
+{
+    if( !device )
+        return TOBII_ERROR_INVALID_PARAMETER;
+
+    if( !device->notifications_callback )
+        return TOBII_ERROR_NOT_SUBSCRIBED;
+
+    device->notifications_callback = NULL;
+    device->notifications_user_data = NULL;
+    return TOBII_ERROR_NO_ERROR;
+}
+
+STUB_NOT_SUPPORTED_SUBSCRIBE( user_position_guide, tobii_user_position_guide_callback_t )
+
+// tobii_wearable.h
+
+STUB_SUBSCRIBE( wearable_consumer_data, wearable_consumer_data,
+    tobii_wearable_consumer_data_callback_t )
+STUB_SUBSCRIBE( wearable_advanced_data, wearable_advanced_data,
+    tobii_wearable_advanced_data_callback_t )
+STUB_SUBSCRIBE( wearable_foveated_gaze, wearable_foveated_gaze,
+    tobii_wearable_foveated_gaze_callback_t )
+
+tobii_error_t tobii_get_lens_configuration( tobii_device_t* device,
+    tobii_lens_configuration_t* lens_config )
+{
+    (void)device;
+    (void)lens_config;
+    return TOBII_ERROR_NOT_SUPPORTED;
+}
+
+tobii_error_t tobii_set_lens_configuration( tobii_device_t* device,
+    tobii_lens_configuration_t const* lens_config )
+{
+    (void)device;
+    (void)lens_config;
+    return TOBII_ERROR_NOT_SUPPORTED;
+}
+
+tobii_error_t tobii_lens_configuration_writable( tobii_device_t* device,
+    tobii_lens_configuration_writable_t* writable )
+{
+    (void)device;
+    (void)writable;
+    return TOBII_ERROR_NOT_SUPPORTED;
+}
+
+// tobii_licensing.h
+
+tobii_error_t tobii_device_create_ex( tobii_api_t* api, char const* url, tobii_field_of_use_t field_of_use,
+    tobii_license_key_t const* license_keys, int license_count, tobii_license_validation_result_t* license_results, tobii_device_t** device )
+{
+    (void)license_keys;
+    (void)license_count;
+    (void)license_results;
+    return tobii_device_create( api, url, field_of_use, device );
+}
+
+tobii_error_t tobii_license_key_store( tobii_device_t* device, void* data, size_t size )
+{
+    (void)device;
+    (void)data;
+    (void)size;
+    return TOBII_ERROR_NOT_SUPPORTED;
+}
+
+tobii_error_t tobii_license_key_retrieve( tobii_device_t* device, tobii_data_receiver_t receiver, void* user_data )
+{
+    (void)device;
+    (void)receiver;
+    (void)user_data;
+    return TOBII_ERROR_NOT_SUPPORTED;
+}
+
+tobii_error_t tobii_get_feature_group( tobii_device_t* device, tobii_feature_group_t* feature_group )
+{
+    if( !device || !feature_group )
+        return TOBII_ERROR_INVALID_PARAMETER;
+
+    *feature_group = TOBII_FEATURE_GROUP_CONSUMER;
+    return TOBII_ERROR_NO_ERROR;
+}
+
+// tobii_config.h
+
+tobii_error_t tobii_set_enabled_eye( tobii_device_t* device, tobii_enabled_eye_t enabled_eye )
+{
+    (void)device;
+    (void)enabled_eye;
+    return TOBII_ERROR_NOT_SUPPORTED;
+}
+
+tobii_error_t tobii_get_enabled_eye( tobii_device_t* device, tobii_enabled_eye_t* enabled_eye )
+{
+    (void)device;
+    (void)enabled_eye;
+    return TOBII_ERROR_NOT_SUPPORTED;
+}
+
+tobii_error_t tobii_calibration_start( tobii_device_t* device,
+    tobii_enabled_eye_t enabled_eye )
+{
+    (void)device;
+    (void)enabled_eye;
+    return TOBII_ERROR_NOT_SUPPORTED;
+}
+
+tobii_error_t tobii_calibration_stop( tobii_device_t* device )
+{
+    (void)device;
+    return TOBII_ERROR_NOT_SUPPORTED;
+}
+
+tobii_error_t tobii_calibration_collect_data_2d( tobii_device_t* device,
+    float x, float y )
+{
+    (void)device;
+    (void)x;
+    (void)y;
+    return TOBII_ERROR_NOT_SUPPORTED;
+}
+
+tobii_error_t tobii_calibration_collect_data_3d( tobii_device_t* device,
+    float x, float y, float z )
+{
+    (void)device;
+    (void)x;
+    (void)y;
+    (void)z;
+    return TOBII_ERROR_NOT_SUPPORTED;
+}
+
+tobii_error_t tobii_calibration_collect_data_per_eye_2d( tobii_device_t* device,
+    float x, float y, tobii_enabled_eye_t requested_eyes,
+    tobii_enabled_eye_t* collected_eyes )
+{
+    (void)device;
+    (void)x;
+    (void)y;
+    (void)requested_eyes;
+    (void)collected_eyes;
+    return TOBII_ERROR_NOT_SUPPORTED;
+}
+
+tobii_error_t tobii_calibration_discard_data_2d( tobii_device_t* device,
+    float x, float y )
+{
+    (void)device;
+    (void)x;
+    (void)y;
+    return TOBII_ERROR_NOT_SUPPORTED;
+}
+
+tobii_error_t tobii_calibration_discard_data_3d( tobii_device_t* device,
+    float x, float y, float z )
+{
+    (void)device;
+    (void)x;
+    (void)y;
+    (void)z;
+    return TOBII_ERROR_NOT_SUPPORTED;
+}
+
+tobii_error_t tobii_calibration_discard_data_per_eye_2d( tobii_device_t* device,
+    float x, float y, tobii_enabled_eye_t eyes )
+{
+    (void)device;
+    (void)x;
+    (void)y;
+    (void)eyes;
+    return TOBII_ERROR_NOT_SUPPORTED;
+}
+
+tobii_error_t tobii_calibration_clear( tobii_device_t* device )
+{
+    (void)device;
+    return TOBII_ERROR_NOT_SUPPORTED;
+}
+
+tobii_error_t tobii_calibration_compute_and_apply( tobii_device_t* device )
+{
+    (void)device;
+    return TOBII_ERROR_NOT_SUPPORTED;
+}
+
+tobii_error_t tobii_calibration_compute_and_apply_per_eye( tobii_device_t* device,
+    tobii_enabled_eye_t* calibrated_eyes )
+{
+    (void)device;
+    (void)calibrated_eyes;
+    return TOBII_ERROR_NOT_SUPPORTED;
+}
+
+tobii_error_t tobii_calibration_retrieve( tobii_device_t* device,
+    tobii_data_receiver_t receiver, void* user_data )
+{
+    (void)device;
+    (void)receiver;
+    (void)user_data;
+    return TOBII_ERROR_NOT_SUPPORTED;
+}
+
+tobii_error_t tobii_calibration_parse( tobii_api_t* api, void const* data,
+    size_t data_size, tobii_calibration_point_data_receiver_t receiver,
+    void* user_data )
+{
+    (void)api;
+    (void)data;
+    (void)data_size;
+    (void)receiver;
+    (void)user_data;
+    return TOBII_ERROR_NOT_SUPPORTED;
+}
+
+tobii_error_t tobii_calibration_apply( tobii_device_t* device,
+    void const* data, size_t size )
+{
+    (void)device;
+    (void)data;
+    (void)size;
+    return TOBII_ERROR_NOT_SUPPORTED;
+}
+
+tobii_error_t tobii_get_geometry_mounting( tobii_device_t* device,
+    tobii_geometry_mounting_t* geometry_mounting )
+{
+    (void)device;
+    (void)geometry_mounting;
+    return TOBII_ERROR_NOT_SUPPORTED;
+}
+
+tobii_error_t tobii_get_display_area( tobii_device_t* device,
+    tobii_display_area_t* display_area )
+{
+    if( !device || !display_area )
+        return TOBII_ERROR_INVALID_PARAMETER;
+
+    *display_area = device->display_area;
+    return TOBII_ERROR_NO_ERROR;
+}
+
+tobii_error_t tobii_set_display_area( tobii_device_t* device,
+    tobii_display_area_t const* display_area )
+{
+    if( !device || !display_area )
+        return TOBII_ERROR_INVALID_PARAMETER;
+
+    device->display_area = *display_area;
+    device->display_area_changed_pending = 1;
+    return TOBII_ERROR_NO_ERROR;
+}
+
+tobii_error_t tobii_calculate_display_area_basic( tobii_api_t* api,
+    float width_mm, float height_mm, float offset_x_mm,
+    tobii_geometry_mounting_t const* geometry_mounting,
+    tobii_display_area_t* display_area )
+{
+    (void)api;
+    (void)width_mm;
+    (void)height_mm;
+    (void)offset_x_mm;
+    (void)geometry_mounting;
+    (void)display_area;
+    return TOBII_ERROR_NOT_SUPPORTED;
+}
+
+tobii_error_t tobii_get_device_name( tobii_device_t* device,
+    tobii_device_name_t* device_name )
+{
+    (void)device;
+    (void)device_name;
+    return TOBII_ERROR_NOT_SUPPORTED;
+}
+
+tobii_error_t tobii_set_device_name( tobii_device_t* device,
+    tobii_device_name_t const device_name )
+{
+    (void)device;
+    (void)device_name;
+    return TOBII_ERROR_NOT_SUPPORTED;
+}
+
+tobii_error_t tobii_enumerate_output_frequencies( tobii_device_t* device,
+    tobii_output_frequency_receiver_t receiver, void* user_data )
+{
+    static float const frequencies[] = { 30.0f, 60.0f, 120.0f, 250.0f, 600.0f, 1200.0f };
+
+    if( !device || !receiver )
+        return TOBII_ERROR_INVALID_PARAMETER;
+
+    for( size_t i = 0; i < sizeof( frequencies ) / sizeof( frequencies[ 0 ] ); ++i )
+        receiver( frequencies[ i ], user_data );
+
+    return TOBII_ERROR_NO_ERROR;
+}
+
+tobii_error_t tobii_set_output_frequency( tobii_device_t* device,
+    float output_frequency )
+{
+    if( !device || output_frequency <= 0.0f )
+        return TOBII_ERROR_INVALID_PARAMETER;
+
+    device->output_frequency = output_frequency;
+    device->framerate_changed_pending = 1;
+    stub_restart_samples( device );
+    return TOBII_ERROR_NO_ERROR;
+}
+
+tobii_error_t tobii_get_output_frequency( tobii_device_t* device,
+    float* output_frequency )
+{
+    if( !device || !output_frequency )
+        return TOBII_ERROR_INVALID_PARAMETER;
+
+    *output_frequency = device->output_frequency;
+    return TOBII_ERROR_NO_ERROR;
+}
+
+// tobii_advanced.h
+
+STUB_SUBSCRIBE( gaze_data, gaze_data, tobii_gaze_data_callback_t )
+
+tobii_error_t tobii_digital_syncport_subscribe( tobii_device_t* device,
+    tobii_digital_syncport_callback_t callback, void* user_data )
+{
+    if( !device || !callback )
+        return TOBII_ERROR_INVALID_PARAMETER;
+
+    if( device->digital_syncport_callback )
+        return TOBII_ERROR_ALREADY_SUBSCRIBED;
+
+    if( !stub_has_subscriptions( device ) )
+        stub_restart_samples( device );
+    device->digital_syncport_callback = callback;
+    device->digital_syncport_user_data = user_data;
+    stub_schedule_syncport( device );
+    return TOBII_ERROR_NO_ERROR;
+}
+
+tobii_error_t tobii_digital_syncport_unsubscribe( tobii_device_t* device )
+{
+    if( !device )
+        return TOBII_ERROR_INVALID_PARAMETER;
+
+    if( !device->digital_syncport_callback )
+        return TOBII_ERROR_NOT_SUBSCRIBED;
+
+    device->digital_syncport_callback = NULL;
+    device->digital_syncport_user_data = NULL;
+    return TOBII_ERROR_NO_ERROR;
+}
+
+tobii_error_t tobii_enumerate_face_types( tobii_device_t* device, tobii_face_type_receiver_t receiver,
+  void* user_data )
+{
+    (void)device;
+    (void)receiver;
+    (void)user_data;
+    return TOBII_ERROR_NOT_SUPPORTED;
+}
+
+tobii_error_t tobii_set_face_type( tobii_device_t* device, tobii_face_type_t const face_type )
+{
+    (void)device;
+    (void)face_type;
+    return TOBII_ERROR_NOT_SUPPORTED;
+}
+
+tobii_error_t tobii_get_face_type( tobii_device_t* device, tobii_face_type_t* face_type )
+{
+    (void)device;
+    (void)face_type;
+    return TOBII_ERROR_NOT_SUPPORTED;
+}
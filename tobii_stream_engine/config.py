@@ -0,0 +1,160 @@
+import logging
+import threading
+from collections.abc import Callable
+from types import TracebackType
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from tobii_stream_engine.capabilities import Capability
+from tobii_stream_engine.device import Notification, NotificationType
+from tobii_stream_engine.errors import TobiiNotSupportedError
+from tobii_stream_engine.samples import DeviceInfo, DisplayArea, TrackBox
+from tobii_stream_engine.streams import Stream
+
+if TYPE_CHECKING:
+    from tobii_stream_engine.device import Device
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# fixed for the lifetime of a connection, cached even without notifications
+STATIC_VALUES = ("device_info", "capabilities", "streams")
+
+
+class DeviceConfigCache:
+    def __init__(self, device: "Device") -> None:
+        self._device = device
+
+        self._values: dict[str, Any] = {}
+        # bumped on every invalidation, a query racing one is not cached
+        self._generation = 0
+        self._reconnects = device._reconnects
+        self._lock = threading.Lock()
+
+        self._notifications = False
+
+    @property
+    def notifications(self) -> bool:
+        return self._notifications
+
+    def _get(self, key: str, query: Callable[[], T]) -> T:
+        if self._device._reconnects != self._reconnects:
+            self._reconnects = self._device._reconnects
+            self.invalidate()
+
+        try:
+            value: T = self._values[key]
+            return value
+        except KeyError:
+            pass
+
+        generation = self._generation
+        value = query()
+
+        # volatile values can only be cached while notifications keep them fresh
+        if key in STATIC_VALUES or self._notifications:
+            with self._lock:
+                if generation == self._generation:
+                    self._values[key] = value
+
+        return value
+
+    def _set(self, key: str, value: Any) -> None:
+        with self._lock:
+            self._generation += 1
+            self._values[key] = value
+
+    def _discard(self, key: str) -> None:
+        with self._lock:
+            self._generation += 1
+            self._values.pop(key, None)
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._values.clear()
+
+    def get_device_info(self) -> DeviceInfo:
+        return self._get("device_info", self._device.get_device_info)
+
+    def get_supported_capabilities(self) -> tuple[Capability, ...]:
+        return self._get(
+            "capabilities",
+            lambda: tuple(self._device.get_supported_capabilities()),
+        )
+
+    def is_supported_capability(self, capability: Capability) -> bool:
+        return capability in self.get_supported_capabilities()
+
+    def get_supported_streams(self) -> tuple[Stream, ...]:
+        return self._get(
+            "streams",
+            lambda: tuple(self._device.get_supported_streams()),
+        )
+
+    def is_supported_stream(self, stream: Stream) -> bool:
+        return stream in self.get_supported_streams()
+
+    def get_output_frequency(self) -> float:
+        return self._get("output_frequency", self._device.get_output_frequency)
+
+    def set_output_frequency(self, output_frequency: float) -> None:
+        self._device.set_output_frequency(output_frequency)
+        self._discard("output_frequency")
+
+    def get_display_area(self) -> DisplayArea:
+        return self._get("display_area", self._device.get_display_area)
+
+    def get_track_box(self) -> TrackBox:
+        return self._get("track_box", self._device.get_track_box)
+
+    def _on_notification(self, *, notification: Notification) -> None:
+        if notification.type == NotificationType.FRAMERATE_CHANGED:
+            if isinstance(notification.value, float):
+                self._set("output_frequency", notification.value)
+            else:
+                self._discard("output_frequency")
+        elif notification.type == NotificationType.DISPLAY_AREA_CHANGED:
+            if isinstance(notification.value, DisplayArea):
+                self._set("display_area", notification.value)
+            else:
+                self._discard("display_area")
+        elif notification.type == NotificationType.TRACK_BOX_CHANGED:
+            self._discard("track_box")
+
+    def start(self) -> None:
+        if self._notifications:
+            return
+
+        try:
+            self._device.subscribe_notifications(self._on_notification)
+        except TobiiNotSupportedError:
+            logger.debug(
+                f"{self._device._url}: notifications not supported, "
+                "caching static values only"
+            )
+            return
+
+        # values read before subscribing may have changed unnoticed
+        self.invalidate()
+        self._notifications = True
+
+    def stop(self) -> None:
+        if not self._notifications:
+            return
+
+        self._device.unsubscribe_notifications()
+        self._notifications = False
+        self.invalidate()
+
+    def __enter__(self) -> "DeviceConfigCache":
+        self.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.stop()
@@ -1,85 +1,117 @@
 import enum
 import logging
+import threading
+import time
+from collections.abc import Sequence
 from dataclasses import dataclass
-from typing import Protocol
+from typing import TYPE_CHECKING, Any, Literal, Protocol, overload
 
 from _tobii_stream_engine_cffi import ffi as _ffi  # type: ignore
 from _tobii_stream_engine_cffi import lib as _lib
 
+from tobii_stream_engine.aio import OverflowPolicy, SampleStream, StreamWorker
 from tobii_stream_engine.api import Api
+from tobii_stream_engine.buffers import (
+    Columns,
+    GazePointBuffer,
+    SampleBuffer,
+    to_structured_array,
+)
 from tobii_stream_engine.capabilities import Capability
-from tobii_stream_engine.errors import raise_on_error
+from tobii_stream_engine.dispatch import C, Dispatcher
+from tobii_stream_engine.errors import (
+    TobiiConnectionFailedDriverError,
+    TobiiConnectionFailedError,
+    raise_on_error,
+)
+from tobii_stream_engine.metrics import DeviceMetrics
+from tobii_stream_engine.native import (
+    NativeEyePositionBuffer,
+    NativeGazeDataBuffer,
+    NativeGazeOriginBuffer,
+    NativeGazePointBuffer,
+    NativeHeadPoseBuffer,
+    NativeWearableAdvancedDataBuffer,
+    NativeWearableConsumerDataBuffer,
+    NativeWearableFoveatedGazeBuffer,
+)
+from tobii_stream_engine.samples import (
+    CompactEyePosition,
+    CompactEyePositionCallback,
+    CompactGazeOrigin,
+    CompactGazeOriginCallback,
+    CompactGazePoint,
+    CompactGazePointCallback,
+    DeviceInfo,
+    DigitalSyncportCallback,
+    DisplayArea,
+    EyePosition,
+    EyePositionCallback,
+    GazeData,
+    GazeDataCallback,
+    GazeDataEye,
+    GazeOrigin,
+    GazeOriginCallback,
+    GazePoint,
+    GazePointCallback,
+    HeadPose,
+    HeadPoseCallback,
+    PositionXY,
+    PositionXYZ,
+    RotationXYZ,
+    TrackBox,
+    UserPresence,
+    UserPresenceCallback,
+)
 from tobii_stream_engine.streams import Stream
+from tobii_stream_engine.support import DeviceSupport, SupportCache
 
-logger = logging.getLogger(__name__)
-
-
-@dataclass(frozen=True)
-class DeviceInfo:
-    serial_number: str
-    model: str
-    generation: str
-    firmware_version: str
-
-
-@dataclass(frozen=True)
-class PositionXY:
-    x: float
-    y: float
-
-
-@dataclass(frozen=True)
-class PositionXYZ:
-    x: float
-    y: float
-    z: float
-
-
-@dataclass(frozen=True)
-class GazePoint:
-    validity: bool
-    position_xy: PositionXY
-
-
-@dataclass(frozen=True)
-class GazeOrigin:
-    left_validity: bool
-    left_xyz: PositionXYZ
-    right_validity: bool
-    right_xyz: PositionXYZ
+if TYPE_CHECKING:
+    import numpy.typing
 
+    from tobii_stream_engine.reconnect import ReconnectSupervisor
 
-@dataclass(frozen=True)
-class EyePosition:
-    left_validity: bool
-    left_xyz: PositionXYZ
-    right_validity: bool
-    right_xyz: PositionXYZ
-
-
-class UserPresence(enum.Enum):
-    UNKNOWN = enum.auto()
-    AWAY = enum.auto()
-    PRESENT = enum.auto()
+logger = logging.getLogger(__name__)
 
 
-class GazePointCallback(Protocol):
-    def __call__(self, *, timestamp: int, gaze_point: GazePoint) -> None:
-        ...
+class FoveatedTrackingState(enum.IntEnum):
+    TRACKING = _lib.TOBII_WEARABLE_FOVEATED_TRACKING_STATE_TRACKING
+    EXTRAPOLATED = _lib.TOBII_WEARABLE_FOVEATED_TRACKING_STATE_EXTRAPOLATED
+    LAST_KNOWN = _lib.TOBII_WEARABLE_FOVEATED_TRACKING_STATE_LAST_KNOWN
 
 
-class GazeOriginCallback(Protocol):
-    def __call__(self, *, timestamp: int, gaze_origin: GazeOrigin) -> None:
-        ...
+class NotificationType(enum.IntEnum):
+    CALIBRATION_STATE_CHANGED = _lib.TOBII_NOTIFICATION_TYPE_CALIBRATION_STATE_CHANGED
+    EXCLUSIVE_MODE_STATE_CHANGED = (
+        _lib.TOBII_NOTIFICATION_TYPE_EXCLUSIVE_MODE_STATE_CHANGED
+    )
+    TRACK_BOX_CHANGED = _lib.TOBII_NOTIFICATION_TYPE_TRACK_BOX_CHANGED
+    DISPLAY_AREA_CHANGED = _lib.TOBII_NOTIFICATION_TYPE_DISPLAY_AREA_CHANGED
+    FRAMERATE_CHANGED = _lib.TOBII_NOTIFICATION_TYPE_FRAMERATE_CHANGED
+    POWER_SAVE_STATE_CHANGED = _lib.TOBII_NOTIFICATION_TYPE_POWER_SAVE_STATE_CHANGED
+    DEVICE_PAUSED_STATE_CHANGED = (
+        _lib.TOBII_NOTIFICATION_TYPE_DEVICE_PAUSED_STATE_CHANGED
+    )
+    CALIBRATION_ENABLED_EYE_CHANGED = (
+        _lib.TOBII_NOTIFICATION_TYPE_CALIBRATION_ENABLED_EYE_CHANGED
+    )
+    CALIBRATION_ID_CHANGED = _lib.TOBII_NOTIFICATION_TYPE_CALIBRATION_ID_CHANGED
+    COMBINED_GAZE_EYE_SELECTION_CHANGED = (
+        _lib.TOBII_NOTIFICATION_TYPE_COMBINED_GAZE_EYE_SELECTION_CHANGED
+    )
+    FAULTS_CHANGED = _lib.TOBII_NOTIFICATION_TYPE_FAULTS_CHANGED
+    WARNINGS_CHANGED = _lib.TOBII_NOTIFICATION_TYPE_WARNINGS_CHANGED
+    FACE_TYPE_CHANGED = _lib.TOBII_NOTIFICATION_TYPE_FACE_TYPE_CHANGED
 
 
-class EyePositionCallback(Protocol):
-    def __call__(self, *, timestamp: int, eye_position: EyePosition) -> None:
-        ...
+@dataclass(frozen=True, slots=True)
+class Notification:
+    type: NotificationType | int
+    value: float | bool | int | str | DisplayArea | None
 
 
-class UserPresenceCallback(Protocol):
-    def __call__(self, *, timestamp: int, user_presence: UserPresence) -> None:
+class NotificationCallback(Protocol):
+    def __call__(self, *, notification: Notification) -> None:
         ...
 
 
@@ -103,6 +135,30 @@ def gaze_point_callback(gaze_point, user_data) -> None:
     )
 
 
+@_ffi.def_extern()  # type: ignore
+def gaze_point_buffered_callback(gaze_point, user_data) -> None:
+    buffer: GazePointBuffer = _ffi.from_handle(user_data)
+    buffer._push(
+        gaze_point.timestamp_us,
+        gaze_point.validity,
+        gaze_point.position_xy[0],
+        gaze_point.position_xy[1],
+    )
+
+
+@_ffi.def_extern()  # type: ignore
+def gaze_point_compact_callback(gaze_point, user_data) -> None:
+    device: Device = _ffi.from_handle(user_data)
+    device._on_gaze_point(
+        timestamp=gaze_point.timestamp_us,
+        gaze_point=CompactGazePoint(
+            gaze_point.validity == _lib.TOBII_VALIDITY_VALID,
+            gaze_point.position_xy[0],
+            gaze_point.position_xy[1],
+        ),
+    )
+
+
 @_ffi.def_extern()  # type: ignore
 def gaze_origin_callback(gaze_origin, user_data) -> None:
     _timestamp_us = int(gaze_origin.timestamp_us)
@@ -132,6 +188,27 @@ def gaze_origin_callback(gaze_origin, user_data) -> None:
     )
 
 
+@_ffi.def_extern()  # type: ignore
+def gaze_origin_compact_callback(gaze_origin, user_data) -> None:
+    left_xyz = gaze_origin.left_xyz
+    right_xyz = gaze_origin.right_xyz
+
+    device: Device = _ffi.from_handle(user_data)
+    device._on_gaze_origin(
+        timestamp=gaze_origin.timestamp_us,
+        gaze_origin=CompactGazeOrigin(
+            gaze_origin.left_validity == _lib.TOBII_VALIDITY_VALID,
+            left_xyz[0],
+            left_xyz[1],
+            left_xyz[2],
+            gaze_origin.right_validity == _lib.TOBII_VALIDITY_VALID,
+            right_xyz[0],
+            right_xyz[1],
+            right_xyz[2],
+        ),
+    )
+
+
 @_ffi.def_extern()  # type: ignore
 def eye_position_normalized_callback(eye_position, user_data) -> None:
     _timestamp_us = int(eye_position.timestamp_us)
@@ -161,6 +238,112 @@ def eye_position_normalized_callback(eye_position, user_data) -> None:
     )
 
 
+@_ffi.def_extern()  # type: ignore
+def eye_position_normalized_compact_callback(eye_position, user_data) -> None:
+    left_xyz = eye_position.left_xyz
+    right_xyz = eye_position.right_xyz
+
+    device: Device = _ffi.from_handle(user_data)
+    device._on_eye_position(
+        timestamp=eye_position.timestamp_us,
+        eye_position=CompactEyePosition(
+            eye_position.left_validity == _lib.TOBII_VALIDITY_VALID,
+            left_xyz[0],
+            left_xyz[1],
+            left_xyz[2],
+            eye_position.right_validity == _lib.TOBII_VALIDITY_VALID,
+            right_xyz[0],
+            right_xyz[1],
+            right_xyz[2],
+        ),
+    )
+
+
+def _gaze_data_eye(eye: Any) -> GazeDataEye:
+    return GazeDataEye(
+        gaze_origin_validity=eye.gaze_origin_validity == _lib.TOBII_VALIDITY_VALID,
+        gaze_origin_mm_xyz=PositionXYZ(
+            x=float(eye.gaze_origin_from_eye_tracker_mm_xyz[0]),
+            y=float(eye.gaze_origin_from_eye_tracker_mm_xyz[1]),
+            z=float(eye.gaze_origin_from_eye_tracker_mm_xyz[2]),
+        ),
+        gaze_origin_normalized_xyz=PositionXYZ(
+            x=float(eye.gaze_origin_in_track_box_normalized_xyz[0]),
+            y=float(eye.gaze_origin_in_track_box_normalized_xyz[1]),
+            z=float(eye.gaze_origin_in_track_box_normalized_xyz[2]),
+        ),
+        gaze_point_validity=eye.gaze_point_validity == _lib.TOBII_VALIDITY_VALID,
+        gaze_point_mm_xyz=PositionXYZ(
+            x=float(eye.gaze_point_from_eye_tracker_mm_xyz[0]),
+            y=float(eye.gaze_point_from_eye_tracker_mm_xyz[1]),
+            z=float(eye.gaze_point_from_eye_tracker_mm_xyz[2]),
+        ),
+        gaze_point_xy=PositionXY(
+            x=float(eye.gaze_point_on_display_normalized_xy[0]),
+            y=float(eye.gaze_point_on_display_normalized_xy[1]),
+        ),
+        eyeball_center_validity=eye.eyeball_center_validity
+        == _lib.TOBII_VALIDITY_VALID,
+        eyeball_center_mm_xyz=PositionXYZ(
+            x=float(eye.eyeball_center_from_eye_tracker_mm_xyz[0]),
+            y=float(eye.eyeball_center_from_eye_tracker_mm_xyz[1]),
+            z=float(eye.eyeball_center_from_eye_tracker_mm_xyz[2]),
+        ),
+        pupil_validity=eye.pupil_validity == _lib.TOBII_VALIDITY_VALID,
+        pupil_diameter_mm=float(eye.pupil_diameter_mm),
+    )
+
+
+@_ffi.def_extern()  # type: ignore
+def gaze_data_callback(gaze_data, user_data) -> None:
+    _timestamp_us = int(gaze_data.timestamp_system_us)
+    _gaze_data = GazeData(
+        timestamp_tracker_us=int(gaze_data.timestamp_tracker_us),
+        timestamp_system_us=_timestamp_us,
+        left=_gaze_data_eye(gaze_data.left),
+        right=_gaze_data_eye(gaze_data.right),
+    )
+
+    device: Device = _ffi.from_handle(user_data)
+    device._on_gaze_data(
+        timestamp=_timestamp_us,
+        gaze_data=_gaze_data,
+    )
+
+
+@_ffi.def_extern()  # type: ignore
+def head_pose_callback(head_pose, user_data) -> None:
+    _timestamp_us = int(head_pose.timestamp_us)
+    _position_validity = head_pose.position_validity == _lib.TOBII_VALIDITY_VALID
+    _position_xyz = PositionXYZ(
+        x=float(head_pose.position_xyz[0]),
+        y=float(head_pose.position_xyz[1]),
+        z=float(head_pose.position_xyz[2]),
+    )
+    _rotation_validity_xyz = (
+        head_pose.rotation_validity_xyz[0] == _lib.TOBII_VALIDITY_VALID,
+        head_pose.rotation_validity_xyz[1] == _lib.TOBII_VALIDITY_VALID,
+        head_pose.rotation_validity_xyz[2] == _lib.TOBII_VALIDITY_VALID,
+    )
+    _rotation_xyz = RotationXYZ(
+        x=float(head_pose.rotation_xyz[0]),
+        y=float(head_pose.rotation_xyz[1]),
+        z=float(head_pose.rotation_xyz[2]),
+    )
+    _head_pose = HeadPose(
+        position_validity=_position_validity,
+        position_xyz=_position_xyz,
+        rotation_validity_xyz=_rotation_validity_xyz,
+        rotation_xyz=_rotation_xyz,
+    )
+
+    device: Device = _ffi.from_handle(user_data)
+    device._on_head_pose(
+        timestamp=_timestamp_us,
+        head_pose=_head_pose,
+    )
+
+
 @_ffi.def_extern()  # type: ignore
 def user_presence_callback(status, timestamp_us, user_data) -> None:
     _timestamp_us = int(timestamp_us)
@@ -177,25 +360,171 @@ def user_presence_callback(status, timestamp_us, user_data) -> None:
     )
 
 
+@_ffi.def_extern()  # type: ignore
+def digital_syncport_callback(
+    signal, timestamp_tracker_us, timestamp_system_us, user_data
+) -> None:
+    device: Device = _ffi.from_handle(user_data)
+    device._on_digital_syncport(
+        timestamp=int(timestamp_system_us),
+        signal=int(signal),
+        timestamp_tracker_us=int(timestamp_tracker_us),
+    )
+
+
+def _position_xyz(xyz: Any) -> PositionXYZ:
+    return PositionXYZ(
+        x=float(xyz[0]),
+        y=float(xyz[1]),
+        z=float(xyz[2]),
+    )
+
+
+def _display_area(display_area: Any) -> DisplayArea:
+    return DisplayArea(
+        top_left_mm_xyz=_position_xyz(display_area.top_left_mm_xyz),
+        top_right_mm_xyz=_position_xyz(display_area.top_right_mm_xyz),
+        bottom_left_mm_xyz=_position_xyz(display_area.bottom_left_mm_xyz),
+    )
+
+
+def _notification_value(
+    notification: Any,
+) -> float | bool | int | str | DisplayArea | None:
+    value_type = notification.value_type
+    value = notification.value
+
+    if value_type == _lib.TOBII_NOTIFICATION_VALUE_TYPE_FLOAT:
+        return float(value.float_)
+    if value_type == _lib.TOBII_NOTIFICATION_VALUE_TYPE_STATE:
+        return bool(value.state == _lib.TOBII_STATE_BOOL_TRUE)
+    if value_type == _lib.TOBII_NOTIFICATION_VALUE_TYPE_DISPLAY_AREA:
+        return _display_area(value.display_area)
+    if value_type == _lib.TOBII_NOTIFICATION_VALUE_TYPE_UINT:
+        return int(value.uint_)
+    if value_type == _lib.TOBII_NOTIFICATION_VALUE_TYPE_ENABLED_EYE:
+        return int(value.enabled_eye)
+    if value_type == _lib.TOBII_NOTIFICATION_VALUE_TYPE_STRING:
+        string: str = _ffi.string(value.string_).decode()
+        return string
+    return None
+
+
+@_ffi.def_extern()  # type: ignore
+def notification_callback(notification, user_data) -> None:
+    _type: NotificationType | int = notification.type
+    try:
+        _type = NotificationType(notification.type)
+    except ValueError:
+        # newer runtimes may report types this binding does not know yet
+        pass
+
+    _notification = Notification(
+        type=_type,
+        value=_notification_value(notification),
+    )
+
+    device: Device = _ffi.from_handle(user_data)
+    device._on_notification(
+        notification=_notification,
+    )
+
+
+def _wait_for_callbacks(
+    device_count: int,
+    device_ptrs: Any,
+    timeout: float | None,
+    metrics: Sequence[DeviceMetrics] = (),
+) -> bool:
+    if timeout is not None and timeout <= 0:
+        return True
+
+    # the engine waits in fixed quanta, so timeouts are rounded up to them
+    deadline = None if timeout is None else time.monotonic() + timeout
+
+    while True:
+        ret = _lib.tobii_wait_for_callbacks(device_count, device_ptrs)
+        if ret != _lib.TOBII_ERROR_TIMED_OUT:
+            raise_on_error(ret)
+            return True
+
+        for device_metrics in metrics:
+            device_metrics._record_timeout_spin()
+
+        if deadline is None or time.monotonic() >= deadline:
+            return False
+
+
 class Device:
-    def __init__(self, api: Api, url: str) -> None:
+    def __init__(
+        self,
+        api: Api,
+        url: str,
+        dispatcher: Dispatcher | None = None,
+        metrics: DeviceMetrics | None = None,
+    ) -> None:
         self._api = api
         self._url = url
-        self._gaze_point_callback: GazePointCallback | None = None
-        self._gaze_origin_callback: GazeOriginCallback | None = None
-        self._eye_position_callback: EyePositionCallback | None = None
+        self._dispatcher = dispatcher
+        self._metrics = metrics
+        self._gaze_point_callback: (
+            GazePointCallback | CompactGazePointCallback | None
+        ) = None
+        self._gaze_point_buffer: GazePointBuffer | NativeGazePointBuffer | None = None
+        self._gaze_point_buffer_handle: _ffi.CDATA = None
+        self._gaze_origin_callback: (
+            GazeOriginCallback | CompactGazeOriginCallback | None
+        ) = None
+        self._gaze_origin_buffer: NativeGazeOriginBuffer | None = None
+        self._eye_position_callback: (
+            EyePositionCallback | CompactEyePositionCallback | None
+        ) = None
+        self._eye_position_buffer: NativeEyePositionBuffer | None = None
+        self._gaze_data_callback: GazeDataCallback | None = None
+        self._gaze_data_buffer: NativeGazeDataBuffer | None = None
+        self._head_pose_callback: HeadPoseCallback | None = None
+        self._head_pose_buffer: NativeHeadPoseBuffer | None = None
         self._user_presence_callback: UserPresenceCallback | None = None
+        self._digital_syncport_callback: DigitalSyncportCallback | None = None
+        self._notification_callback: NotificationCallback | None = None
+        self._wearable_consumer_data_buffer: (
+            NativeWearableConsumerDataBuffer | None
+        ) = None
+        self._wearable_advanced_data_buffer: (
+            NativeWearableAdvancedDataBuffer | None
+        ) = None
+        self._wearable_foveated_gaze_buffer: (
+            NativeWearableFoveatedGazeBuffer | None
+        ) = None
+        self._callback_count = 0
+        self._reconnects = 0
+        self._subscriptions: dict[str, tuple[Any, Any, Any]] = {}
+        # serializes processing callbacks with timesync updates from other threads
+        self._process_lock = threading.RLock()
+        self._stream_worker: StreamWorker | None = None
 
         self._handle = _ffi.new_handle(self)
+        self._supported = _ffi.new("tobii_supported_t *")
         self._device_ptr: _ffi.CDATA
         self._device_ptr_ptr: _ffi.CDATA
 
         self._create()
 
+        if self._metrics is not None:
+            self._metrics._set_output_frequency(self.get_output_frequency())
+
     def __del__(self) -> None:
         self.unsubscribe_gaze_point()
+        self.unsubscribe_gaze_origin()
         self.unsubscribe_eye_position()
+        self.unsubscribe_gaze_data()
+        self.unsubscribe_head_pose()
         self.unsubscribe_user_presence()
+        self.unsubscribe_digital_syncport()
+        self.unsubscribe_notifications()
+        self.unsubscribe_wearable_consumer_data()
+        self.unsubscribe_wearable_advanced_data()
+        self.unsubscribe_wearable_foveated_gaze()
         self._destroy()
 
     def _create(self) -> None:
@@ -268,15 +597,8 @@ class Device:
         return is_supported
 
     def get_supported_capabilities(self) -> list[Capability]:
-        logger.debug(f"{self._url}: getting supported capabilities")
-
-        supported_capabilities = []
-
-        for capability in Capability:
-            if self.is_supported_capability(capability):
-                supported_capabilities.append(capability)
-
-        return supported_capabilities
+        capabilities = self.probe_capabilities()
+        return [c for c in Capability if capabilities >> c & 1]
 
     def is_supported_stream(self, stream: Stream) -> bool:
         logger.debug(f"{self._url}: checking supported stream '{stream.name}'")
@@ -296,15 +618,54 @@ class Device:
         return is_supported
 
     def get_supported_streams(self) -> list[Stream]:
-        logger.debug(f"{self._url}: getting supported streams")
+        streams = self.probe_streams()
+        return [s for s in Stream if streams >> s & 1]
+
+    def _probe(self, probe_function: Any, values: Any) -> int:
+        # one scratch buffer for every value, supported values set their bit
+        device_ptr = self._device_ptr
+        supported = self._supported
+        bits = 0
+
+        for value in values:
+            ret = probe_function(device_ptr, value, supported)
+            raise_on_error(ret)
+            if supported[0] == _lib.TOBII_SUPPORTED:
+                bits |= 1 << value
 
-        supported_streams = []
+        return bits
 
-        for stream in Stream:
-            if self.is_supported_stream(stream):
-                supported_streams.append(stream)
+    def probe_capabilities(self) -> int:
+        logger.debug(f"{self._url}: probing supported capabilities")
 
-        return supported_streams
+        return self._probe(_lib.tobii_capability_supported, Capability)
+
+    def probe_streams(self) -> int:
+        logger.debug(f"{self._url}: probing supported streams")
+
+        return self._probe(_lib.tobii_stream_supported, Stream)
+
+    def probe_support(self, cache: SupportCache | None = None) -> DeviceSupport:
+        device_info = None
+        if cache is not None:
+            device_info = self.get_device_info()
+            support = cache.get(device_info)
+            if support is not None:
+                logger.debug(f"{self._url}: using cached support")
+                return support
+
+        support = DeviceSupport(
+            capabilities=self.probe_capabilities(),
+            streams=self.probe_streams(),
+        )
+
+        if cache is not None and device_info is not None:
+            try:
+                cache.put(device_info, support)
+            except OSError as error:
+                logger.warning(f"{self._url}: writing support cache failed: {error}")
+
+        return support
 
     def get_output_frequency(self) -> float:
         logger.debug(f"{self._url}: getting output frequency")
@@ -330,6 +691,46 @@ class Device:
 
         raise_on_error(ret)
 
+        if self._metrics is not None:
+            self._metrics._set_output_frequency(output_frequency)
+
+    def get_display_area(self) -> DisplayArea:
+        logger.debug(f"{self._url}: getting display area")
+
+        display_area = _ffi.new("tobii_display_area_t *")
+
+        ret = _lib.tobii_get_display_area(
+            self._device_ptr,
+            display_area,
+        )
+
+        raise_on_error(ret)
+
+        return _display_area(display_area)
+
+    def get_track_box(self) -> TrackBox:
+        logger.debug(f"{self._url}: getting track box")
+
+        track_box = _ffi.new("tobii_track_box_t *")
+
+        ret = _lib.tobii_get_track_box(
+            self._device_ptr,
+            track_box,
+        )
+
+        raise_on_error(ret)
+
+        return TrackBox(
+            front_upper_right_xyz=_position_xyz(track_box.front_upper_right_xyz),
+            front_upper_left_xyz=_position_xyz(track_box.front_upper_left_xyz),
+            front_lower_left_xyz=_position_xyz(track_box.front_lower_left_xyz),
+            front_lower_right_xyz=_position_xyz(track_box.front_lower_right_xyz),
+            back_upper_right_xyz=_position_xyz(track_box.back_upper_right_xyz),
+            back_upper_left_xyz=_position_xyz(track_box.back_upper_left_xyz),
+            back_lower_left_xyz=_position_xyz(track_box.back_lower_left_xyz),
+            back_lower_right_xyz=_position_xyz(track_box.back_lower_right_xyz),
+        )
+
     def enumerate_output_frequencies(self) -> list[float]:
         logger.debug(f"{self._url}: getting output frequencies")
 
@@ -349,126 +750,445 @@ class Device:
 
         return output_frequencies
 
-    def subscribe_gaze_point(self, callback: GazePointCallback) -> None:
-        logger.debug(f"{self._url}: subscribing to gaze-point")
+    def _bind(self, name: str, callback: C) -> C:
+        if self._dispatcher is not None:
+            callback = self._dispatcher.bind(name, callback)
+        # outside the dispatcher, so metrics are only touched by the processing
+        # thread and callback durations cover handing samples to the dispatcher
+        if self._metrics is not None:
+            callback = self._metrics.bind(name, callback)
+
+        return callback
+
+    def _subscribe(
+        self,
+        name: str,
+        subscribe_function: Any,
+        callback: Any,
+        user_data: Any,
+    ) -> None:
+        # resubscribing the same native callback only swaps the python callback
+        subscription = self._subscriptions.get(name)
+        if subscription == (subscribe_function, callback, user_data):
+            return
+        if subscription is not None:
+            raise ValueError(
+                f"'{name}' is already subscribed in another mode, "
+                f"call unsubscribe_{name}() first"
+            )
 
-        ret = _lib.tobii_gaze_point_subscribe(
+        ret = subscribe_function(
             self._device_ptr,
-            _lib.gaze_point_callback,
-            self._handle,
+            callback,
+            user_data,
         )
 
         raise_on_error(ret)
 
-        self._gaze_point_callback = callback
+        self._subscriptions[name] = (subscribe_function, callback, user_data)
 
-    def unsubscribe_gaze_point(self) -> None:
-        if self._gaze_point_callback is None:
-            return
+    def _check_unsubscribed(self, name: str) -> None:
+        # a second consumer would replace the callback of the first one
+        if name in self._subscriptions:
+            raise ValueError(
+                f"'{name}' is already subscribed, close its sample-stream "
+                f"or call unsubscribe_{name}() first"
+            )
 
-        logger.debug(f"{self._url}: unsubscribing from gaze-point")
+    def _unsubscribe(self, name: str, unsubscribe_function: Any) -> None:
+        ret = unsubscribe_function(
+            self._device_ptr,
+        )
+
+        raise_on_error(ret)
 
-        ret = _lib.tobii_gaze_point_unsubscribe(
+        del self._subscriptions[name]
+
+    def reconnect(self) -> None:
+        logger.debug(f"{self._url}: reconnecting")
+
+        ret = _lib.tobii_device_reconnect(
             self._device_ptr,
         )
 
         raise_on_error(ret)
 
+        self._reconnects += 1
+
+        for name, subscription in self._subscriptions.items():
+            logger.debug(f"{self._url}: resubscribing to '{name}'")
+
+            subscribe_function, callback, user_data = subscription
+            ret = subscribe_function(
+                self._device_ptr,
+                callback,
+                user_data,
+            )
+            if ret == _lib.TOBII_ERROR_ALREADY_SUBSCRIBED:
+                continue
+
+            raise_on_error(ret)
+
+    def update_timesync(self) -> None:
+        logger.debug(f"{self._url}: updating timesync")
+
+        with self._process_lock:
+            ret = _lib.tobii_update_timesync(
+                self._device_ptr,
+            )
+
+        raise_on_error(ret)
+
+    @overload
+    def subscribe_gaze_point(
+        self, callback: GazePointCallback, compact: Literal[False] = ...
+    ) -> None:
+        ...
+
+    @overload
+    def subscribe_gaze_point(
+        self, callback: CompactGazePointCallback, compact: Literal[True]
+    ) -> None:
+        ...
+
+    def subscribe_gaze_point(
+        self,
+        callback: GazePointCallback | CompactGazePointCallback,
+        compact: bool = False,
+    ) -> None:
+        logger.debug(f"{self._url}: subscribing to gaze-point")
+
+        callback_ptr = _lib.gaze_point_callback
+        if compact:
+            callback_ptr = _lib.gaze_point_compact_callback
+
+        self._subscribe(
+            "gaze_point",
+            _lib.tobii_gaze_point_subscribe,
+            callback_ptr,
+            self._handle,
+        )
+
+        self._gaze_point_callback = self._bind("gaze_point", callback)
+
+    def subscribe_gaze_point_buffered(self, capacity: int) -> GazePointBuffer:
+        logger.debug(f"{self._url}: subscribing to gaze-point (buffered)")
+
+        buffer = GazePointBuffer(capacity=capacity)
+        buffer_handle = _ffi.new_handle(buffer)
+
+        self._subscribe(
+            "gaze_point",
+            _lib.tobii_gaze_point_subscribe,
+            _lib.gaze_point_buffered_callback,
+            buffer_handle,
+        )
+
+        self._gaze_point_buffer = buffer
+        self._gaze_point_buffer_handle = buffer_handle
+
+        return buffer
+
+    def subscribe_gaze_point_native(self, capacity: int) -> NativeGazePointBuffer:
+        logger.debug(f"{self._url}: subscribing to gaze-point (native)")
+
+        buffer = NativeGazePointBuffer(capacity=capacity)
+
+        self._subscribe(
+            "gaze_point",
+            _lib.tobii_gaze_point_subscribe,
+            _lib.native_gaze_point_callback,
+            buffer._buffer_ptr,
+        )
+
+        self._gaze_point_buffer = buffer
+
+        return buffer
+
+    def unsubscribe_gaze_point(self) -> None:
+        if self._gaze_point_callback is None and self._gaze_point_buffer is None:
+            return
+
+        logger.debug(f"{self._url}: unsubscribing from gaze-point")
+
+        self._unsubscribe(
+            "gaze_point",
+            _lib.tobii_gaze_point_unsubscribe,
+        )
+
         self._gaze_point_callback = None
+        self._gaze_point_buffer = None
+        self._gaze_point_buffer_handle = None
 
-    def _on_gaze_point(self, timestamp: int, gaze_point: GazePoint) -> None:
+    def _on_gaze_point(self, timestamp: int, gaze_point: Any) -> None:
         if self._gaze_point_callback is None:
             return
 
+        self._callback_count += 1
         self._gaze_point_callback(
             timestamp=timestamp,
             gaze_point=gaze_point,
         )
 
-    def subscribe_gaze_origin(self, callback: GazeOriginCallback) -> None:
+    @overload
+    def subscribe_gaze_origin(
+        self, callback: GazeOriginCallback, compact: Literal[False] = ...
+    ) -> None:
+        ...
+
+    @overload
+    def subscribe_gaze_origin(
+        self, callback: CompactGazeOriginCallback, compact: Literal[True]
+    ) -> None:
+        ...
+
+    def subscribe_gaze_origin(
+        self,
+        callback: GazeOriginCallback | CompactGazeOriginCallback,
+        compact: bool = False,
+    ) -> None:
         logger.debug(f"{self._url}: subscribing to gaze-origin")
 
-        ret = _lib.tobii_gaze_origin_subscribe(
-            self._device_ptr,
-            _lib.gaze_origin_callback,
+        callback_ptr = _lib.gaze_origin_callback
+        if compact:
+            callback_ptr = _lib.gaze_origin_compact_callback
+
+        self._subscribe(
+            "gaze_origin",
+            _lib.tobii_gaze_origin_subscribe,
+            callback_ptr,
             self._handle,
         )
 
-        raise_on_error(ret)
+        self._gaze_origin_callback = self._bind("gaze_origin", callback)
+
+    def subscribe_gaze_origin_native(self, capacity: int) -> NativeGazeOriginBuffer:
+        logger.debug(f"{self._url}: subscribing to gaze-origin (native)")
+
+        buffer = NativeGazeOriginBuffer(capacity=capacity)
+
+        self._subscribe(
+            "gaze_origin",
+            _lib.tobii_gaze_origin_subscribe,
+            _lib.native_gaze_origin_callback,
+            buffer._buffer_ptr,
+        )
+
+        self._gaze_origin_buffer = buffer
 
-        self._gaze_origin_callback = callback
+        return buffer
 
     def unsubscribe_gaze_origin(self) -> None:
-        if self._gaze_origin_callback is None:
+        if self._gaze_origin_callback is None and self._gaze_origin_buffer is None:
             return
 
         logger.debug(f"{self._url}: unsubscribing from gaze-origin")
 
-        ret = _lib.tobii_gaze_origin_unsubscribe(
-            self._device_ptr,
+        self._unsubscribe(
+            "gaze_origin",
+            _lib.tobii_gaze_origin_unsubscribe,
         )
 
-        raise_on_error(ret)
-
         self._gaze_origin_callback = None
+        self._gaze_origin_buffer = None
 
-    def _on_gaze_origin(self, timestamp: int, gaze_origin: GazeOrigin) -> None:
+    def _on_gaze_origin(self, timestamp: int, gaze_origin: Any) -> None:
         if self._gaze_origin_callback is None:
             return
 
+        self._callback_count += 1
         self._gaze_origin_callback(
             timestamp=timestamp,
             gaze_origin=gaze_origin,
         )
 
-    def subscribe_eye_position(self, callback: EyePositionCallback) -> None:
+    @overload
+    def subscribe_eye_position(
+        self, callback: EyePositionCallback, compact: Literal[False] = ...
+    ) -> None:
+        ...
+
+    @overload
+    def subscribe_eye_position(
+        self, callback: CompactEyePositionCallback, compact: Literal[True]
+    ) -> None:
+        ...
+
+    def subscribe_eye_position(
+        self,
+        callback: EyePositionCallback | CompactEyePositionCallback,
+        compact: bool = False,
+    ) -> None:
         logger.debug(f"{self._url}: subscribing to eye-position")
 
-        ret = _lib.tobii_eye_position_normalized_subscribe(
-            self._device_ptr,
-            _lib.eye_position_normalized_callback,
+        callback_ptr = _lib.eye_position_normalized_callback
+        if compact:
+            callback_ptr = _lib.eye_position_normalized_compact_callback
+
+        self._subscribe(
+            "eye_position",
+            _lib.tobii_eye_position_normalized_subscribe,
+            callback_ptr,
             self._handle,
         )
 
-        raise_on_error(ret)
+        self._eye_position_callback = self._bind("eye_position", callback)
+
+    def subscribe_eye_position_native(self, capacity: int) -> NativeEyePositionBuffer:
+        logger.debug(f"{self._url}: subscribing to eye-position (native)")
+
+        buffer = NativeEyePositionBuffer(capacity=capacity)
+
+        self._subscribe(
+            "eye_position",
+            _lib.tobii_eye_position_normalized_subscribe,
+            _lib.native_eye_position_normalized_callback,
+            buffer._buffer_ptr,
+        )
 
-        self._eye_position_callback = callback
+        self._eye_position_buffer = buffer
+
+        return buffer
 
     def unsubscribe_eye_position(self) -> None:
-        if self._eye_position_callback is None:
+        if self._eye_position_callback is None and self._eye_position_buffer is None:
             return
 
         logger.debug(f"{self._url}: unsubscribing from eye-position")
 
-        ret = _lib.tobii_eye_position_normalized_unsubscribe(
-            self._device_ptr,
+        self._unsubscribe(
+            "eye_position",
+            _lib.tobii_eye_position_normalized_unsubscribe,
         )
 
-        raise_on_error(ret)
-
         self._eye_position_callback = None
+        self._eye_position_buffer = None
 
-    def _on_eye_position(self, timestamp: int, eye_position: EyePosition) -> None:
+    def _on_eye_position(self, timestamp: int, eye_position: Any) -> None:
         if self._eye_position_callback is None:
             return
 
+        self._callback_count += 1
         self._eye_position_callback(
             timestamp=timestamp,
             eye_position=eye_position,
         )
 
+    def subscribe_gaze_data(self, callback: GazeDataCallback) -> None:
+        logger.debug(f"{self._url}: subscribing to gaze-data")
+
+        self._subscribe(
+            "gaze_data",
+            _lib.tobii_gaze_data_subscribe,
+            _lib.gaze_data_callback,
+            self._handle,
+        )
+
+        self._gaze_data_callback = self._bind("gaze_data", callback)
+
+    def subscribe_gaze_data_native(self, capacity: int) -> NativeGazeDataBuffer:
+        logger.debug(f"{self._url}: subscribing to gaze-data (native)")
+
+        buffer = NativeGazeDataBuffer(capacity=capacity)
+
+        self._subscribe(
+            "gaze_data",
+            _lib.tobii_gaze_data_subscribe,
+            _lib.native_gaze_data_callback,
+            buffer._buffer_ptr,
+        )
+
+        self._gaze_data_buffer = buffer
+
+        return buffer
+
+    def unsubscribe_gaze_data(self) -> None:
+        if self._gaze_data_callback is None and self._gaze_data_buffer is None:
+            return
+
+        logger.debug(f"{self._url}: unsubscribing from gaze-data")
+
+        self._unsubscribe(
+            "gaze_data",
+            _lib.tobii_gaze_data_unsubscribe,
+        )
+
+        self._gaze_data_callback = None
+        self._gaze_data_buffer = None
+
+    def _on_gaze_data(self, timestamp: int, gaze_data: GazeData) -> None:
+        if self._gaze_data_callback is None:
+            return
+
+        self._callback_count += 1
+        self._gaze_data_callback(
+            timestamp=timestamp,
+            gaze_data=gaze_data,
+        )
+
+    def subscribe_head_pose(self, callback: HeadPoseCallback) -> None:
+        logger.debug(f"{self._url}: subscribing to head-pose")
+
+        self._subscribe(
+            "head_pose",
+            _lib.tobii_head_pose_subscribe,
+            _lib.head_pose_callback,
+            self._handle,
+        )
+
+        self._head_pose_callback = self._bind("head_pose", callback)
+
+    def subscribe_head_pose_native(self, capacity: int) -> NativeHeadPoseBuffer:
+        logger.debug(f"{self._url}: subscribing to head-pose (native)")
+
+        buffer = NativeHeadPoseBuffer(capacity=capacity)
+
+        self._subscribe(
+            "head_pose",
+            _lib.tobii_head_pose_subscribe,
+            _lib.native_head_pose_callback,
+            buffer._buffer_ptr,
+        )
+
+        self._head_pose_buffer = buffer
+
+        return buffer
+
+    def unsubscribe_head_pose(self) -> None:
+        if self._head_pose_callback is None and self._head_pose_buffer is None:
+            return
+
+        logger.debug(f"{self._url}: unsubscribing from head-pose")
+
+        self._unsubscribe(
+            "head_pose",
+            _lib.tobii_head_pose_unsubscribe,
+        )
+
+        self._head_pose_callback = None
+        self._head_pose_buffer = None
+
+    def _on_head_pose(self, timestamp: int, head_pose: HeadPose) -> None:
+        if self._head_pose_callback is None:
+            return
+
+        self._callback_count += 1
+        self._head_pose_callback(
+            timestamp=timestamp,
+            head_pose=head_pose,
+        )
+
     def subscribe_user_presence(self, callback: UserPresenceCallback) -> None:
         logger.debug(f"{self._url}: subscribing to user-presence")
 
-        ret = _lib.tobii_user_presence_subscribe(
-            self._device_ptr,
+        self._subscribe(
+            "user_presence",
+            _lib.tobii_user_presence_subscribe,
             _lib.user_presence_callback,
             self._handle,
         )
 
-        raise_on_error(ret)
-
-        self._user_presence_callback = callback
+        self._user_presence_callback = self._bind("user_presence", callback)
 
     def unsubscribe_user_presence(self) -> None:
         if self._user_presence_callback is None:
@@ -476,29 +1196,376 @@ class Device:
 
         logger.debug(f"{self._url}: unsubscribing from user-presence")
 
-        ret = _lib.tobii_user_presence_unsubscribe(
-            self._device_ptr,
+        self._unsubscribe(
+            "user_presence",
+            _lib.tobii_user_presence_unsubscribe,
         )
 
-        raise_on_error(ret)
-
         self._user_presence_callback = None
 
     def _on_user_presence(self, timestamp: int, user_presence: UserPresence) -> None:
         if self._user_presence_callback is None:
             return
 
+        self._callback_count += 1
         self._user_presence_callback(
             timestamp=timestamp,
             user_presence=user_presence,
         )
 
-    def run(self) -> None:
-        logger.debug(f"{self._url}: starting loop")
+    def subscribe_digital_syncport(self, callback: DigitalSyncportCallback) -> None:
+        logger.debug(f"{self._url}: subscribing to digital-syncport")
 
-        while True:
-            ret = _lib.tobii_wait_for_callbacks(1, self._device_ptr_ptr)
-            if ret == _lib.TOBII_ERROR_TIMED_OUT:
-                continue
+        self._subscribe(
+            "digital_syncport",
+            _lib.tobii_digital_syncport_subscribe,
+            _lib.digital_syncport_callback,
+            self._handle,
+        )
+
+        self._digital_syncport_callback = self._bind("digital_syncport", callback)
 
+    def unsubscribe_digital_syncport(self) -> None:
+        if self._digital_syncport_callback is None:
+            return
+
+        logger.debug(f"{self._url}: unsubscribing from digital-syncport")
+
+        self._unsubscribe(
+            "digital_syncport",
+            _lib.tobii_digital_syncport_unsubscribe,
+        )
+
+        self._digital_syncport_callback = None
+
+    def _on_digital_syncport(
+        self, timestamp: int, signal: int, timestamp_tracker_us: int
+    ) -> None:
+        if self._digital_syncport_callback is None:
+            return
+
+        self._callback_count += 1
+        self._digital_syncport_callback(
+            timestamp=timestamp,
+            signal=signal,
+            timestamp_tracker_us=timestamp_tracker_us,
+        )
+
+    def subscribe_notifications(self, callback: NotificationCallback) -> None:
+        logger.debug(f"{self._url}: subscribing to notifications")
+
+        self._subscribe(
+            "notifications",
+            _lib.tobii_notifications_subscribe,
+            _lib.notification_callback,
+            self._handle,
+        )
+
+        # not a sample stream, so neither dispatched nor measured
+        self._notification_callback = callback
+
+    def unsubscribe_notifications(self) -> None:
+        if self._notification_callback is None:
+            return
+
+        logger.debug(f"{self._url}: unsubscribing from notifications")
+
+        self._unsubscribe(
+            "notifications",
+            _lib.tobii_notifications_unsubscribe,
+        )
+
+        self._notification_callback = None
+
+    def _on_notification(self, notification: Notification) -> None:
+        if self._notification_callback is None:
+            return
+
+        self._notification_callback(
+            notification=notification,
+        )
+
+    def subscribe_wearable_consumer_data_native(
+        self, capacity: int
+    ) -> NativeWearableConsumerDataBuffer:
+        logger.debug(f"{self._url}: subscribing to wearable consumer-data (native)")
+
+        buffer = NativeWearableConsumerDataBuffer(capacity=capacity)
+
+        self._subscribe(
+            "wearable_consumer_data",
+            _lib.tobii_wearable_consumer_data_subscribe,
+            _lib.native_wearable_consumer_data_callback,
+            buffer._buffer_ptr,
+        )
+
+        self._wearable_consumer_data_buffer = buffer
+
+        return buffer
+
+    def unsubscribe_wearable_consumer_data(self) -> None:
+        if self._wearable_consumer_data_buffer is None:
+            return
+
+        logger.debug(f"{self._url}: unsubscribing from wearable consumer-data")
+
+        self._unsubscribe(
+            "wearable_consumer_data",
+            _lib.tobii_wearable_consumer_data_unsubscribe,
+        )
+
+        self._wearable_consumer_data_buffer = None
+
+    def subscribe_wearable_advanced_data_native(
+        self, capacity: int
+    ) -> NativeWearableAdvancedDataBuffer:
+        logger.debug(f"{self._url}: subscribing to wearable advanced-data (native)")
+
+        buffer = NativeWearableAdvancedDataBuffer(capacity=capacity)
+
+        self._subscribe(
+            "wearable_advanced_data",
+            _lib.tobii_wearable_advanced_data_subscribe,
+            _lib.native_wearable_advanced_data_callback,
+            buffer._buffer_ptr,
+        )
+
+        self._wearable_advanced_data_buffer = buffer
+
+        return buffer
+
+    def unsubscribe_wearable_advanced_data(self) -> None:
+        if self._wearable_advanced_data_buffer is None:
+            return
+
+        logger.debug(f"{self._url}: unsubscribing from wearable advanced-data")
+
+        self._unsubscribe(
+            "wearable_advanced_data",
+            _lib.tobii_wearable_advanced_data_unsubscribe,
+        )
+
+        self._wearable_advanced_data_buffer = None
+
+    def subscribe_wearable_foveated_gaze_native(
+        self, capacity: int
+    ) -> NativeWearableFoveatedGazeBuffer:
+        logger.debug(f"{self._url}: subscribing to wearable foveated-gaze (native)")
+
+        buffer = NativeWearableFoveatedGazeBuffer(capacity=capacity)
+
+        self._subscribe(
+            "wearable_foveated_gaze",
+            _lib.tobii_wearable_foveated_gaze_subscribe,
+            _lib.native_wearable_foveated_gaze_callback,
+            buffer._buffer_ptr,
+        )
+
+        self._wearable_foveated_gaze_buffer = buffer
+
+        return buffer
+
+    def unsubscribe_wearable_foveated_gaze(self) -> None:
+        if self._wearable_foveated_gaze_buffer is None:
+            return
+
+        logger.debug(f"{self._url}: unsubscribing from wearable foveated-gaze")
+
+        self._unsubscribe(
+            "wearable_foveated_gaze",
+            _lib.tobii_wearable_foveated_gaze_unsubscribe,
+        )
+
+        self._wearable_foveated_gaze_buffer = None
+
+    def gaze_points(
+        self,
+        maxsize: int = 1024,
+        overflow: OverflowPolicy = OverflowPolicy.DROP_OLDEST,
+    ) -> SampleStream[GazePoint]:
+        stream: SampleStream[GazePoint] = SampleStream(
+            device=self,
+            unsubscribe=self.unsubscribe_gaze_point,
+            maxsize=maxsize,
+            overflow=overflow,
+        )
+
+        def callback(*, timestamp: int, gaze_point: GazePoint) -> None:
+            stream._push(timestamp, gaze_point)
+
+        # the worker of other streams may be processing callbacks
+        with self._process_lock:
+            self._check_unsubscribed("gaze_point")
+            self.subscribe_gaze_point(callback=callback)
+
+        return stream
+
+    def gaze_origins(
+        self,
+        maxsize: int = 1024,
+        overflow: OverflowPolicy = OverflowPolicy.DROP_OLDEST,
+    ) -> SampleStream[GazeOrigin]:
+        stream: SampleStream[GazeOrigin] = SampleStream(
+            device=self,
+            unsubscribe=self.unsubscribe_gaze_origin,
+            maxsize=maxsize,
+            overflow=overflow,
+        )
+
+        def callback(*, timestamp: int, gaze_origin: GazeOrigin) -> None:
+            stream._push(timestamp, gaze_origin)
+
+        with self._process_lock:
+            self._check_unsubscribed("gaze_origin")
+            self.subscribe_gaze_origin(callback=callback)
+
+        return stream
+
+    def eye_positions(
+        self,
+        maxsize: int = 1024,
+        overflow: OverflowPolicy = OverflowPolicy.DROP_OLDEST,
+    ) -> SampleStream[EyePosition]:
+        stream: SampleStream[EyePosition] = SampleStream(
+            device=self,
+            unsubscribe=self.unsubscribe_eye_position,
+            maxsize=maxsize,
+            overflow=overflow,
+        )
+
+        def callback(*, timestamp: int, eye_position: EyePosition) -> None:
+            stream._push(timestamp, eye_position)
+
+        with self._process_lock:
+            self._check_unsubscribed("eye_position")
+            self.subscribe_eye_position(callback=callback)
+
+        return stream
+
+    def user_presences(
+        self,
+        maxsize: int = 1024,
+        overflow: OverflowPolicy = OverflowPolicy.DROP_OLDEST,
+    ) -> SampleStream[UserPresence]:
+        stream: SampleStream[UserPresence] = SampleStream(
+            device=self,
+            unsubscribe=self.unsubscribe_user_presence,
+            maxsize=maxsize,
+            overflow=overflow,
+        )
+
+        def callback(*, timestamp: int, user_presence: UserPresence) -> None:
+            stream._push(timestamp, user_presence)
+
+        with self._process_lock:
+            self._check_unsubscribed("user_presence")
+            self.subscribe_user_presence(callback=callback)
+
+        return stream
+
+    def _get_buffer(self, stream: Stream) -> SampleBuffer:
+        buffer: SampleBuffer | None = {
+            Stream.GAZE_POINT: self._gaze_point_buffer,
+            Stream.GAZE_ORIGIN: self._gaze_origin_buffer,
+            Stream.EYE_POSITION_NORMALIZED: self._eye_position_buffer,
+            Stream.GAZE_DATA: self._gaze_data_buffer,
+            Stream.HEAD_POSE: self._head_pose_buffer,
+        }.get(stream)
+
+        if buffer is None:
+            raise ValueError(f"stream '{stream.name}' is not subscribed as buffered")
+
+        return buffer
+
+    def drain(self, stream: Stream) -> Columns:
+        return self._get_buffer(stream).drain()
+
+    def drain_structured(self, stream: Stream) -> "numpy.typing.NDArray[Any]":
+        return to_structured_array(self.drain(stream))
+
+    def _received_samples(self) -> int:
+        received = self._callback_count
+        for buffer in (
+            self._gaze_point_buffer,
+            self._gaze_origin_buffer,
+            self._eye_position_buffer,
+            self._gaze_data_buffer,
+            self._head_pose_buffer,
+            self._wearable_consumer_data_buffer,
+            self._wearable_advanced_data_buffer,
+            self._wearable_foveated_gaze_buffer,
+        ):
+            if buffer is not None:
+                received += buffer.received
+        return received
+
+    def _process_callbacks(self) -> int:
+        received = self._received_samples()
+        started_ns = time.perf_counter_ns()
+
+        with self._process_lock:
             ret = _lib.tobii_device_process_callbacks(self._device_ptr)
+
+        raise_on_error(ret)
+
+        samples = self._received_samples() - received
+
+        if self._metrics is not None:
+            self._metrics._record_process(
+                duration_ns=time.perf_counter_ns() - started_ns,
+                samples=samples,
+                system_clock_us=self._api.get_system_clock(),
+            )
+
+        return samples
+
+    def run_once(self, timeout: float | None = None) -> int:
+        started_ns = time.perf_counter_ns()
+        ready = _wait_for_callbacks(
+            1,
+            self._device_ptr_ptr,
+            timeout,
+            metrics=() if self._metrics is None else (self._metrics,),
+        )
+
+        if self._metrics is not None:
+            self._metrics._record_wait(time.perf_counter_ns() - started_ns)
+
+        if not ready:
+            return 0
+
+        return self._process_callbacks()
+
+    def run(
+        self,
+        stop_event: threading.Event | None = None,
+        max_duration: float | None = None,
+        max_samples: int | None = None,
+        supervisor: "ReconnectSupervisor | None" = None,
+    ) -> int:
+        logger.debug(f"{self._url}: starting loop")
+
+        deadline = None if max_duration is None else time.monotonic() + max_duration
+        samples = 0
+
+        while stop_event is None or not stop_event.is_set():
+            if max_samples is not None and samples >= max_samples:
+                break
+
+            timeout = None
+            if deadline is not None:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+
+            try:
+                samples += self.run_once(timeout=timeout)
+            except (TobiiConnectionFailedError, TobiiConnectionFailedDriverError):
+                if supervisor is None:
+                    raise
+                if not supervisor.recover(stop_event=stop_event):
+                    break
+
+        logger.debug(f"{self._url}: stopped loop after {samples} samples")
+
+        return samples
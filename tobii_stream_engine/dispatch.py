@@ -0,0 +1,221 @@
+import logging
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass
+from types import TracebackType
+from typing import Any, TypeVar
+
+logger = logging.getLogger(__name__)
+
+C = TypeVar("C", bound=Callable[..., None])
+
+# bounds how long a worker sleeps if a wake-up was missed
+WAIT_INTERVAL = 0.1
+
+
+@dataclass(frozen=True, slots=True)
+class DispatchStatistics:
+    dispatched: int
+    dropped: int
+    mean_latency: float | None
+    max_latency: float | None
+
+
+class _StreamCounters:
+    __slots__ = ("dropped", "dispatched", "latency_ns", "max_latency_ns")
+
+    def __init__(self) -> None:
+        self.dropped = 0
+        self.dispatched = 0
+        self.latency_ns = 0
+        self.max_latency_ns = 0
+
+
+_Job = tuple[_StreamCounters, Callable[..., None], dict[str, Any], int]
+
+
+class _Worker:
+    __slots__ = ("jobs", "available")
+
+    def __init__(self) -> None:
+        # appended by the process_callbacks thread, popped by the worker thread
+        self.jobs: deque[_Job] = deque()
+        self.available = threading.Event()
+
+
+class _DispatchedCallback:
+    __slots__ = ("_dispatcher", "_worker", "_counters", "_callback")
+
+    def __init__(
+        self,
+        dispatcher: "Dispatcher",
+        worker: _Worker,
+        counters: _StreamCounters,
+        callback: Callable[..., None],
+    ) -> None:
+        self._dispatcher = dispatcher
+        self._worker = worker
+        self._counters = counters
+        self._callback = callback
+
+    def __call__(self, **kwargs: Any) -> None:
+        dispatcher = self._dispatcher
+        worker = self._worker
+        counters = self._counters
+
+        if dispatcher._stop.is_set():
+            counters.dropped += 1
+            dispatcher._warn_stopped()
+            return
+
+        if len(worker.jobs) >= dispatcher._maxsize:
+            counters.dropped += 1
+            return
+
+        worker.jobs.append((counters, self._callback, kwargs, time.perf_counter_ns()))
+        if not worker.available.is_set():
+            worker.available.set()
+
+
+class Dispatcher:
+    def __init__(self, maxsize: int = 4096, workers: int = 1) -> None:
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+        if workers <= 0:
+            raise ValueError("workers must be positive")
+
+        self._maxsize = maxsize
+
+        # every stream is pinned to one worker, so its callbacks run in order
+        self._workers = [_Worker() for _ in range(workers)]
+        self._stream_workers: dict[str, _Worker] = {}
+
+        # set while not running, samples arriving then are dropped
+        self._stop = threading.Event()
+        self._stop.set()
+        self._warned_stopped = False
+        self._threads: list[threading.Thread] = []
+
+        self._counters: dict[str, _StreamCounters] = {}
+        self._counters_lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return sum(len(worker.jobs) for worker in self._workers)
+
+    @property
+    def statistics(self) -> dict[str, DispatchStatistics]:
+        statistics = {}
+        for stream, counters in self._counters.items():
+            mean_latency = None
+            max_latency = None
+            if counters.dispatched:
+                mean_latency = counters.latency_ns / counters.dispatched / 1e9
+                max_latency = counters.max_latency_ns / 1e9
+
+            statistics[stream] = DispatchStatistics(
+                dispatched=counters.dispatched,
+                dropped=counters.dropped,
+                mean_latency=mean_latency,
+                max_latency=max_latency,
+            )
+        return statistics
+
+    def bind(self, stream: str, callback: C) -> C:
+        if not self._threads:
+            logger.warning(
+                f"binding '{stream}' to a dispatcher that is not running, "
+                f"its samples are dropped until it is started"
+            )
+
+        counters = self._counters.setdefault(stream, _StreamCounters())
+        worker = self._stream_workers.get(stream)
+        if worker is None:
+            worker = self._workers[len(self._stream_workers) % len(self._workers)]
+            self._stream_workers[stream] = worker
+
+        dispatched: C = _DispatchedCallback(  # type: ignore
+            self, worker, counters, callback
+        )
+        return dispatched
+
+    def _warn_stopped(self) -> None:
+        if self._warned_stopped:
+            return
+
+        self._warned_stopped = True
+        logger.warning("dispatcher is not running, dropping samples")
+
+    def _run(self, worker: _Worker) -> None:
+        jobs = worker.jobs
+        available = worker.available
+
+        while True:
+            try:
+                counters, callback, kwargs, enqueued_ns = jobs.popleft()
+            except IndexError:
+                if self._stop.is_set():
+                    return
+                available.clear()
+                if not jobs and not self._stop.is_set():
+                    available.wait(WAIT_INTERVAL)
+                continue
+
+            latency_ns = time.perf_counter_ns() - enqueued_ns
+            with self._counters_lock:
+                counters.dispatched += 1
+                counters.latency_ns += latency_ns
+                if latency_ns > counters.max_latency_ns:
+                    counters.max_latency_ns = latency_ns
+
+            try:
+                callback(**kwargs)
+            except Exception:
+                logger.exception("dispatched callback failed")
+
+    def start(self) -> None:
+        if self._threads:
+            return
+
+        logger.debug(f"starting dispatcher with {len(self._workers)} workers")
+
+        self._stop.clear()
+        self._warned_stopped = False
+        self._threads = [
+            threading.Thread(
+                target=self._run,
+                args=(worker,),
+                name=f"tobii-stream-engine dispatcher {index}",
+                daemon=True,
+            )
+            for index, worker in enumerate(self._workers)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def stop(self) -> None:
+        if not self._threads:
+            return
+
+        # workers drain the queued samples before they exit
+        self._stop.set()
+        for worker in self._workers:
+            worker.available.set()
+        for thread in self._threads:
+            thread.join()
+        self._threads = []
+
+        logger.debug("stopped dispatcher")
+
+    def __enter__(self) -> "Dispatcher":
+        self.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.stop()
@@ -1,5 +1,4 @@
-from _tobii_stream_engine_cffi import ffi as _ffi  # type: ignore
-from _tobii_stream_engine_cffi import lib as _lib  # type: ignore
+import functools
 
 
 class TobiiError(Exception):
@@ -78,33 +77,49 @@ class TobiiConnectionFailedDriverError(TobiiError):
     ...
 
 
-_exception_map = {
-    _lib.TOBII_ERROR_INTERNAL: TobiiInternalError,
-    _lib.TOBII_ERROR_INSUFFICIENT_LICENSE: TobiiInsufficientLicenseError,
-    _lib.TOBII_ERROR_NOT_SUPPORTED: TobiiNotSupportedError,
-    _lib.TOBII_ERROR_NOT_AVAILABLE: TobiiNotAvailableError,
-    _lib.TOBII_ERROR_CONNECTION_FAILED: TobiiConnectionFailedError,
-    _lib.TOBII_ERROR_TIMED_OUT: TobiiTimedOutError,
-    _lib.TOBII_ERROR_ALLOCATION_FAILED: TobiiAllocationFailedError,
-    _lib.TOBII_ERROR_INVALID_PARAMETER: TobiiInvalidParameterError,
-    _lib.TOBII_ERROR_CALIBRATION_ALREADY_STARTED: TobiiCalibrationAlreadyStartedError,
-    _lib.TOBII_ERROR_CALIBRATION_NOT_STARTED: TobiiCalibrationNotStartedError,
-    _lib.TOBII_ERROR_ALREADY_SUBSCRIBED: TobiiAlreadySubscribedError,
-    _lib.TOBII_ERROR_NOT_SUBSCRIBED: TobiiNotSupportedError,
-    _lib.TOBII_ERROR_OPERATION_FAILED: TobiiOperationFailedError,
-    _lib.TOBII_ERROR_CONFLICTING_API_INSTANCES: TobiiConflictingApiInstancesError,
-    _lib.TOBII_ERROR_CALIBRATION_BUSY: TobiiCalibrationBusyError,
-    _lib.TOBII_ERROR_CALLBACK_IN_PROGRESS: TobiiCallbackInProgressError,
-    _lib.TOBII_ERROR_TOO_MANY_SUBSCRIBERS: TobiiTooManySubscribersError,
-    _lib.TOBII_ERROR_CONNECTION_FAILED_DRIVER: TobiiConnectionFailedDriverError,
+# keyed by constant name, resolved once the library is loaded
+_exception_names = {
+    "TOBII_ERROR_INTERNAL": TobiiInternalError,
+    "TOBII_ERROR_INSUFFICIENT_LICENSE": TobiiInsufficientLicenseError,
+    "TOBII_ERROR_NOT_SUPPORTED": TobiiNotSupportedError,
+    "TOBII_ERROR_NOT_AVAILABLE": TobiiNotAvailableError,
+    "TOBII_ERROR_CONNECTION_FAILED": TobiiConnectionFailedError,
+    "TOBII_ERROR_TIMED_OUT": TobiiTimedOutError,
+    "TOBII_ERROR_ALLOCATION_FAILED": TobiiAllocationFailedError,
+    "TOBII_ERROR_INVALID_PARAMETER": TobiiInvalidParameterError,
+    "TOBII_ERROR_CALIBRATION_ALREADY_STARTED": TobiiCalibrationAlreadyStartedError,
+    "TOBII_ERROR_CALIBRATION_NOT_STARTED": TobiiCalibrationNotStartedError,
+    "TOBII_ERROR_ALREADY_SUBSCRIBED": TobiiAlreadySubscribedError,
+    "TOBII_ERROR_NOT_SUBSCRIBED": TobiiNotSupportedError,
+    "TOBII_ERROR_OPERATION_FAILED": TobiiOperationFailedError,
+    "TOBII_ERROR_CONFLICTING_API_INSTANCES": TobiiConflictingApiInstancesError,
+    "TOBII_ERROR_CALIBRATION_BUSY": TobiiCalibrationBusyError,
+    "TOBII_ERROR_CALLBACK_IN_PROGRESS": TobiiCallbackInProgressError,
+    "TOBII_ERROR_TOO_MANY_SUBSCRIBERS": TobiiTooManySubscribersError,
+    "TOBII_ERROR_CONNECTION_FAILED_DRIVER": TobiiConnectionFailedDriverError,
 }
 
 
+@functools.cache
+def _exception_map() -> dict[int, type[TobiiError]]:
+    from _tobii_stream_engine_cffi import lib as _lib  # type: ignore # noqa: PLC0415
+
+    return {
+        getattr(_lib, name): exception_class
+        for name, exception_class in _exception_names.items()
+    }
+
+
 def raise_on_error(return_value: int) -> None:
-    if return_value == _lib.TOBII_ERROR_NO_ERROR:
+    # TOBII_ERROR_NO_ERROR, compared without touching the library
+    if return_value == 0:
         return
 
-    exception_class = _exception_map.get(return_value, TobiiError)
+    # the library is only loaded once an error has to be described
+    from _tobii_stream_engine_cffi import ffi as _ffi  # noqa: PLC0415
+    from _tobii_stream_engine_cffi import lib as _lib  # noqa: PLC0415
+
+    exception_class = _exception_map().get(return_value, TobiiError)
     error_message = _lib.tobii_error_message(return_value)
     error_message = _ffi.string(error_message).decode()
     raise exception_class(error_message)
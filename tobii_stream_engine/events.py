@@ -0,0 +1,410 @@
+import abc
+import enum
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    import numpy
+    import numpy.typing
+
+    Samples = Mapping[str, Any] | numpy.typing.NDArray[Any]
+
+# TOBII_VALIDITY_VALID, spelled out to keep this module free of the native library
+VALIDITY_VALID = 1
+
+FIXATION = 0
+SACCADE = 1
+
+
+class GazeEventType(enum.Enum):
+    FIXATION = "fixation"
+    SACCADE = "saccade"
+    BLINK = "blink"
+
+
+@dataclass(frozen=True, slots=True)
+class GazeEvent:
+    type: GazeEventType
+    start_us: int
+    end_us: int
+    samples: int
+    x: float | None
+    y: float | None
+    dispersion: float | None
+    peak_velocity: float | None
+
+    @property
+    def duration_us(self) -> int:
+        return self.end_us - self.start_us
+
+
+class _Run:
+    __slots__ = (
+        "label",
+        "start_us",
+        "end_us",
+        "samples",
+        "sum_x",
+        "sum_y",
+        "min_x",
+        "max_x",
+        "min_y",
+        "max_y",
+        "peak_velocity",
+    )
+
+    def __init__(
+        self,
+        label: int,
+        start_us: int,
+        end_us: int,
+        samples: int,
+        sum_x: float,
+        sum_y: float,
+        min_x: float,
+        max_x: float,
+        min_y: float,
+        max_y: float,
+        peak_velocity: float,
+    ) -> None:
+        self.label = label
+        self.start_us = start_us
+        self.end_us = end_us
+        self.samples = samples
+        self.sum_x = sum_x
+        self.sum_y = sum_y
+        self.min_x = min_x
+        self.max_x = max_x
+        self.min_y = min_y
+        self.max_y = max_y
+        self.peak_velocity = peak_velocity
+
+    def extend(self, run: "_Run") -> None:
+        self.end_us = run.end_us
+        self.samples += run.samples
+        self.sum_x += run.sum_x
+        self.sum_y += run.sum_y
+        self.min_x = min(self.min_x, run.min_x)
+        self.max_x = max(self.max_x, run.max_x)
+        self.min_y = min(self.min_y, run.min_y)
+        self.max_y = max(self.max_y, run.max_y)
+        self.peak_velocity = max(self.peak_velocity, run.peak_velocity)
+
+    def to_event(self) -> GazeEvent:
+        return GazeEvent(
+            type=GazeEventType.SACCADE if self.label else GazeEventType.FIXATION,
+            start_us=self.start_us,
+            end_us=self.end_us,
+            samples=self.samples,
+            x=self.sum_x / self.samples,
+            y=self.sum_y / self.samples,
+            dispersion=(self.max_x - self.min_x) + (self.max_y - self.min_y),
+            peak_velocity=self.peak_velocity,
+        )
+
+
+def _numpy() -> Any:
+    try:
+        import numpy  # noqa: PLC0415
+    except ImportError as error:
+        raise ImportError(
+            "event detection requires numpy, install 'tobii-stream-engine[numpy]'"
+        ) from error
+    return numpy
+
+
+class _Detector(abc.ABC):
+    def __init__(
+        self,
+        output_frequency: float,
+        velocity_window_us: int,
+        min_fixation_duration_us: int,
+        max_gap_us: int,
+        max_blink_duration_us: int,
+    ) -> None:
+        if max_gap_us > max_blink_duration_us:
+            raise ValueError("max_gap_us must not exceed max_blink_duration_us")
+
+        self._numpy = numpy = _numpy()
+        self._min_fixation_duration_us = min_fixation_duration_us
+        self._max_gap_us = max_gap_us
+        self._max_blink_duration_us = max_blink_duration_us
+
+        # velocity is taken between the samples half a window before and after
+        self._half_window = max(1, round(velocity_window_us * output_frequency / 2e6))
+        # samples a label depends on, in either direction
+        self._reach = self._half_window
+
+        # labeled samples kept as context, followed by the ones awaiting a label
+        self._t = numpy.empty(0, dtype=numpy.int64)
+        self._x = numpy.empty(0, dtype=numpy.float64)
+        self._y = numpy.empty(0, dtype=numpy.float64)
+        self._labeled = 0
+        # the event in progress, it ends with the first sample not extending it
+        self._open: _Run | None = None
+
+    @property
+    def pending(self) -> int:
+        return len(self._t) - self._labeled
+
+    @abc.abstractmethod
+    def _classify(
+        self,
+        x: "numpy.typing.NDArray[numpy.float64]",
+        y: "numpy.typing.NDArray[numpy.float64]",
+        velocity: "numpy.typing.NDArray[numpy.float64]",
+        breaks: "numpy.typing.NDArray[numpy.bool_]",
+    ) -> "numpy.typing.NDArray[numpy.int8]": ...
+
+    def feed(self, samples: "Samples") -> list[GazeEvent]:
+        numpy = self._numpy
+
+        timestamps = numpy.asarray(samples["timestamp_us"], dtype=numpy.int64)
+        if not len(timestamps):
+            return []
+
+        valid = numpy.asarray(samples["validity"]) == VALIDITY_VALID
+        t = numpy.concatenate((self._t, timestamps[valid]))
+        x = numpy.concatenate((self._x, numpy.asarray(samples["x"])[valid]))
+        y = numpy.concatenate((self._y, numpy.asarray(samples["y"])[valid]))
+
+        # invalid for longer than a blink, nothing can extend the open event
+        closed = not len(t) or timestamps[-1] - t[-1] > self._max_blink_duration_us
+
+        return self._process(t, x, y, closed)
+
+    def flush(self) -> list[GazeEvent]:
+        return self._process(self._t, self._x, self._y, closed=True)
+
+    def _process(
+        self,
+        t: "numpy.typing.NDArray[numpy.int64]",
+        x: "numpy.typing.NDArray[numpy.float64]",
+        y: "numpy.typing.NDArray[numpy.float64]",
+        closed: bool,
+    ) -> list[GazeEvent]:
+        numpy = self._numpy
+        events: list[GazeEvent] = []
+        size = len(t)
+        labeled = self._labeled
+
+        if size > labeled:
+            previous_t = numpy.empty_like(t)
+            previous_t[0] = t[0]
+            previous_t[1:] = t[:-1]
+
+            # invalid or missing samples show up as gaps between valid ones
+            breaks = t - previous_t > self._max_gap_us
+            breaks[0] = True
+
+            index = numpy.arange(size)
+            starts = numpy.maximum.accumulate(numpy.where(breaks, index, 0))
+            following = numpy.where(breaks, index, size)
+            ends = numpy.minimum.accumulate(following[::-1])[::-1]
+            ends = numpy.append(ends[1:], size) - 1
+
+            low = numpy.maximum(index - self._half_window, starts)
+            high = numpy.minimum(index + self._half_window, ends)
+            with numpy.errstate(divide="ignore", invalid="ignore"):
+                velocity = numpy.hypot(x[high] - x[low], y[high] - y[low]) / (
+                    (t[high] - t[low]) * 1e-6
+                )
+            velocity[high == low] = 0.0
+
+            labels = self._classify(x, y, velocity, breaks)
+
+            # labels are final once every sample they depend on has arrived
+            if closed:
+                final = size
+            else:
+                gaps = numpy.flatnonzero(breaks)
+                final = max(size - self._reach, int(gaps[-1]), labeled)
+
+            if final > labeled:
+                events = self._runs(
+                    t[labeled:final],
+                    previous_t[labeled:final],
+                    x[labeled:final],
+                    y[labeled:final],
+                    velocity[labeled:final],
+                    breaks[labeled:final],
+                    labels[labeled:final],
+                )
+
+            context = max(final - self._reach, 0)
+            self._t, self._x, self._y = t[context:], x[context:], y[context:]
+            self._labeled = final - context
+
+        if closed and self._open is not None:
+            self._close(self._open, events)
+            self._open = None
+
+        return events
+
+    def _runs(
+        self,
+        t: "numpy.typing.NDArray[numpy.int64]",
+        previous_t: "numpy.typing.NDArray[numpy.int64]",
+        x: "numpy.typing.NDArray[numpy.float64]",
+        y: "numpy.typing.NDArray[numpy.float64]",
+        velocity: "numpy.typing.NDArray[numpy.float64]",
+        breaks: "numpy.typing.NDArray[numpy.bool_]",
+        labels: "numpy.typing.NDArray[numpy.int8]",
+    ) -> list[GazeEvent]:
+        numpy = self._numpy
+
+        changes = numpy.empty(len(labels), dtype=numpy.bool_)
+        changes[0] = True
+        numpy.not_equal(labels[1:], labels[:-1], out=changes[1:])
+        changes |= breaks
+        starts = numpy.flatnonzero(changes)
+        ends = numpy.append(starts[1:], len(labels)) - 1
+
+        # a sample covers the interval since its predecessor
+        start_us = numpy.where(breaks[starts], t[starts], previous_t[starts])
+        gap_us = t[starts] - previous_t[starts]
+
+        columns = zip(
+            labels[starts].tolist(),
+            breaks[starts].tolist(),
+            start_us.tolist(),
+            t[ends].tolist(),
+            gap_us.tolist(),
+            (ends - starts + 1).tolist(),
+            numpy.add.reduceat(x, starts).tolist(),
+            numpy.add.reduceat(y, starts).tolist(),
+            numpy.minimum.reduceat(x, starts).tolist(),
+            numpy.maximum.reduceat(x, starts).tolist(),
+            numpy.minimum.reduceat(y, starts).tolist(),
+            numpy.maximum.reduceat(y, starts).tolist(),
+            numpy.maximum.reduceat(velocity, starts).tolist(),
+            strict=True,
+        )
+
+        events: list[GazeEvent] = []
+        for label, after_break, *aggregates in columns:
+            start, end, gap, samples, *extents = aggregates
+            run = _Run(label, start, end, samples, *extents)
+
+            current = self._open
+            if current is not None and not after_break and current.label == label:
+                current.extend(run)
+                continue
+
+            if current is not None:
+                self._close(current, events)
+
+            # the first sample ever is a break without a gap before it
+            if after_break and 0 < gap <= self._max_blink_duration_us:
+                events.append(
+                    GazeEvent(
+                        type=GazeEventType.BLINK,
+                        start_us=start - gap,
+                        end_us=start,
+                        samples=0,
+                        x=None,
+                        y=None,
+                        dispersion=None,
+                        peak_velocity=None,
+                    )
+                )
+
+            self._open = run
+
+        return events
+
+    def _close(self, run: _Run, events: list[GazeEvent]) -> None:
+        if (
+            run.label == FIXATION
+            and run.end_us - run.start_us < self._min_fixation_duration_us
+        ):
+            return
+        events.append(run.to_event())
+
+
+class VelocityThresholdDetector(_Detector):
+    def __init__(
+        self,
+        output_frequency: float,
+        velocity_threshold: float = 1.0,
+        velocity_window_us: int = 20_000,
+        min_fixation_duration_us: int = 60_000,
+        max_gap_us: int = 75_000,
+        max_blink_duration_us: int = 500_000,
+    ) -> None:
+        super().__init__(
+            output_frequency=output_frequency,
+            velocity_window_us=velocity_window_us,
+            min_fixation_duration_us=min_fixation_duration_us,
+            max_gap_us=max_gap_us,
+            max_blink_duration_us=max_blink_duration_us,
+        )
+        self._velocity_threshold = velocity_threshold
+
+    def _classify(
+        self,
+        x: "numpy.typing.NDArray[numpy.float64]",
+        y: "numpy.typing.NDArray[numpy.float64]",
+        velocity: "numpy.typing.NDArray[numpy.float64]",
+        breaks: "numpy.typing.NDArray[numpy.bool_]",
+    ) -> "numpy.typing.NDArray[numpy.int8]":
+        return (velocity > self._velocity_threshold).astype(self._numpy.int8)
+
+
+class DispersionThresholdDetector(_Detector):
+    def __init__(
+        self,
+        output_frequency: float,
+        dispersion_threshold: float = 0.03,
+        velocity_window_us: int = 20_000,
+        min_fixation_duration_us: int = 100_000,
+        max_gap_us: int = 75_000,
+        max_blink_duration_us: int = 500_000,
+    ) -> None:
+        super().__init__(
+            output_frequency=output_frequency,
+            velocity_window_us=velocity_window_us,
+            min_fixation_duration_us=min_fixation_duration_us,
+            max_gap_us=max_gap_us,
+            max_blink_duration_us=max_blink_duration_us,
+        )
+        self._dispersion_threshold = dispersion_threshold
+        self._window = max(2, round(min_fixation_duration_us * output_frequency / 1e6))
+        self._reach = max(self._reach, self._window - 1)
+
+    def _classify(
+        self,
+        x: "numpy.typing.NDArray[numpy.float64]",
+        y: "numpy.typing.NDArray[numpy.float64]",
+        velocity: "numpy.typing.NDArray[numpy.float64]",
+        breaks: "numpy.typing.NDArray[numpy.bool_]",
+    ) -> "numpy.typing.NDArray[numpy.int8]":
+        numpy = self._numpy
+        size = len(x)
+        window = self._window
+
+        covered = numpy.zeros(size, dtype=numpy.bool_)
+        if size >= window:
+            xs = numpy.lib.stride_tricks.sliding_window_view(x, window)
+            ys = numpy.lib.stride_tricks.sliding_window_view(y, window)
+            dispersion = (
+                xs.max(axis=1) - xs.min(axis=1) + ys.max(axis=1) - ys.min(axis=1)
+            )
+
+            # windows must not reach across a gap
+            crossed = numpy.cumsum(breaks)
+            within = crossed[window - 1 :] == crossed[: size - window + 1]
+            fixations = within & (dispersion <= self._dispersion_threshold)
+
+            # a sample is part of a fixation if any window holding it is one
+            windows = numpy.zeros(size + 1, dtype=numpy.int64)
+            numpy.cumsum(fixations, out=windows[1 : size - window + 2])
+            windows[size - window + 2 :] = windows[size - window + 1]
+            index = numpy.arange(size)
+            low = numpy.maximum(index - window + 1, 0)
+            high = numpy.minimum(index, size - window) + 1
+            covered = windows[high] > windows[low]
+
+        labels = numpy.where(covered, FIXATION, SACCADE).astype(numpy.int8)
+        return labels  # type: ignore[no-any-return]
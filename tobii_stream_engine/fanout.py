@@ -0,0 +1,256 @@
+import enum
+import logging
+import threading
+from collections import deque
+from collections.abc import Iterator
+from types import TracebackType
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
+
+if TYPE_CHECKING:
+    from tobii_stream_engine.device import Device
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+FANOUT_STREAMS = (
+    "gaze_point",
+    "gaze_origin",
+    "eye_position",
+    "gaze_data",
+    "head_pose",
+    "user_presence",
+)
+
+COMPACT_STREAMS = ("gaze_point", "gaze_origin", "eye_position")
+
+# a decimating consumer keeps at least every MAX_STRIDE-th sample
+MAX_STRIDE = 256
+
+
+class SlowConsumerPolicy(enum.Enum):
+    DROP_OLDEST = enum.auto()
+    DECIMATE = enum.auto()
+    DISCONNECT = enum.auto()
+
+
+class FanoutConsumer(Generic[T]):
+    def __init__(
+        self,
+        fanout: "Fanout[T]",
+        maxsize: int,
+        policy: SlowConsumerPolicy,
+    ) -> None:
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+
+        self._fanout = fanout
+        self._maxsize = maxsize
+        self._policy = policy
+
+        # appended by the publishing thread, popped by the consuming thread
+        self._samples: deque[tuple[int, T]] = deque(maxlen=maxsize)
+        self._available = threading.Event()
+        self._closed = False
+
+        # owned by the publishing thread
+        self._received = 0
+        self._dropped = 0
+        self._stride = 1
+        self._skipped = 0
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    @property
+    def received(self) -> int:
+        return self._received
+
+    @property
+    def dropped(self) -> int:
+        return self._dropped
+
+    @property
+    def stride(self) -> int:
+        return self._stride
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def _put(self, timestamp: int, sample: T) -> None:
+        self._received += 1
+        samples = self._samples
+
+        if self._policy is SlowConsumerPolicy.DECIMATE:
+            # keep every stride-th sample, narrow it again once the queue drained
+            if self._stride > 1 and len(samples) <= self._maxsize // 2:
+                self._stride //= 2
+
+            self._skipped += 1
+            if self._skipped < self._stride:
+                self._dropped += 1
+                return
+            self._skipped = 0
+
+            # only a kept sample finding the queue full widens the stride
+            if len(samples) == self._maxsize and self._stride < MAX_STRIDE:
+                self._stride *= 2
+
+        if len(samples) == self._maxsize:
+            if self._policy is SlowConsumerPolicy.DISCONNECT:
+                logger.warning(
+                    f"{self._fanout._device._url}: disconnecting slow "
+                    f"{self._fanout._stream} consumer"
+                )
+                self._dropped += 1
+                self.close()
+                return
+            self._dropped += 1
+
+        samples.append((timestamp, sample))
+        if not self._available.is_set():
+            self._available.set()
+
+    def get(self, timeout: float | None = None) -> tuple[int, T] | None:
+        while True:
+            try:
+                return self._samples.popleft()
+            except IndexError:
+                pass
+
+            if self._closed:
+                return None
+
+            self._available.clear()
+            if self._samples:
+                continue
+            if not self._available.wait(timeout) and not self._samples:
+                return None
+
+    def drain(self) -> list[tuple[int, T]]:
+        samples = []
+        try:
+            while True:
+                samples.append(self._samples.popleft())
+        except IndexError:
+            pass
+        return samples
+
+    def __iter__(self) -> Iterator[tuple[int, T]]:
+        while True:
+            sample = self.get()
+            if sample is None:
+                return
+            yield sample
+
+    def close(self) -> None:
+        if self._closed:
+            return
+
+        self._closed = True
+        self._available.set()
+        self._fanout._detach(self)
+
+
+class Fanout(Generic[T]):
+    def __init__(self, device: "Device", stream: str, compact: bool = False) -> None:
+        if stream not in FANOUT_STREAMS:
+            raise ValueError(f"unknown stream '{stream}'")
+        if compact and stream not in COMPACT_STREAMS:
+            raise ValueError(f"stream '{stream}' has no compact samples")
+
+        self._device = device
+        self._stream = stream
+        self._compact = compact
+
+        # replaced as a whole, the publishing thread iterates without locking
+        self._consumers: tuple[FanoutConsumer[T], ...] = ()
+        self._lock = threading.Lock()
+        self._attached = False
+
+    @property
+    def consumers(self) -> tuple[FanoutConsumer[T], ...]:
+        return self._consumers
+
+    def _publish(self, timestamp: int, sample: T) -> None:
+        for consumer in self._consumers:
+            consumer._put(timestamp, sample)
+
+    def _on_gaze_point(self, *, timestamp: int, gaze_point: T) -> None:
+        self._publish(timestamp, gaze_point)
+
+    def _on_gaze_origin(self, *, timestamp: int, gaze_origin: T) -> None:
+        self._publish(timestamp, gaze_origin)
+
+    def _on_eye_position(self, *, timestamp: int, eye_position: T) -> None:
+        self._publish(timestamp, eye_position)
+
+    def _on_gaze_data(self, *, timestamp: int, gaze_data: T) -> None:
+        self._publish(timestamp, gaze_data)
+
+    def _on_head_pose(self, *, timestamp: int, head_pose: T) -> None:
+        self._publish(timestamp, head_pose)
+
+    def _on_user_presence(self, *, timestamp: int, user_presence: T) -> None:
+        self._publish(timestamp, user_presence)
+
+    def _attach_device(self) -> None:
+        logger.debug(f"{self._device._url}: fanning out {self._stream}")
+
+        subscribe = getattr(self._device, f"subscribe_{self._stream}")
+        callback = getattr(self, f"_on_{self._stream}")
+
+        kwargs: dict[str, Any] = {}
+        if self._compact:
+            kwargs["compact"] = True
+
+        subscribe(callback=callback, **kwargs)
+
+    def subscribe(
+        self,
+        maxsize: int = 1024,
+        policy: SlowConsumerPolicy = SlowConsumerPolicy.DROP_OLDEST,
+    ) -> FanoutConsumer[T]:
+        consumer: FanoutConsumer[T] = FanoutConsumer(
+            fanout=self,
+            maxsize=maxsize,
+            policy=policy,
+        )
+
+        with self._lock:
+            if not self._attached:
+                self._attach_device()
+                self._attached = True
+            self._consumers = (*self._consumers, consumer)
+
+        return consumer
+
+    def _detach(self, consumer: FanoutConsumer[T]) -> None:
+        # may run inside process_callbacks, so the device stays subscribed
+        with self._lock:
+            self._consumers = tuple(c for c in self._consumers if c is not consumer)
+
+    def close(self) -> None:
+        for consumer in self._consumers:
+            consumer.close()
+
+        with self._lock:
+            if not self._attached:
+                return
+
+            logger.debug(f"{self._device._url}: closing {self._stream} fan-out")
+
+            getattr(self._device, f"unsubscribe_{self._stream}")()
+            self._attached = False
+
+    def __enter__(self) -> "Fanout[T]":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
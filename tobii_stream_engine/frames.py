@@ -0,0 +1,173 @@
+import logging
+from collections.abc import Iterable
+from dataclasses import dataclass
+from types import TracebackType
+from typing import TYPE_CHECKING, Any, Protocol
+
+if TYPE_CHECKING:
+    from tobii_stream_engine.device import Device
+    from tobii_stream_engine.samples import EyePosition, GazeOrigin, GazePoint
+
+logger = logging.getLogger(__name__)
+
+FRAME_STREAMS = ("gaze_point", "gaze_origin", "eye_position")
+
+
+@dataclass(frozen=True, slots=True)
+class Frame:
+    gaze_point: "GazePoint | None"
+    gaze_origin: "GazeOrigin | None"
+    eye_position: "EyePosition | None"
+    missing: tuple[str, ...]
+
+    @property
+    def complete(self) -> bool:
+        return not self.missing
+
+
+class FrameCallback(Protocol):
+    def __call__(self, *, timestamp: int, frame: Frame) -> None:
+        ...
+
+
+class FrameAssembler:
+    def __init__(
+        self,
+        device: "Device",
+        callback: FrameCallback,
+        streams: Iterable[str] = FRAME_STREAMS,
+        window: int = 8,
+    ) -> None:
+        if window <= 0:
+            raise ValueError("window must be positive")
+
+        self._device = device
+        self._callback = callback
+        self._streams = list(dict.fromkeys(streams))
+        self._window = window
+
+        for stream in self._streams:
+            if stream not in FRAME_STREAMS:
+                raise ValueError(f"unknown stream '{stream}'")
+
+        self._indices = [FRAME_STREAMS.index(stream) for stream in self._streams]
+
+        # pending frames live in fixed slots, ordered oldest first from _head
+        self._timestamps: list[int] = [0] * window
+        self._samples: list[list[Any]] = [
+            [None] * len(FRAME_STREAMS) for _ in range(window)
+        ]
+        self._counts = [0] * window
+        self._head = 0
+        self._size = 0
+
+        self._frames = 0
+        self._incomplete_frames = 0
+
+    @property
+    def frames(self) -> int:
+        return self._frames
+
+    @property
+    def incomplete_frames(self) -> int:
+        return self._incomplete_frames
+
+    def _emit_oldest(self) -> None:
+        slot = self._head
+        samples = self._samples[slot]
+        missing = tuple(
+            stream
+            for stream, index in zip(self._streams, self._indices, strict=True)
+            if samples[index] is None
+        )
+
+        frame = Frame(
+            gaze_point=samples[0],
+            gaze_origin=samples[1],
+            eye_position=samples[2],
+            missing=missing,
+        )
+        timestamp = self._timestamps[slot]
+
+        samples[0] = samples[1] = samples[2] = None
+        self._counts[slot] = 0
+        self._head = (slot + 1) % self._window
+        self._size -= 1
+
+        self._frames += 1
+        if missing:
+            self._incomplete_frames += 1
+
+        self._callback(timestamp=timestamp, frame=frame)
+
+    def _add(self, index: int, timestamp: int, sample: Any) -> None:
+        window = self._window
+        timestamps = self._timestamps
+
+        for offset in range(self._size - 1, -1, -1):
+            slot = (self._head + offset) % window
+            if timestamps[slot] == timestamp:
+                break
+        else:
+            if self._size == window:
+                self._emit_oldest()
+
+            slot = (self._head + self._size) % window
+            timestamps[slot] = timestamp
+            self._size += 1
+
+        samples = self._samples[slot]
+        if samples[index] is None:
+            self._counts[slot] += 1
+        samples[index] = sample
+
+        if self._counts[slot] == len(self._streams):
+            # frames older than a complete one will not be completed anymore
+            while self._size and self._head != slot:
+                self._emit_oldest()
+            self._emit_oldest()
+
+    def _on_gaze_point(self, *, timestamp: int, gaze_point: "GazePoint") -> None:
+        self._add(0, timestamp, gaze_point)
+
+    def _on_gaze_origin(self, *, timestamp: int, gaze_origin: "GazeOrigin") -> None:
+        self._add(1, timestamp, gaze_origin)
+
+    def _on_eye_position(self, *, timestamp: int, eye_position: "EyePosition") -> None:
+        self._add(2, timestamp, eye_position)
+
+    def flush(self) -> None:
+        while self._size:
+            self._emit_oldest()
+
+    def start(self) -> None:
+        logger.debug(f"assembling frames from {', '.join(self._streams)}")
+
+        if "gaze_point" in self._streams:
+            self._device.subscribe_gaze_point(callback=self._on_gaze_point)
+        if "gaze_origin" in self._streams:
+            self._device.subscribe_gaze_origin(callback=self._on_gaze_origin)
+        if "eye_position" in self._streams:
+            self._device.subscribe_eye_position(callback=self._on_eye_position)
+
+    def stop(self) -> None:
+        if "gaze_point" in self._streams:
+            self._device.unsubscribe_gaze_point()
+        if "gaze_origin" in self._streams:
+            self._device.unsubscribe_gaze_origin()
+        if "eye_position" in self._streams:
+            self._device.unsubscribe_eye_position()
+
+        self.flush()
+
+    def __enter__(self) -> "FrameAssembler":
+        self.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.stop()
@@ -0,0 +1,120 @@
+import logging
+import threading
+import time
+from collections.abc import Sequence
+
+from _tobii_stream_engine_cffi import ffi as _ffi  # type: ignore
+
+from tobii_stream_engine.device import Device, _wait_for_callbacks
+from tobii_stream_engine.reconnect import CONNECTION_ERRORS, ReconnectSupervisor
+
+logger = logging.getLogger(__name__)
+
+
+class DeviceGroup:
+    def __init__(self, devices: Sequence[Device]) -> None:
+        if not devices:
+            raise ValueError("device-group requires at least one device")
+
+        self._devices = list(devices)
+        self._device_ptrs = _ffi.new(
+            "tobii_device_t *[]",
+            [device._device_ptr for device in self._devices],
+        )
+        # the shared wait counts for every measured device of the group
+        self._metrics = [
+            device._metrics for device in self._devices if device._metrics is not None
+        ]
+
+    @property
+    def devices(self) -> list[Device]:
+        return list(self._devices)
+
+    def run_once(self, timeout: float | None = None) -> int:
+        samples, _ = self._run_once(timeout, supervisors={}, stop_event=None)
+        return samples
+
+    def _run_once(
+        self,
+        timeout: float | None,
+        supervisors: dict[int, ReconnectSupervisor],
+        stop_event: threading.Event | None,
+    ) -> tuple[int, bool]:
+        wait_error = None
+        started_ns = time.perf_counter_ns()
+        try:
+            ready = _wait_for_callbacks(
+                len(self._devices), self._device_ptrs, timeout, metrics=self._metrics
+            )
+        except CONNECTION_ERRORS as error:
+            # the shared wait does not tell which device was lost
+            wait_error = error
+            ready = True
+        else:
+            wait_duration_ns = time.perf_counter_ns() - started_ns
+            for metrics in self._metrics:
+                metrics._record_wait(wait_duration_ns)
+
+        if not ready:
+            return 0, True
+
+        samples = 0
+        lost = False
+        for device in self._devices:
+            try:
+                samples += device._process_callbacks()
+            except CONNECTION_ERRORS:
+                supervisor = supervisors.get(id(device))
+                if supervisor is None:
+                    raise
+                lost = True
+                # the other devices wait while this one is being recovered
+                if not supervisor.recover(stop_event=stop_event):
+                    return samples, False
+
+        if wait_error is not None and not lost:
+            raise wait_error
+
+        return samples, True
+
+    def run(
+        self,
+        stop_event: threading.Event | None = None,
+        max_duration: float | None = None,
+        max_samples: int | None = None,
+        supervisors: Sequence[ReconnectSupervisor] = (),
+    ) -> int:
+        logger.debug(f"starting loop for {len(self._devices)} devices")
+
+        supervisors_by_device = {
+            id(supervisor._device): supervisor for supervisor in supervisors
+        }
+        device_ids = {id(device) for device in self._devices}
+        if not supervisors_by_device.keys() <= device_ids:
+            raise ValueError("supervisors must belong to devices of the group")
+
+        deadline = None if max_duration is None else time.monotonic() + max_duration
+        samples = 0
+
+        while stop_event is None or not stop_event.is_set():
+            if max_samples is not None and samples >= max_samples:
+                break
+
+            timeout = None
+            if deadline is not None:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+
+            processed, running = self._run_once(
+                timeout, supervisors=supervisors_by_device, stop_event=stop_event
+            )
+            samples += processed
+            if not running:
+                break
+
+        logger.debug(
+            f"stopped loop for {len(self._devices)} devices after {samples} samples"
+        )
+
+        return samples
@@ -0,0 +1,313 @@
+import array
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any, TypeVar
+
+C = TypeVar("C", bound=Callable[..., None])
+
+# streams delivering events rather than samples at the output frequency
+EVENT_STREAMS = ("user_presence", "digital_syncport")
+
+
+@dataclass(frozen=True, slots=True)
+class HistogramSnapshot:
+    count: int
+    min: int | None
+    max: int | None
+    mean: float | None
+    p50: int | None
+    p90: int | None
+    p99: int | None
+    p999: int | None
+
+
+class Histogram:
+    def __init__(self, significant_bits: int = 5, max_value: int = 1 << 40) -> None:
+        self._significant_bits = significant_bits
+        self._sub_buckets = 1 << significant_bits
+        self._max_value = max_value
+        self._counts = array.array("Q", [0]) * (self._index(max_value) + 1)
+        self._count = 0
+        self._sum = 0
+        self._min: int | None = None
+        self._max: int | None = None
+
+    def _index(self, value: int) -> int:
+        # linear below two sub-bucket ranges, then sub-buckets per power of two
+        if value < 2 * self._sub_buckets:
+            return value
+        shift = value.bit_length() - self._significant_bits - 1
+        return shift * self._sub_buckets + (value >> shift)
+
+    def _value(self, index: int) -> int:
+        if index < 2 * self._sub_buckets:
+            return index
+        shift = index // self._sub_buckets - 1
+        return (index - shift * self._sub_buckets) << shift
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    def record(self, value: int) -> None:
+        self.record_many([value])
+
+    def record_many(self, values: list[int]) -> None:
+        if not values:
+            return
+
+        max_value = self._max_value
+        low = min(values)
+        high = max(values)
+        if low < 0 or high > max_value:
+            values = [min(max(value, 0), max_value) for value in values]
+            low = min(values)
+            high = max(values)
+
+        # inlined _index, this runs for every sample
+        counts = self._counts
+        significant_bits = self._significant_bits
+        sub_buckets = self._sub_buckets
+        linear_limit = 2 * sub_buckets
+        for value in values:
+            if value < linear_limit:
+                counts[value] += 1
+            else:
+                shift = value.bit_length() - significant_bits - 1
+                counts[shift * sub_buckets + (value >> shift)] += 1
+
+        self._count += len(values)
+        self._sum += sum(values)
+        if self._min is None or low < self._min:
+            self._min = low
+        if self._max is None or high > self._max:
+            self._max = high
+
+    def percentile(self, percentile: float) -> int | None:
+        if not self._count:
+            return None
+
+        rank = max(1, round(self._count * percentile / 100))
+        seen = 0
+        for index, count in enumerate(self._counts):
+            seen += count
+            if seen >= rank:
+                value = self._value(index)
+                return min(max(value, self._min or 0), self._max or 0)
+
+        return self._max
+
+    def snapshot(self) -> HistogramSnapshot:
+        return HistogramSnapshot(
+            count=self._count,
+            min=self._min,
+            max=self._max,
+            mean=self._sum / self._count if self._count else None,
+            p50=self.percentile(50),
+            p90=self.percentile(90),
+            p99=self.percentile(99),
+            p999=self.percentile(99.9),
+        )
+
+    def reset(self) -> None:
+        self._counts = array.array("Q", [0]) * len(self._counts)
+        self._count = 0
+        self._sum = 0
+        self._min = None
+        self._max = None
+
+
+@dataclass(frozen=True, slots=True)
+class StreamMetricsSnapshot:
+    samples: int
+    samples_per_second: float
+    gaps: int
+    missed_samples: int
+    callback_duration_ns: HistogramSnapshot
+    latency_us: HistogramSnapshot
+
+
+@dataclass(frozen=True, slots=True)
+class MetricsSnapshot:
+    elapsed: float
+    wait_duration_ns: HistogramSnapshot
+    process_duration_ns: HistogramSnapshot
+    samples_per_process: HistogramSnapshot
+    timeout_spins: int
+    streams: dict[str, StreamMetricsSnapshot]
+
+
+class _StreamMetrics:
+    def __init__(self) -> None:
+        self.samples = 0
+        self.gaps = 0
+        self.missed_samples = 0
+        self.last_timestamp_us: int | None = None
+        self.gap_threshold_us: float | None = None
+        self.interval_us: float | None = None
+        self.callback_duration_ns = Histogram()
+        self.latency_us = Histogram()
+        self.scraped_samples = 0
+
+        # appended per sample, folded into the histograms once per batch
+        self.pending_durations_ns: list[int] = []
+        self.pending_timestamps_us: list[int] = []
+
+    def flush(self, system_clock_us: int) -> None:
+        # runs on the thread appending to the pending lists, they are reused
+        durations_ns = self.pending_durations_ns
+        timestamps_us = self.pending_timestamps_us
+        if not timestamps_us:
+            return
+
+        self.samples += len(timestamps_us)
+        self.callback_duration_ns.record_many(durations_ns)
+        self.latency_us.record_many(
+            [system_clock_us - timestamp_us for timestamp_us in timestamps_us]
+        )
+
+        if self.gap_threshold_us is not None and self.interval_us is not None:
+            previous_us = self.last_timestamp_us
+            if previous_us is None:
+                previous_us = timestamps_us[0]
+
+            gap_threshold_us = self.gap_threshold_us
+            for timestamp_us in timestamps_us:
+                delta_us = timestamp_us - previous_us
+                if delta_us > gap_threshold_us:
+                    self.gaps += 1
+                    self.missed_samples += round(delta_us / self.interval_us) - 1
+                previous_us = timestamp_us
+            self.last_timestamp_us = previous_us
+
+        durations_ns.clear()
+        timestamps_us.clear()
+
+
+def _measured(name: str, stream: _StreamMetrics, callback: Callable[..., Any]) -> Any:
+    # spelled out per stream, forwarding **kwargs would double the overhead
+    perf_counter_ns = time.perf_counter_ns
+    append_duration_ns = stream.pending_durations_ns.append
+    append_timestamp_us = stream.pending_timestamps_us.append
+
+    def gaze_point(*, timestamp: int, gaze_point: Any) -> None:
+        started_ns = perf_counter_ns()
+        callback(timestamp=timestamp, gaze_point=gaze_point)
+        append_duration_ns(perf_counter_ns() - started_ns)
+        append_timestamp_us(timestamp)
+
+    def gaze_origin(*, timestamp: int, gaze_origin: Any) -> None:
+        started_ns = perf_counter_ns()
+        callback(timestamp=timestamp, gaze_origin=gaze_origin)
+        append_duration_ns(perf_counter_ns() - started_ns)
+        append_timestamp_us(timestamp)
+
+    def eye_position(*, timestamp: int, eye_position: Any) -> None:
+        started_ns = perf_counter_ns()
+        callback(timestamp=timestamp, eye_position=eye_position)
+        append_duration_ns(perf_counter_ns() - started_ns)
+        append_timestamp_us(timestamp)
+
+    def any_stream(*, timestamp: int, **kwargs: Any) -> None:
+        started_ns = perf_counter_ns()
+        callback(timestamp=timestamp, **kwargs)
+        append_duration_ns(perf_counter_ns() - started_ns)
+        append_timestamp_us(timestamp)
+
+    measured: dict[str, Callable[..., None]] = {
+        "gaze_point": gaze_point,
+        "gaze_origin": gaze_origin,
+        "eye_position": eye_position,
+    }
+    return measured.get(name, any_stream)
+
+
+class DeviceMetrics:
+    def __init__(self, gap_factor: float = 1.5) -> None:
+        self._gap_factor = gap_factor
+        self._output_frequency: float | None = None
+
+        self._wait_duration_ns = Histogram()
+        self._process_duration_ns = Histogram()
+        self._samples_per_process = Histogram()
+        self._timeout_spins = 0
+        self._streams: dict[str, _StreamMetrics] = {}
+
+        self._started_at = time.monotonic()
+        self._scraped_at = self._started_at
+        self._lock = threading.Lock()
+
+    def _set_output_frequency(self, output_frequency: float) -> None:
+        with self._lock:
+            self._output_frequency = output_frequency
+            for name, stream in self._streams.items():
+                self._configure_stream(name, stream)
+
+    def _configure_stream(self, name: str, stream: _StreamMetrics) -> None:
+        if name in EVENT_STREAMS or not self._output_frequency:
+            return
+
+        stream.interval_us = 1e6 / self._output_frequency
+        stream.gap_threshold_us = stream.interval_us * self._gap_factor
+        stream.last_timestamp_us = None
+
+    def bind(self, name: str, callback: C) -> C:
+        with self._lock:
+            stream = self._streams.get(name)
+            if stream is None:
+                stream = self._streams[name] = _StreamMetrics()
+                self._configure_stream(name, stream)
+
+        measured: C = _measured(name, stream, callback)
+        return measured
+
+    def _record_wait(self, duration_ns: int) -> None:
+        with self._lock:
+            self._wait_duration_ns.record(duration_ns)
+
+    def _record_timeout_spin(self) -> None:
+        with self._lock:
+            self._timeout_spins += 1
+
+    def _record_process(
+        self, duration_ns: int, samples: int, system_clock_us: int
+    ) -> None:
+        with self._lock:
+            self._process_duration_ns.record(duration_ns)
+            self._samples_per_process.record(samples)
+
+            # one clock read per batch, latency of every sample delivered in it
+            for stream in self._streams.values():
+                stream.flush(system_clock_us)
+
+    def snapshot(self) -> MetricsSnapshot:
+        with self._lock:
+            now = time.monotonic()
+            interval = now - self._scraped_at
+            self._scraped_at = now
+
+            streams = {}
+            for name, stream in self._streams.items():
+                samples = stream.samples
+                scraped = samples - stream.scraped_samples
+                stream.scraped_samples = samples
+
+                streams[name] = StreamMetricsSnapshot(
+                    samples=samples,
+                    samples_per_second=scraped / interval if interval > 0 else 0.0,
+                    gaps=stream.gaps,
+                    missed_samples=stream.missed_samples,
+                    callback_duration_ns=stream.callback_duration_ns.snapshot(),
+                    latency_us=stream.latency_us.snapshot(),
+                )
+
+            return MetricsSnapshot(
+                elapsed=now - self._started_at,
+                wait_duration_ns=self._wait_duration_ns.snapshot(),
+                process_duration_ns=self._process_duration_ns.snapshot(),
+                samples_per_process=self._samples_per_process.snapshot(),
+                timeout_spins=self._timeout_spins,
+                streams=streams,
+            )
@@ -0,0 +1,189 @@
+import array
+from collections.abc import Callable, Mapping
+from typing import Any
+
+from _tobii_stream_engine_cffi import ffi as _ffi  # type: ignore
+from _tobii_stream_engine_cffi import lib as _lib
+
+from tobii_stream_engine.buffers import (
+    EYE_POSITION_COLUMNS,
+    GAZE_DATA_COLUMNS,
+    GAZE_ORIGIN_COLUMNS,
+    GAZE_POINT_COLUMNS,
+    HEAD_POSE_COLUMNS,
+    WEARABLE_ADVANCED_DATA_COLUMNS,
+    WEARABLE_CONSUMER_DATA_COLUMNS,
+    WEARABLE_FOVEATED_GAZE_COLUMNS,
+    Columns,
+)
+
+_ctype_map = {
+    "q": "int64_t[]",
+    "B": "uint8_t[]",
+    "f": "float[]",
+}
+
+
+class NativeBuffer:
+    def __init__(
+        self,
+        columns: Mapping[str, str],
+        record_type: str,
+        capacity: int,
+        drain_function: Callable[..., int],
+    ) -> None:
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+
+        buffer_ptr = _lib.native_buffer_create(_ffi.sizeof(record_type), capacity)
+        if buffer_ptr == _ffi.NULL:
+            raise MemoryError("failed to allocate native buffer")
+
+        self._columns = dict(columns)
+        self._buffer_ptr = _ffi.gc(buffer_ptr, _lib.native_buffer_destroy)
+        self._drain_function = drain_function
+
+    def __len__(self) -> int:
+        return int(_lib.native_buffer_size(self._buffer_ptr))
+
+    @property
+    def capacity(self) -> int:
+        return int(_lib.native_buffer_capacity(self._buffer_ptr))
+
+    @property
+    def received(self) -> int:
+        return int(_lib.native_buffer_received(self._buffer_ptr))
+
+    @property
+    def dropped(self) -> int:
+        return int(_lib.native_buffer_dropped(self._buffer_ptr))
+
+    def drain(self) -> Columns:
+        count = len(self)
+
+        columns: Columns = {
+            name: array.array(typecode, [0]) * count
+            for name, typecode in self._columns.items()
+        }
+        column_ptrs = [
+            _ffi.from_buffer(_ctype_map[column.typecode], column)
+            for column in columns.values()
+        ]
+
+        drained = self._drain_function(self._buffer_ptr, count, *column_ptrs)
+        if drained != count:
+            for column in columns.values():
+                del column[drained:]
+
+        return columns
+
+
+class NativeGazePointBuffer(NativeBuffer):
+    def __init__(self, capacity: int) -> None:
+        super().__init__(
+            columns=GAZE_POINT_COLUMNS,
+            record_type="tobii_gaze_point_t",
+            capacity=capacity,
+            drain_function=_lib.native_gaze_point_drain,
+        )
+
+
+class NativeGazeOriginBuffer(NativeBuffer):
+    def __init__(self, capacity: int) -> None:
+        super().__init__(
+            columns=GAZE_ORIGIN_COLUMNS,
+            record_type="tobii_gaze_origin_t",
+            capacity=capacity,
+            drain_function=_lib.native_gaze_origin_drain,
+        )
+
+
+class NativeEyePositionBuffer(NativeBuffer):
+    def __init__(self, capacity: int) -> None:
+        super().__init__(
+            columns=EYE_POSITION_COLUMNS,
+            record_type="tobii_eye_position_normalized_t",
+            capacity=capacity,
+            drain_function=_lib.native_eye_position_normalized_drain,
+        )
+
+
+class NativeRecordBuffer(NativeBuffer):
+    def __init__(
+        self,
+        columns: Mapping[str, str],
+        record_type: str,
+        capacity: int,
+    ) -> None:
+        super().__init__(
+            columns=columns,
+            record_type=record_type,
+            capacity=capacity,
+            drain_function=self._drain_columns,
+        )
+
+        self._offsets = _ffi.new(
+            "size_t[]",
+            [_ffi.offsetof(record_type, name) for name in columns],
+        )
+        self._sizes = _ffi.new(
+            "size_t[]",
+            [array.array(typecode).itemsize for typecode in columns.values()],
+        )
+
+    def _drain_columns(self, buffer_ptr: Any, count: int, *column_ptrs: Any) -> int:
+        return int(
+            _lib.native_buffer_drain_columns(
+                buffer_ptr,
+                count,
+                len(column_ptrs),
+                self._offsets,
+                self._sizes,
+                _ffi.new("void *[]", column_ptrs),
+            )
+        )
+
+
+class NativeGazeDataBuffer(NativeRecordBuffer):
+    def __init__(self, capacity: int) -> None:
+        super().__init__(
+            columns=GAZE_DATA_COLUMNS,
+            record_type="native_gaze_data_record_t",
+            capacity=capacity,
+        )
+
+
+class NativeHeadPoseBuffer(NativeRecordBuffer):
+    def __init__(self, capacity: int) -> None:
+        super().__init__(
+            columns=HEAD_POSE_COLUMNS,
+            record_type="native_head_pose_record_t",
+            capacity=capacity,
+        )
+
+
+class NativeWearableConsumerDataBuffer(NativeRecordBuffer):
+    def __init__(self, capacity: int) -> None:
+        super().__init__(
+            columns=WEARABLE_CONSUMER_DATA_COLUMNS,
+            record_type="native_wearable_consumer_data_record_t",
+            capacity=capacity,
+        )
+
+
+class NativeWearableAdvancedDataBuffer(NativeRecordBuffer):
+    def __init__(self, capacity: int) -> None:
+        super().__init__(
+            columns=WEARABLE_ADVANCED_DATA_COLUMNS,
+            record_type="native_wearable_advanced_data_record_t",
+            capacity=capacity,
+        )
+
+
+class NativeWearableFoveatedGazeBuffer(NativeRecordBuffer):
+    def __init__(self, capacity: int) -> None:
+        super().__init__(
+            columns=WEARABLE_FOVEATED_GAZE_COLUMNS,
+            record_type="native_wearable_foveated_gaze_record_t",
+            capacity=capacity,
+        )
@@ -0,0 +1,108 @@
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from tobii_stream_engine.errors import (
+    TobiiConnectionFailedDriverError,
+    TobiiConnectionFailedError,
+)
+
+if TYPE_CHECKING:
+    from tobii_stream_engine.device import Device
+
+logger = logging.getLogger(__name__)
+
+CONNECTION_ERRORS = (TobiiConnectionFailedError, TobiiConnectionFailedDriverError)
+
+
+@dataclass(frozen=True)
+class ReconnectStatistics:
+    disconnects: int
+    reconnects: int
+    failed_attempts: int
+    total_downtime: float
+    last_downtime: float | None
+    last_reconnect_latency: float | None
+
+
+class ReconnectSupervisor:
+    def __init__(
+        self,
+        device: "Device",
+        initial_backoff: float = 0.01,
+        max_backoff: float = 5.0,
+        backoff_multiplier: float = 2.0,
+        max_attempts: int | None = None,
+    ) -> None:
+        self._device = device
+        self._initial_backoff = initial_backoff
+        self._max_backoff = max_backoff
+        self._backoff_multiplier = backoff_multiplier
+        self._max_attempts = max_attempts
+
+        self._disconnects = 0
+        self._reconnects = 0
+        self._failed_attempts = 0
+        self._total_downtime = 0.0
+        self._last_downtime: float | None = None
+        self._last_reconnect_latency: float | None = None
+
+    @property
+    def statistics(self) -> ReconnectStatistics:
+        return ReconnectStatistics(
+            disconnects=self._disconnects,
+            reconnects=self._reconnects,
+            failed_attempts=self._failed_attempts,
+            total_downtime=self._total_downtime,
+            last_downtime=self._last_downtime,
+            last_reconnect_latency=self._last_reconnect_latency,
+        )
+
+    def recover(self, stop_event: threading.Event | None = None) -> bool:
+        url = self._device._url
+        logger.warning(f"{url}: connection lost")
+
+        disconnected_at = time.monotonic()
+        self._disconnects += 1
+
+        backoff = self._initial_backoff
+        attempts = 0
+
+        while stop_event is None or not stop_event.is_set():
+            attempt_started_at = time.monotonic()
+
+            try:
+                self._device.reconnect()
+            except CONNECTION_ERRORS:
+                attempts += 1
+                self._failed_attempts += 1
+
+                if self._max_attempts is not None and attempts >= self._max_attempts:
+                    self._total_downtime += time.monotonic() - disconnected_at
+                    raise
+
+                logger.debug(f"{url}: reconnect failed, retrying in {backoff:.3f}s")
+
+                if stop_event is None:
+                    time.sleep(backoff)
+                else:
+                    stop_event.wait(backoff)
+
+                backoff = min(backoff * self._backoff_multiplier, self._max_backoff)
+                continue
+
+            reconnected_at = time.monotonic()
+            self._reconnects += 1
+            self._last_reconnect_latency = reconnected_at - attempt_started_at
+            self._last_downtime = reconnected_at - disconnected_at
+            self._total_downtime += self._last_downtime
+
+            logger.warning(f"{url}: reconnected after {self._last_downtime:.3f}s")
+
+            return True
+
+        self._total_downtime += time.monotonic() - disconnected_at
+
+        return False
@@ -0,0 +1,323 @@
+import json
+import logging
+import mmap
+import struct
+import threading
+import time
+from collections import deque
+from collections.abc import Iterable, Mapping
+from dataclasses import asdict
+from pathlib import Path
+from types import TracebackType
+from typing import TYPE_CHECKING, Any
+
+from tobii_stream_engine.buffers import (
+    DIGITAL_SYNCPORT_COLUMNS,
+    EYE_POSITION_COLUMNS,
+    GAZE_ORIGIN_COLUMNS,
+    GAZE_POINT_COLUMNS,
+    USER_PRESENCE_COLUMNS,
+)
+
+if TYPE_CHECKING:
+    from tobii_stream_engine.device import Device
+    from tobii_stream_engine.samples import (
+        CompactEyePosition,
+        CompactGazeOrigin,
+        CompactGazePoint,
+        UserPresence,
+    )
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"TSEREC\x00\x01"
+HEADER_SIZE = 4096
+HEADER_STRUCT = struct.Struct("<8sIIQ")
+RECORD_COUNT_OFFSET = 16
+SEGMENT_SUFFIX = ".seg"
+
+STREAM_COLUMNS: dict[str, Mapping[str, str]] = {
+    "gaze_point": GAZE_POINT_COLUMNS,
+    "gaze_origin": GAZE_ORIGIN_COLUMNS,
+    "eye_position": EYE_POSITION_COLUMNS,
+    "user_presence": USER_PRESENCE_COLUMNS,
+    "digital_syncport": DIGITAL_SYNCPORT_COLUMNS,
+}
+
+DEFAULT_STREAMS = ("gaze_point", "gaze_origin", "eye_position", "user_presence")
+
+
+def record_struct(columns: Mapping[str, str]) -> struct.Struct:
+    return struct.Struct("<" + "".join(columns.values()))
+
+
+def segment_path(directory: Path, stream: str, index: int) -> Path:
+    return directory / f"{stream}-{index:06d}{SEGMENT_SUFFIX}"
+
+
+class _SegmentWriter:
+    def __init__(
+        self,
+        directory: Path,
+        stream: str,
+        metadata: Mapping[str, Any],
+        segment_records: int,
+    ) -> None:
+        self._directory = directory
+        self._stream = stream
+        self._columns = STREAM_COLUMNS[stream]
+        self._struct = record_struct(self._columns)
+        self._metadata = metadata
+        self._segment_records = segment_records
+
+        self._index = 0
+        self._count = 0
+        self._mmap: mmap.mmap | None = None
+
+    def _open_segment(self) -> None:
+        path = segment_path(self._directory, self._stream, self._index)
+        logger.debug(f"opening segment '{path}'")
+
+        header = json.dumps(
+            {
+                **self._metadata,
+                "stream": self._stream,
+                "segment": self._index,
+                "columns": list(self._columns.items()),
+            }
+        ).encode()
+        if HEADER_STRUCT.size + len(header) > HEADER_SIZE:
+            raise ValueError("recording metadata does not fit into segment header")
+
+        with path.open("w+b") as file:
+            file.truncate(HEADER_SIZE + self._segment_records * self._struct.size)
+            self._mmap = mmap.mmap(file.fileno(), 0)
+
+        HEADER_STRUCT.pack_into(self._mmap, 0, MAGIC, HEADER_SIZE, self._struct.size, 0)
+        self._mmap[HEADER_STRUCT.size : HEADER_STRUCT.size + len(header)] = header
+        self._count = 0
+
+    def _close_segment(self) -> None:
+        if self._mmap is None:
+            return
+
+        self.commit()
+        self._mmap.close()
+        self._mmap = None
+
+        path = segment_path(self._directory, self._stream, self._index)
+        with path.open("r+b") as file:
+            file.truncate(HEADER_SIZE + self._count * self._struct.size)
+
+        self._index += 1
+
+    def write(self, values: tuple[Any, ...]) -> None:
+        if self._mmap is None:
+            self._open_segment()
+        elif self._count == self._segment_records:
+            self._close_segment()
+            self._open_segment()
+
+        assert self._mmap is not None
+        self._struct.pack_into(
+            self._mmap,
+            HEADER_SIZE + self._count * self._struct.size,
+            *values,
+        )
+        self._count += 1
+
+    def commit(self) -> None:
+        if self._mmap is None:
+            return
+
+        struct.pack_into("<Q", self._mmap, RECORD_COUNT_OFFSET, self._count)
+
+    def close(self) -> None:
+        self._close_segment()
+
+
+class Recorder:
+    def __init__(
+        self,
+        device: "Device",
+        directory: str | Path,
+        streams: Iterable[str] = DEFAULT_STREAMS,
+        segment_records: int = 1 << 20,
+        flush_interval: float = 0.1,
+        max_pending: int = 1 << 16,
+    ) -> None:
+        if max_pending <= 0:
+            raise ValueError("max_pending must be positive")
+
+        self._device = device
+        self._directory = Path(directory)
+        self._streams = list(streams)
+        self._segment_records = segment_records
+        self._flush_interval = flush_interval
+
+        for stream in self._streams:
+            if stream not in STREAM_COLUMNS:
+                raise ValueError(f"unknown stream '{stream}'")
+
+        # bounded, samples are dropped rather than piling up if writing stalls
+        self._max_pending = max_pending
+        self._pending: dict[str, deque[tuple[Any, ...]]] = {
+            stream: deque(maxlen=max_pending) for stream in self._streams
+        }
+        self._dropped = dict.fromkeys(self._streams, 0)
+        self._writers: dict[str, _SegmentWriter] = {}
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._error: Exception | None = None
+
+    @property
+    def dropped(self) -> dict[str, int]:
+        return dict(self._dropped)
+
+    @property
+    def error(self) -> Exception | None:
+        return self._error
+
+    def _metadata(self) -> dict[str, Any]:
+        # deferred, reading recordings must not require the native library
+        from tobii_stream_engine.api import get_api_version  # noqa: PLC0415
+
+        return {
+            "device_info": asdict(self._device.get_device_info()),
+            "api_version": asdict(get_api_version()),
+            "output_frequency": self._device.get_output_frequency(),
+            "created_at": time.time(),
+        }
+
+    def _append(self, stream: str, record: tuple[Any, ...]) -> None:
+        pending = self._pending[stream]
+        if len(pending) == self._max_pending:
+            self._dropped[stream] += 1
+        pending.append(record)
+
+    def _on_gaze_point(self, *, timestamp: int, gaze_point: "CompactGazePoint") -> None:
+        self._append("gaze_point", (timestamp, *gaze_point))
+
+    def _on_gaze_origin(
+        self, *, timestamp: int, gaze_origin: "CompactGazeOrigin"
+    ) -> None:
+        self._append("gaze_origin", (timestamp, *gaze_origin))
+
+    def _on_eye_position(
+        self, *, timestamp: int, eye_position: "CompactEyePosition"
+    ) -> None:
+        self._append("eye_position", (timestamp, *eye_position))
+
+    def _on_user_presence(
+        self, *, timestamp: int, user_presence: "UserPresence"
+    ) -> None:
+        self._append("user_presence", (timestamp, user_presence.value))
+
+    def _on_digital_syncport(
+        self, *, timestamp: int, signal: int, timestamp_tracker_us: int
+    ) -> None:
+        self._append("digital_syncport", (timestamp, timestamp_tracker_us, signal))
+
+    def _flush(self) -> None:
+        for stream, pending in self._pending.items():
+            if not pending:
+                continue
+
+            writer = self._writers[stream]
+            while pending:
+                writer.write(pending.popleft())
+            writer.commit()
+
+    def _run(self) -> None:
+        try:
+            while not self._stop.wait(self._flush_interval):
+                self._flush()
+
+            self._flush()
+        except Exception as error:
+            # e.g. a full disk, raised again by stop()
+            logger.exception(
+                f"recording to '{self._directory}' failed, no longer writing samples"
+            )
+            self._error = error
+
+    def start(self) -> None:
+        logger.debug(f"starting recording to '{self._directory}'")
+
+        self._directory.mkdir(parents=True, exist_ok=True)
+
+        metadata = self._metadata()
+        self._writers = {
+            stream: _SegmentWriter(
+                directory=self._directory,
+                stream=stream,
+                metadata=metadata,
+                segment_records=self._segment_records,
+            )
+            for stream in self._streams
+        }
+
+        self._stop.clear()
+        self._error = None
+        self._thread = threading.Thread(
+            target=self._run,
+            name=f"tobii-stream-engine recorder {self._directory}",
+            daemon=True,
+        )
+        self._thread.start()
+
+        if "gaze_point" in self._streams:
+            self._device.subscribe_gaze_point(
+                callback=self._on_gaze_point, compact=True
+            )
+        if "gaze_origin" in self._streams:
+            self._device.subscribe_gaze_origin(
+                callback=self._on_gaze_origin, compact=True
+            )
+        if "eye_position" in self._streams:
+            self._device.subscribe_eye_position(
+                callback=self._on_eye_position, compact=True
+            )
+        if "user_presence" in self._streams:
+            self._device.subscribe_user_presence(callback=self._on_user_presence)
+        if "digital_syncport" in self._streams:
+            self._device.subscribe_digital_syncport(callback=self._on_digital_syncport)
+
+    def stop(self) -> None:
+        if self._thread is None:
+            return
+
+        logger.debug(f"stopping recording to '{self._directory}'")
+
+        if "gaze_point" in self._streams:
+            self._device.unsubscribe_gaze_point()
+        if "gaze_origin" in self._streams:
+            self._device.unsubscribe_gaze_origin()
+        if "eye_position" in self._streams:
+            self._device.unsubscribe_eye_position()
+        if "user_presence" in self._streams:
+            self._device.unsubscribe_user_presence()
+        if "digital_syncport" in self._streams:
+            self._device.unsubscribe_digital_syncport()
+
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+
+        for writer in self._writers.values():
+            writer.close()
+
+        if self._error is not None:
+            raise self._error
+
+    def __enter__(self) -> "Recorder":
+        self.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.stop()
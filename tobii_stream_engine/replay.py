@@ -0,0 +1,421 @@
+import heapq
+import json
+import logging
+import mmap
+import threading
+import time
+from collections.abc import Callable, Iterator
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Literal, overload
+
+from tobii_stream_engine.recording import (
+    HEADER_STRUCT,
+    MAGIC,
+    SEGMENT_SUFFIX,
+    record_struct,
+)
+from tobii_stream_engine.samples import (
+    CompactEyePosition,
+    CompactEyePositionCallback,
+    CompactGazeOrigin,
+    CompactGazeOriginCallback,
+    CompactGazePoint,
+    CompactGazePointCallback,
+    DeviceInfo,
+    DigitalSyncportCallback,
+    EyePosition,
+    EyePositionCallback,
+    GazeOrigin,
+    GazeOriginCallback,
+    GazePoint,
+    GazePointCallback,
+    PositionXY,
+    PositionXYZ,
+    UserPresence,
+    UserPresenceCallback,
+)
+
+if TYPE_CHECKING:
+    import numpy.typing
+
+logger = logging.getLogger(__name__)
+
+
+class Segment:
+    def __init__(self, path: str | Path) -> None:
+        self._path = Path(path)
+
+        with self._path.open("rb") as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, header_size, record_size, record_count = HEADER_STRUCT.unpack_from(
+            self._mmap, 0
+        )
+        if magic != MAGIC:
+            raise ValueError(f"'{self._path}' is not a recording segment")
+
+        header = bytes(self._mmap[HEADER_STRUCT.size : header_size])
+        self._metadata: dict[str, Any] = json.loads(header.rstrip(b"\0"))
+        self._columns: dict[str, str] = dict(self._metadata["columns"])
+        self._struct = record_struct(self._columns)
+        if self._struct.size != record_size:
+            raise ValueError(f"'{self._path}' has an unexpected record size")
+
+        self._record_count: int = record_count
+        self._records = memoryview(self._mmap)[
+            header_size : header_size + record_count * record_size
+        ]
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    @property
+    def metadata(self) -> dict[str, Any]:
+        return self._metadata
+
+    @property
+    def stream(self) -> str:
+        return str(self._metadata["stream"])
+
+    @property
+    def columns(self) -> dict[str, str]:
+        return self._columns
+
+    @property
+    def records(self) -> memoryview:
+        return self._records
+
+    def __len__(self) -> int:
+        return self._record_count
+
+    def __iter__(self) -> Iterator[tuple[Any, ...]]:
+        return self._struct.iter_unpack(self._records)
+
+    def to_structured_array(self) -> "numpy.typing.NDArray[Any]":
+        import numpy  # noqa: PLC0415
+
+        dtype = numpy.dtype(
+            [(name, "<" + typecode) for name, typecode in self._columns.items()]
+        )
+        return numpy.frombuffer(self._records, dtype=dtype)
+
+    def close(self) -> None:
+        self._records.release()
+        self._mmap.close()
+
+
+class Recording:
+    def __init__(self, directory: str | Path) -> None:
+        self._directory = Path(directory)
+        self._segments: dict[str, list[Segment]] = {}
+
+        for path in sorted(self._directory.glob(f"*{SEGMENT_SUFFIX}")):
+            segment = Segment(path)
+            self._segments.setdefault(segment.stream, []).append(segment)
+
+        if not self._segments:
+            raise ValueError(f"'{self._directory}' does not contain a recording")
+
+    @property
+    def streams(self) -> list[str]:
+        return list(self._segments)
+
+    @property
+    def metadata(self) -> dict[str, Any]:
+        return next(iter(self._segments.values()))[0].metadata
+
+    def segments(self, stream: str) -> list[Segment]:
+        return list(self._segments.get(stream, []))
+
+    def records(self, stream: str) -> Iterator[tuple[Any, ...]]:
+        for segment in self._segments.get(stream, []):
+            yield from segment
+
+    def close(self) -> None:
+        for segments in self._segments.values():
+            for segment in segments:
+                segment.close()
+
+
+class ReplayDevice:
+    def __init__(self, directory: str | Path, speed: float | None = 1.0) -> None:
+        if speed is not None and speed <= 0:
+            raise ValueError("speed must be positive")
+
+        self._recording = Recording(directory)
+        self._url = f"replay://{Path(directory).absolute()}"
+        self._speed = speed
+        self._callbacks: dict[str, Callable[[tuple[Any, ...]], None]] = {}
+        self._gaze_point_callback: GazePointCallback | None = None
+        self._compact_gaze_point_callback: CompactGazePointCallback | None = None
+        self._gaze_origin_callback: GazeOriginCallback | None = None
+        self._compact_gaze_origin_callback: CompactGazeOriginCallback | None = None
+        self._eye_position_callback: EyePositionCallback | None = None
+        self._compact_eye_position_callback: CompactEyePositionCallback | None = None
+        self._user_presence_callback: UserPresenceCallback | None = None
+        self._digital_syncport_callback: DigitalSyncportCallback | None = None
+
+    @property
+    def recording(self) -> Recording:
+        return self._recording
+
+    def get_device_info(self) -> DeviceInfo:
+        return DeviceInfo(**self._recording.metadata["device_info"])
+
+    def get_output_frequency(self) -> float:
+        return float(self._recording.metadata["output_frequency"])
+
+    @overload
+    def subscribe_gaze_point(
+        self, callback: GazePointCallback, compact: Literal[False] = ...
+    ) -> None: ...
+
+    @overload
+    def subscribe_gaze_point(
+        self, callback: CompactGazePointCallback, compact: Literal[True]
+    ) -> None: ...
+
+    def subscribe_gaze_point(
+        self,
+        callback: GazePointCallback | CompactGazePointCallback,
+        compact: bool = False,
+    ) -> None:
+        self.unsubscribe_gaze_point()
+        if compact:
+            self._compact_gaze_point_callback = callback  # type: ignore[assignment]
+            self._callbacks["gaze_point"] = self._on_compact_gaze_point
+        else:
+            self._gaze_point_callback = callback  # type: ignore[assignment]
+            self._callbacks["gaze_point"] = self._on_gaze_point
+
+    def unsubscribe_gaze_point(self) -> None:
+        self._gaze_point_callback = None
+        self._compact_gaze_point_callback = None
+        self._callbacks.pop("gaze_point", None)
+
+    def _on_compact_gaze_point(self, record: tuple[Any, ...]) -> None:
+        if self._compact_gaze_point_callback is None:
+            return
+
+        timestamp, validity, x, y = record
+        self._compact_gaze_point_callback(
+            timestamp=timestamp,
+            gaze_point=CompactGazePoint(bool(validity), x, y),
+        )
+
+    def _on_gaze_point(self, record: tuple[Any, ...]) -> None:
+        if self._gaze_point_callback is None:
+            return
+
+        timestamp, validity, x, y = record
+        self._gaze_point_callback(
+            timestamp=timestamp,
+            gaze_point=GazePoint(
+                validity=bool(validity),
+                position_xy=PositionXY(x=x, y=y),
+            ),
+        )
+
+    @overload
+    def subscribe_gaze_origin(
+        self, callback: GazeOriginCallback, compact: Literal[False] = ...
+    ) -> None: ...
+
+    @overload
+    def subscribe_gaze_origin(
+        self, callback: CompactGazeOriginCallback, compact: Literal[True]
+    ) -> None: ...
+
+    def subscribe_gaze_origin(
+        self,
+        callback: GazeOriginCallback | CompactGazeOriginCallback,
+        compact: bool = False,
+    ) -> None:
+        self.unsubscribe_gaze_origin()
+        if compact:
+            self._compact_gaze_origin_callback = callback  # type: ignore[assignment]
+            self._callbacks["gaze_origin"] = self._on_compact_gaze_origin
+        else:
+            self._gaze_origin_callback = callback  # type: ignore[assignment]
+            self._callbacks["gaze_origin"] = self._on_gaze_origin
+
+    def unsubscribe_gaze_origin(self) -> None:
+        self._gaze_origin_callback = None
+        self._compact_gaze_origin_callback = None
+        self._callbacks.pop("gaze_origin", None)
+
+    def _on_compact_gaze_origin(self, record: tuple[Any, ...]) -> None:
+        if self._compact_gaze_origin_callback is None:
+            return
+
+        timestamp, left_validity, lx, ly, lz, right_validity, rx, ry, rz = record
+        self._compact_gaze_origin_callback(
+            timestamp=timestamp,
+            gaze_origin=CompactGazeOrigin(
+                bool(left_validity), lx, ly, lz, bool(right_validity), rx, ry, rz
+            ),
+        )
+
+    def _on_gaze_origin(self, record: tuple[Any, ...]) -> None:
+        if self._gaze_origin_callback is None:
+            return
+
+        timestamp, left_validity, lx, ly, lz, right_validity, rx, ry, rz = record
+        self._gaze_origin_callback(
+            timestamp=timestamp,
+            gaze_origin=GazeOrigin(
+                left_validity=bool(left_validity),
+                left_xyz=PositionXYZ(x=lx, y=ly, z=lz),
+                right_validity=bool(right_validity),
+                right_xyz=PositionXYZ(x=rx, y=ry, z=rz),
+            ),
+        )
+
+    @overload
+    def subscribe_eye_position(
+        self, callback: EyePositionCallback, compact: Literal[False] = ...
+    ) -> None: ...
+
+    @overload
+    def subscribe_eye_position(
+        self, callback: CompactEyePositionCallback, compact: Literal[True]
+    ) -> None: ...
+
+    def subscribe_eye_position(
+        self,
+        callback: EyePositionCallback | CompactEyePositionCallback,
+        compact: bool = False,
+    ) -> None:
+        self.unsubscribe_eye_position()
+        if compact:
+            self._compact_eye_position_callback = callback  # type: ignore[assignment]
+            self._callbacks["eye_position"] = self._on_compact_eye_position
+        else:
+            self._eye_position_callback = callback  # type: ignore[assignment]
+            self._callbacks["eye_position"] = self._on_eye_position
+
+    def unsubscribe_eye_position(self) -> None:
+        self._eye_position_callback = None
+        self._compact_eye_position_callback = None
+        self._callbacks.pop("eye_position", None)
+
+    def _on_compact_eye_position(self, record: tuple[Any, ...]) -> None:
+        if self._compact_eye_position_callback is None:
+            return
+
+        timestamp, left_validity, lx, ly, lz, right_validity, rx, ry, rz = record
+        self._compact_eye_position_callback(
+            timestamp=timestamp,
+            eye_position=CompactEyePosition(
+                bool(left_validity), lx, ly, lz, bool(right_validity), rx, ry, rz
+            ),
+        )
+
+    def _on_eye_position(self, record: tuple[Any, ...]) -> None:
+        if self._eye_position_callback is None:
+            return
+
+        timestamp, left_validity, lx, ly, lz, right_validity, rx, ry, rz = record
+        self._eye_position_callback(
+            timestamp=timestamp,
+            eye_position=EyePosition(
+                left_validity=bool(left_validity),
+                left_xyz=PositionXYZ(x=lx, y=ly, z=lz),
+                right_validity=bool(right_validity),
+                right_xyz=PositionXYZ(x=rx, y=ry, z=rz),
+            ),
+        )
+
+    def subscribe_user_presence(self, callback: UserPresenceCallback) -> None:
+        self._user_presence_callback = callback
+        self._callbacks["user_presence"] = self._on_user_presence
+
+    def unsubscribe_user_presence(self) -> None:
+        self._user_presence_callback = None
+        self._callbacks.pop("user_presence", None)
+
+    def _on_user_presence(self, record: tuple[Any, ...]) -> None:
+        if self._user_presence_callback is None:
+            return
+
+        timestamp, user_presence = record
+        self._user_presence_callback(
+            timestamp=timestamp,
+            user_presence=UserPresence(user_presence),
+        )
+
+    def subscribe_digital_syncport(self, callback: DigitalSyncportCallback) -> None:
+        self._digital_syncport_callback = callback
+        self._callbacks["digital_syncport"] = self._on_digital_syncport
+
+    def unsubscribe_digital_syncport(self) -> None:
+        self._digital_syncport_callback = None
+        self._callbacks.pop("digital_syncport", None)
+
+    def _on_digital_syncport(self, record: tuple[Any, ...]) -> None:
+        if self._digital_syncport_callback is None:
+            return
+
+        timestamp, timestamp_tracker_us, signal = record
+        self._digital_syncport_callback(
+            timestamp=timestamp,
+            signal=signal,
+            timestamp_tracker_us=timestamp_tracker_us,
+        )
+
+    def _merged_records(
+        self,
+    ) -> Iterator[tuple[int, Callable[[tuple[Any, ...]], None], tuple[Any, ...]]]:
+        def stream_records(
+            stream: str,
+        ) -> Iterator[tuple[int, Callable[[tuple[Any, ...]], None], tuple[Any, ...]]]:
+            dispatch = self._callbacks[stream]
+            for record in self._recording.records(stream):
+                yield record[0], dispatch, record
+
+        return heapq.merge(
+            *(stream_records(stream) for stream in self._callbacks),
+            key=lambda item: item[0],
+        )
+
+    def run(
+        self,
+        stop_event: threading.Event | None = None,
+        max_duration: float | None = None,
+        max_samples: int | None = None,
+    ) -> int:
+        logger.debug(f"{self._url}: starting replay")
+
+        started_at = time.monotonic()
+        deadline = None if max_duration is None else started_at + max_duration
+        first_timestamp: int | None = None
+        samples = 0
+
+        for timestamp, dispatch, record in self._merged_records():
+            if stop_event is not None and stop_event.is_set():
+                break
+            if max_samples is not None and samples >= max_samples:
+                break
+
+            if self._speed is not None:
+                if first_timestamp is None:
+                    first_timestamp = timestamp
+                due_at = started_at + (timestamp - first_timestamp) / 1e6 / self._speed
+                delay = due_at - time.monotonic()
+                if deadline is not None and due_at > deadline:
+                    break
+                if delay > 0:
+                    if stop_event is None:
+                        time.sleep(delay)
+                    elif stop_event.wait(delay):
+                        break
+            elif deadline is not None and time.monotonic() >= deadline:
+                break
+
+            dispatch(record)
+            samples += 1
+
+        logger.debug(f"{self._url}: stopped replay after {samples} samples")
+
+        return samples
@@ -0,0 +1,208 @@
+import enum
+from dataclasses import dataclass
+from typing import NamedTuple, Protocol
+
+
+@dataclass(frozen=True, slots=True)
+class DeviceInfo:
+    serial_number: str
+    model: str
+    generation: str
+    firmware_version: str
+
+
+@dataclass(frozen=True, slots=True)
+class PositionXY:
+    x: float
+    y: float
+
+
+@dataclass(frozen=True, slots=True)
+class PositionXYZ:
+    x: float
+    y: float
+    z: float
+
+
+@dataclass(frozen=True, slots=True)
+class GazePoint:
+    validity: bool
+    position_xy: PositionXY
+
+
+@dataclass(frozen=True, slots=True)
+class GazeOrigin:
+    left_validity: bool
+    left_xyz: PositionXYZ
+    right_validity: bool
+    right_xyz: PositionXYZ
+
+
+@dataclass(frozen=True, slots=True)
+class EyePosition:
+    left_validity: bool
+    left_xyz: PositionXYZ
+    right_validity: bool
+    right_xyz: PositionXYZ
+
+
+@dataclass(frozen=True, slots=True)
+class GazeDataEye:
+    gaze_origin_validity: bool
+    gaze_origin_mm_xyz: PositionXYZ
+    gaze_origin_normalized_xyz: PositionXYZ
+    gaze_point_validity: bool
+    gaze_point_mm_xyz: PositionXYZ
+    gaze_point_xy: PositionXY
+    eyeball_center_validity: bool
+    eyeball_center_mm_xyz: PositionXYZ
+    pupil_validity: bool
+    pupil_diameter_mm: float
+
+
+@dataclass(frozen=True, slots=True)
+class GazeData:
+    timestamp_tracker_us: int
+    timestamp_system_us: int
+    left: GazeDataEye
+    right: GazeDataEye
+
+
+@dataclass(frozen=True, slots=True)
+class RotationXYZ:
+    x: float
+    y: float
+    z: float
+
+
+@dataclass(frozen=True, slots=True)
+class HeadPose:
+    position_validity: bool
+    position_xyz: PositionXYZ
+    rotation_validity_xyz: tuple[bool, bool, bool]
+    rotation_xyz: RotationXYZ
+
+
+class CompactGazePoint(NamedTuple):
+    validity: bool
+    x: float
+    y: float
+
+    @property
+    def position_xy(self) -> PositionXY:
+        return PositionXY(x=self.x, y=self.y)
+
+
+class CompactGazeOrigin(NamedTuple):
+    left_validity: bool
+    left_x: float
+    left_y: float
+    left_z: float
+    right_validity: bool
+    right_x: float
+    right_y: float
+    right_z: float
+
+    @property
+    def left_xyz(self) -> PositionXYZ:
+        return PositionXYZ(x=self.left_x, y=self.left_y, z=self.left_z)
+
+    @property
+    def right_xyz(self) -> PositionXYZ:
+        return PositionXYZ(x=self.right_x, y=self.right_y, z=self.right_z)
+
+
+class CompactEyePosition(NamedTuple):
+    left_validity: bool
+    left_x: float
+    left_y: float
+    left_z: float
+    right_validity: bool
+    right_x: float
+    right_y: float
+    right_z: float
+
+    @property
+    def left_xyz(self) -> PositionXYZ:
+        return PositionXYZ(x=self.left_x, y=self.left_y, z=self.left_z)
+
+    @property
+    def right_xyz(self) -> PositionXYZ:
+        return PositionXYZ(x=self.right_x, y=self.right_y, z=self.right_z)
+
+
+class UserPresence(enum.Enum):
+    UNKNOWN = enum.auto()
+    AWAY = enum.auto()
+    PRESENT = enum.auto()
+
+
+@dataclass(frozen=True, slots=True)
+class DisplayArea:
+    top_left_mm_xyz: PositionXYZ
+    top_right_mm_xyz: PositionXYZ
+    bottom_left_mm_xyz: PositionXYZ
+
+
+@dataclass(frozen=True, slots=True)
+class TrackBox:
+    front_upper_right_xyz: PositionXYZ
+    front_upper_left_xyz: PositionXYZ
+    front_lower_left_xyz: PositionXYZ
+    front_lower_right_xyz: PositionXYZ
+    back_upper_right_xyz: PositionXYZ
+    back_upper_left_xyz: PositionXYZ
+    back_lower_left_xyz: PositionXYZ
+    back_lower_right_xyz: PositionXYZ
+
+
+class GazePointCallback(Protocol):
+    def __call__(self, *, timestamp: int, gaze_point: GazePoint) -> None:
+        ...
+
+
+class CompactGazePointCallback(Protocol):
+    def __call__(self, *, timestamp: int, gaze_point: CompactGazePoint) -> None:
+        ...
+
+
+class GazeOriginCallback(Protocol):
+    def __call__(self, *, timestamp: int, gaze_origin: GazeOrigin) -> None:
+        ...
+
+
+class CompactGazeOriginCallback(Protocol):
+    def __call__(self, *, timestamp: int, gaze_origin: CompactGazeOrigin) -> None:
+        ...
+
+
+class EyePositionCallback(Protocol):
+    def __call__(self, *, timestamp: int, eye_position: EyePosition) -> None:
+        ...
+
+
+class CompactEyePositionCallback(Protocol):
+    def __call__(self, *, timestamp: int, eye_position: CompactEyePosition) -> None:
+        ...
+
+
+class GazeDataCallback(Protocol):
+    def __call__(self, *, timestamp: int, gaze_data: GazeData) -> None:
+        ...
+
+
+class HeadPoseCallback(Protocol):
+    def __call__(self, *, timestamp: int, head_pose: HeadPose) -> None:
+        ...
+
+
+class UserPresenceCallback(Protocol):
+    def __call__(self, *, timestamp: int, user_presence: UserPresence) -> None:
+        ...
+
+
+class DigitalSyncportCallback(Protocol):
+    def __call__(
+        self, *, timestamp: int, signal: int, timestamp_tracker_us: int
+    ) -> None:
+        ...
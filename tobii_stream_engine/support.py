@@ -0,0 +1,130 @@
+import json
+import logging
+import os
+import threading
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from tobii_stream_engine.capabilities import Capability
+    from tobii_stream_engine.samples import DeviceInfo
+    from tobii_stream_engine.streams import Stream
+
+logger = logging.getLogger(__name__)
+
+CACHE_VERSION = 1
+
+
+def bits_of(values: "type[Capability] | type[Stream]") -> int:
+    bits = 0
+    for value in values:
+        bits |= 1 << value
+    return bits
+
+
+def _probed_bits() -> tuple[int, int]:
+    # deferred, the enums load the native library
+    from tobii_stream_engine.capabilities import Capability  # noqa: PLC0415
+    from tobii_stream_engine.streams import Stream  # noqa: PLC0415
+
+    return bits_of(Capability), bits_of(Stream)
+
+
+@dataclass(frozen=True, slots=True)
+class DeviceSupport:
+    capabilities: int
+    streams: int
+
+    def supports_capability(self, capability: "Capability") -> bool:
+        return bool(self.capabilities >> capability & 1)
+
+    def supports_stream(self, stream: "Stream") -> bool:
+        return bool(self.streams >> stream & 1)
+
+    @property
+    def supported_capabilities(self) -> "list[Capability]":
+        from tobii_stream_engine.capabilities import Capability  # noqa: PLC0415
+
+        return [c for c in Capability if self.capabilities >> c & 1]
+
+    @property
+    def supported_streams(self) -> "list[Stream]":
+        from tobii_stream_engine.streams import Stream  # noqa: PLC0415
+
+        return [s for s in Stream if self.streams >> s & 1]
+
+
+class SupportCache:
+    def __init__(self, path: str | Path) -> None:
+        self._path = Path(path)
+        self._entries: dict[str, dict[str, int]] | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    @staticmethod
+    def _key(device_info: "DeviceInfo") -> str:
+        return f"{device_info.serial_number}/{device_info.firmware_version}"
+
+    def _load(self) -> dict[str, dict[str, int]]:
+        if self._entries is not None:
+            return self._entries
+
+        entries: dict[str, dict[str, int]] = {}
+        try:
+            content: dict[str, Any] = json.loads(self._path.read_text())
+            if content.get("version") == CACHE_VERSION:
+                entries = dict(content["devices"])
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, KeyError, TypeError, AttributeError) as error:
+            logger.warning(f"ignoring unreadable support cache '{self._path}': {error}")
+
+        self._entries = entries
+        return entries
+
+    def get(self, device_info: "DeviceInfo") -> DeviceSupport | None:
+        with self._lock:
+            entry = self._load().get(self._key(device_info))
+
+        if entry is None:
+            return None
+
+        # enum members added since the entry was written have not been probed
+        probed_capabilities, probed_streams = _probed_bits()
+        if entry.get("probed_capabilities") != probed_capabilities:
+            return None
+        if entry.get("probed_streams") != probed_streams:
+            return None
+
+        return DeviceSupport(
+            capabilities=entry["capabilities"],
+            streams=entry["streams"],
+        )
+
+    def put(self, device_info: "DeviceInfo", support: DeviceSupport) -> None:
+        probed_capabilities, probed_streams = _probed_bits()
+        with self._lock:
+            entries = self._load()
+            entries[self._key(device_info)] = {
+                **asdict(support),
+                "probed_capabilities": probed_capabilities,
+                "probed_streams": probed_streams,
+            }
+
+            content = json.dumps(
+                {"version": CACHE_VERSION, "devices": entries},
+                indent=2,
+                sort_keys=True,
+            )
+
+            # replaced atomically, concurrent startups never read a partial file
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            temporary_path = self._path.with_name(
+                f".{self._path.name}.{os.getpid()}.tmp"
+            )
+            temporary_path.write_text(content)
+            temporary_path.replace(self._path)
@@ -0,0 +1,122 @@
+import array
+import bisect
+from collections.abc import Mapping, Sequence
+from typing import TYPE_CHECKING, Any, overload
+
+from tobii_stream_engine.buffers import DIGITAL_SYNCPORT_COLUMNS, Columns
+
+if TYPE_CHECKING:
+    import numpy.typing
+
+
+def slice_between(
+    timestamps: "Sequence[int] | numpy.typing.NDArray[Any]",
+    start_us: int,
+    end_us: int,
+) -> slice:
+    if hasattr(timestamps, "searchsorted"):
+        start, end = timestamps.searchsorted([start_us, end_us])
+        return slice(int(start), int(end))
+
+    return slice(
+        bisect.bisect_left(timestamps, start_us),
+        bisect.bisect_left(timestamps, end_us),
+    )
+
+
+@overload
+def samples_between(
+    samples: Columns,
+    start_us: int,
+    end_us: int,
+    timestamp_column: str = ...,
+) -> Columns: ...
+
+
+@overload
+def samples_between(
+    samples: "numpy.typing.NDArray[Any]",
+    start_us: int,
+    end_us: int,
+    timestamp_column: str = ...,
+) -> "numpy.typing.NDArray[Any]": ...
+
+
+def samples_between(
+    samples: "Columns | numpy.typing.NDArray[Any]",
+    start_us: int,
+    end_us: int,
+    timestamp_column: str = "timestamp_us",
+) -> "Columns | numpy.typing.NDArray[Any]":
+    between = slice_between(samples[timestamp_column], start_us, end_us)
+
+    if isinstance(samples, Mapping):
+        return {name: column[between] for name, column in samples.items()}
+
+    return samples[between]
+
+
+class SyncportLog:
+    def __init__(self) -> None:
+        self._columns: Columns = {
+            name: array.array(typecode)
+            for name, typecode in DIGITAL_SYNCPORT_COLUMNS.items()
+        }
+        self._timestamp_us = self._columns["timestamp_us"]
+        self._timestamp_tracker_us = self._columns["timestamp_tracker_us"]
+        self._signal = self._columns["signal"]
+
+    def __len__(self) -> int:
+        return len(self._timestamp_us)
+
+    def __call__(
+        self, *, timestamp: int, signal: int, timestamp_tracker_us: int
+    ) -> None:
+        self._timestamp_us.append(timestamp)
+        self._timestamp_tracker_us.append(timestamp_tracker_us)
+        self._signal.append(signal)
+
+    @property
+    def columns(self) -> Columns:
+        return {name: column[:] for name, column in self._columns.items()}
+
+    def timestamp(self, index: int) -> int:
+        return int(self._timestamp_us[index])
+
+    def find(self, signal: int, start: int = 0) -> int:
+        for index in range(start, len(self._signal)):
+            if self._signal[index] == signal:
+                return index
+        raise ValueError(f"no sync-port signal {signal} logged from index {start}")
+
+    @overload
+    def samples_between(
+        self,
+        samples: Columns,
+        first: int,
+        last: int,
+        timestamp_column: str = ...,
+    ) -> Columns: ...
+
+    @overload
+    def samples_between(
+        self,
+        samples: "numpy.typing.NDArray[Any]",
+        first: int,
+        last: int,
+        timestamp_column: str = ...,
+    ) -> "numpy.typing.NDArray[Any]": ...
+
+    def samples_between(
+        self,
+        samples: "Columns | numpy.typing.NDArray[Any]",
+        first: int,
+        last: int,
+        timestamp_column: str = "timestamp_us",
+    ) -> "Columns | numpy.typing.NDArray[Any]":
+        return samples_between(
+            samples,
+            start_us=self._timestamp_us[first],
+            end_us=self._timestamp_us[last],
+            timestamp_column=timestamp_column,
+        )
@@ -0,0 +1,215 @@
+import array
+import logging
+import threading
+import time
+from collections import deque
+from collections.abc import Sequence
+from dataclasses import dataclass
+from types import TracebackType
+from typing import TYPE_CHECKING, Any
+
+from tobii_stream_engine.errors import TobiiError
+
+if TYPE_CHECKING:
+    import numpy
+    import numpy.typing
+
+    from tobii_stream_engine.api import Api
+    from tobii_stream_engine.device import Device
+
+logger = logging.getLogger(__name__)
+
+
+def host_clock_us() -> int:
+    return time.monotonic_ns() // 1000
+
+
+@dataclass(frozen=True, slots=True)
+class ClockModel:
+    reference_us: int
+    offset_us: float
+    drift: float
+    residual_us: float
+    samples: int
+
+    @property
+    def drift_ppm(self) -> float:
+        return self.drift * 1e6
+
+    def to_host(self, timestamp_us: int) -> int:
+        delta_us = timestamp_us - self.reference_us
+        return timestamp_us + round(self.offset_us + self.drift * delta_us)
+
+    def to_host_array(
+        self, timestamps_us: "array.array[int] | numpy.typing.NDArray[Any]"
+    ) -> "numpy.typing.NDArray[numpy.int64]":
+        try:
+            import numpy  # noqa: PLC0415
+        except ImportError as error:
+            raise ImportError(
+                "array conversion requires numpy, install 'tobii-stream-engine[numpy]'"
+            ) from error
+
+        if isinstance(timestamps_us, array.array):
+            timestamps = numpy.frombuffer(timestamps_us, dtype=numpy.int64)
+        else:
+            timestamps = numpy.asarray(timestamps_us, dtype=numpy.int64)
+
+        correction = (timestamps - self.reference_us).astype(numpy.float64)
+        correction *= self.drift
+        correction += self.offset_us
+
+        return timestamps + numpy.rint(correction).astype(numpy.int64)
+
+
+def fit_clock_model(pairs: Sequence[tuple[int, int]]) -> ClockModel:
+    if not pairs:
+        raise ValueError("clock model requires at least one sample")
+
+    reference_us = pairs[0][0]
+    xs = [system_us - reference_us for system_us, _ in pairs]
+    ys = [host_us - system_us for system_us, host_us in pairs]
+
+    count = len(pairs)
+    mean_x = sum(xs) / count
+    mean_y = sum(ys) / count
+
+    variance_x = sum((x - mean_x) ** 2 for x in xs)
+    drift = 0.0
+    if variance_x > 0:
+        covariance = sum(
+            (x - mean_x) * (y - mean_y) for x, y in zip(xs, ys, strict=True)
+        )
+        drift = covariance / variance_x
+
+    offset_us = mean_y - drift * mean_x
+    squared_error = sum(
+        (y - offset_us - drift * x) ** 2 for x, y in zip(xs, ys, strict=True)
+    )
+    residual_us = (squared_error / count) ** 0.5
+
+    return ClockModel(
+        reference_us=reference_us,
+        offset_us=offset_us,
+        drift=drift,
+        residual_us=residual_us,
+        samples=count,
+    )
+
+
+class TimesyncScheduler:
+    def __init__(
+        self,
+        api: "Api",
+        devices: Sequence["Device"] = (),
+        interval: float = 30.0,
+        window: int = 64,
+        probes: int = 8,
+    ) -> None:
+        if window <= 0:
+            raise ValueError("window must be positive")
+        if probes <= 0:
+            raise ValueError("probes must be positive")
+
+        self._api = api
+        self._devices = list(devices)
+        self._interval = interval
+        self._probes = probes
+
+        self._pairs: deque[tuple[int, int]] = deque(maxlen=window)
+        self._model: ClockModel | None = None
+        self._failed_updates = 0
+
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def model(self) -> ClockModel | None:
+        return self._model
+
+    @property
+    def failed_updates(self) -> int:
+        return self._failed_updates
+
+    def _sample(self) -> tuple[int, int]:
+        # keep the probe with the shortest round-trip, it bounds the read error
+        best_round_trip_us = None
+        best_pair = (0, 0)
+
+        for _ in range(self._probes):
+            before_us = host_clock_us()
+            system_us = self._api.get_system_clock()
+            after_us = host_clock_us()
+
+            round_trip_us = after_us - before_us
+            if best_round_trip_us is None or round_trip_us < best_round_trip_us:
+                best_round_trip_us = round_trip_us
+                best_pair = (system_us, (before_us + after_us) // 2)
+
+        return best_pair
+
+    def update(self) -> ClockModel:
+        for device in self._devices:
+            try:
+                device.update_timesync()
+            except TobiiError as error:
+                self._failed_updates += 1
+                logger.warning(f"{device._url}: updating timesync failed: {error}")
+
+        self._pairs.append(self._sample())
+        model = fit_clock_model(self._pairs)
+        self._model = model
+
+        logger.debug(
+            f"clock model offset {model.offset_us:.1f}us "
+            f"drift {model.drift_ppm:.3f}ppm residual {model.residual_us:.1f}us"
+        )
+
+        return model
+
+    def _run(self) -> None:
+        while not self._stop_event.wait(self._interval):
+            try:
+                self.update()
+            except Exception:
+                # keep the last model, the next interval may succeed again
+                self._failed_updates += 1
+                logger.exception("updating clock model failed")
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+
+        logger.debug(f"starting timesync every {self._interval}s")
+
+        self.update()
+
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run,
+            name="tobii-timesync",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        if self._thread is None:
+            return
+
+        self._stop_event.set()
+        self._thread.join()
+        self._thread = None
+
+        logger.debug("stopped timesync")
+
+    def __enter__(self) -> "TimesyncScheduler":
+        self.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.stop()